@@ -0,0 +1,52 @@
+"""조건부 요청(ETag / If-None-Match) 처리.
+
+목록 엔드포인트는 행을 읽기 전에 가벼운 데이터 버전(행 수, 최대 updated_at
+등)으로 강한 ETag 를 만들고, 클라이언트가 같은 ETag 를 보내면 본문 없이
+304 를 반환한다. 같은 버전과 같은 질의 파라미터는 항상 같은 바이트의
+응답을 만들어야 하므로 목록은 정렬 순서를 고정한다.
+"""
+
+import hashlib
+import os
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+# 0 이면 매 요청 재검증 (no-cache 와 동일하게 동작)
+CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", "0"))
+
+
+def make_etag(*parts: Any) -> str:
+    """버전 구성 요소로 강한 ETag 생성."""
+    digest = hashlib.blake2b(
+        "\x1f".join(map(str, parts)).encode(), digest_size=16
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def cache_control(max_age: Optional[int] = None) -> str:
+    return f"public, max-age={CACHE_MAX_AGE if max_age is None else max_age}, must-revalidate"
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 가 etag 와 일치하는지 (RFC 9110 약한 비교)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def not_modified(request: Request, response: Response, etag: str,
+                 max_age: Optional[int] = None) -> Optional[Response]:
+    """
+    캐시 헤더를 설정하고, 클라이언트 사본이 최신이면 304 응답 반환.
+
+    None 이면 호출자가 평소대로 본문을 만들어 반환한다.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control(max_age)}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,54 @@
+"""대용량 목록 응답용 빠른 JSON 직렬화.
+
+FAST_JSON_RESPONSES=true 이면 목록 엔드포인트가 행마다 Pydantic 모델을
+만들고 FastAPI 의 범용 인코더를 거치는 대신, DB 에서 읽은 튜플로 dict 를
+만들어 바로 바이트로 직렬화한다. orjson 이 설치되어 있으면 사용하고,
+없으면 Pydantic(pydantic-core) 의 dump_json 을 사용한다. 응답 모델 선언은
+그대로이므로 OpenAPI 스키마는 바뀌지 않는다.
+"""
+
+import os
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "false").lower() == "true"
+
+_any = TypeAdapter(Any)
+
+
+def enabled() -> bool:
+    return FAST_JSON_RESPONSES
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 기본 타입으로만 이루어진 content 를 UTF-8 바이트로 직렬화."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return _any.dump_json(content)
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def fast_response(content: Any, response: Optional[Response] = None) -> FastJSONResponse:
+    """
+    직렬화된 응답 생성. response 에 설정된 헤더(ETag 등)를 옮겨 담는다.
+
+    엔드포인트가 Response 를 직접 반환하면 FastAPI 가 주입한 response 의
+    헤더를 합치지 않으므로 여기서 복사한다.
+    """
+    headers = None
+    if response is not None:
+        headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+    return FastJSONResponse(content, headers=headers)
@@ -0,0 +1,253 @@
+"""백그라운드 수집 작업 관리 API 와 작업 정의.
+
+요청 경로는 DB 와 인메모리 인덱스만 읽고, GBIS 호출과 DB 쓰기는 여기서
+등록하는 스케줄러 작업이 담당한다.
+
+- stops: 수집 영역별 정류소 upsert 후 공간 인덱스 갱신
+- routes: 저장된 정류소의 경유 노선을 찾아 노선/경유 정류소 저장, 노선 그래프 갱신
+- ridership: 이용자 수 수집 후 롤업 갱신 (INGEST_JOBS 에 추가해야 실행)
+- sync-indexes: 다른 워커가 수집한 결과를 이 워커의 인덱스에 반영 (워커마다 실행)
+"""
+
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException
+from sqlalchemy import func, select
+
+from app.api import real_statistics, statistics
+from app.database.config import AsyncSessionLocal
+from app.database.models import BusRoute, BusStop, IngestionState
+from app.database.upsert import bulk_upsert_stops, upsert_route
+from app.services import rollups
+from app.services.scheduler import IngestionScheduler, JobContext
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/real/ingestion", tags=["ingestion"])
+
+Area = Tuple[float, float, float, float]
+
+DEFAULT_AREAS = "37.3940,37.4050,127.1050,127.1200"
+RIDERSHIP_BATCH_SIZE = 50
+# 노선 수집 1단계(정류소별 노선 ID 탐색) 체크포인트 간격: N 개 정류소 또는 N 초마다
+ROUTE_DISCOVERY_CHECKPOINT_STOPS = int(os.getenv("INGEST_ROUTES_CHECKPOINT_STOPS", "200"))
+ROUTE_DISCOVERY_CHECKPOINT_SECONDS = float(os.getenv("INGEST_ROUTES_CHECKPOINT_SECONDS", "10"))
+
+
+def _parse_areas(value: str) -> List[Area]:
+    """"lat_min,lat_max,lon_min,lon_max;..." 형식의 수집 영역 목록."""
+    areas = []
+    for chunk in value.split(";"):
+        if chunk.strip():
+            lat_min, lat_max, lon_min, lon_max = (float(v) for v in chunk.split(","))
+            areas.append((lat_min, lat_max, lon_min, lon_max))
+    return areas
+
+
+INGEST_AREAS = _parse_areas(os.getenv("INGEST_AREAS", DEFAULT_AREAS))
+INGEST_ROUTE_IDS = [r.strip() for r in os.getenv("INGEST_ROUTE_IDS", "").split(",") if r.strip()]
+
+
+async def ingest_stops(ctx: JobContext) -> int:
+    """수집 영역별 정류소 upsert. 영역 하나를 끝낼 때마다 체크포인트 저장."""
+    position = ctx.checkpoint.get("position", 0)
+    changed = ctx.checkpoint.get("changed", 0)
+    for index in range(position, len(INGEST_AREAS)):
+        stops = await real_statistics.api_client.get_stops_in_area(*INGEST_AREAS[index])
+        if stops:
+            async with ctx.session() as db:
+                counts = await db.run_sync(bulk_upsert_stops, stops)
+                await db.commit()
+            changed += counts["inserted"] + counts["updated"]
+        await ctx.save(position=index + 1, changed=changed)
+
+    async with ctx.session() as db:
+        await real_statistics.refresh_stop_index(db)
+        await real_statistics.refresh_catalog(db)
+    return changed
+
+
+async def ingest_routes(ctx: JobContext) -> int:
+    """
+    저장된 정류소를 지나는 노선 수집.
+
+    1단계에서 정류소 상세 정보로 노선 ID 를 모으고(INGEST_ROUTE_IDS 와 이미
+    저장된 노선 포함), 2단계에서 노선별 경유 정류소를 저장한다. 경유 정류소가
+    바뀐 노선만 그래프에 반영한다.
+
+    1단계는 정류소마다 DB 에 쓰지 않고, 중복 제거한 노선 ID 를
+    ROUTE_DISCOVERY_CHECKPOINT_STOPS 개 정류소 또는
+    ROUTE_DISCOVERY_CHECKPOINT_SECONDS 초마다 체크포인트로 저장한다.
+    """
+    checkpoint = ctx.checkpoint
+    if "route_ids" not in checkpoint:
+        async with ctx.session() as db:
+            station_ids = list((await db.execute(
+                select(BusStop.station_id).order_by(BusStop.station_id)
+            )).scalars())
+            known = list((await db.execute(select(BusRoute.route_id))).scalars())
+        # 삽입 순서를 유지하는 중복 제거 집합
+        discovered: Dict[str, None] = dict.fromkeys(checkpoint.get("discovered", []))
+        start = checkpoint.get("stop_position", 0)
+        saved_at = time.monotonic()
+        for index in range(start, len(station_ids)):
+            info = await real_statistics.api_client.get_stop_info(station_ids[index])
+            for route in info.get("routes", []):
+                if route.get("routeId"):
+                    discovered.setdefault(route["routeId"], None)
+            done = index + 1
+            if ((done - start) % ROUTE_DISCOVERY_CHECKPOINT_STOPS == 0
+                    or time.monotonic() - saved_at >= ROUTE_DISCOVERY_CHECKPOINT_SECONDS):
+                await ctx.save(stop_position=done, discovered=list(discovered))
+                saved_at = time.monotonic()
+        route_ids = list(dict.fromkeys(
+            route_id for route_id in (*INGEST_ROUTE_IDS, *known, *discovered) if route_id
+        ))
+        checkpoint.pop("discovered", None)
+        checkpoint.pop("stop_position", None)
+        await ctx.save(route_ids=route_ids, route_position=0, changed=0)
+
+    route_ids = checkpoint["route_ids"]
+    changed = checkpoint.get("changed", 0)
+    for index in range(checkpoint.get("route_position", 0), len(route_ids)):
+        route_info = await real_statistics.api_client.get_route_info(route_ids[index])
+        # 결과 없음/빈 파싱 결과는 노선 ID 가 비어 있으므로 저장하지 않음
+        if route_info.get("routeId"):
+            async with ctx.session() as db:
+                updated = await db.run_sync(upsert_route, route_info)
+                await db.commit()
+            if updated:
+                real_statistics.route_graph.update_route(
+                    route_info["routeId"], route_info.get("routeName", ""),
+                    [(s["stationId"], s.get("stationName", ""))
+                     for s in sorted(route_info.get("stations", []), key=lambda s: s["sequence"])],
+                )
+                changed += 1
+        await ctx.save(route_position=index + 1, changed=changed)
+
+    async with ctx.session() as db:
+        await real_statistics.refresh_catalog(db)
+    return changed
+
+
+async def ingest_ridership(ctx: JobContext) -> int:
+    """저장된 정류소의 이용자 수를 배치 단위로 수집해 (정류소, 날짜) 버킷 교체."""
+    async with ctx.session() as db:
+        station_ids = list((await db.execute(
+            select(BusStop.station_id).order_by(BusStop.station_id)
+        )).scalars())
+    position = ctx.checkpoint.get("position", 0)
+    changed = ctx.checkpoint.get("changed", 0)
+    for start in range(position, len(station_ids), RIDERSHIP_BATCH_SIZE):
+        batch = station_ids[start:start + RIDERSHIP_BATCH_SIZE]
+        ridership_by_stop = await statistics.api_client.get_stops_ridership(batch)
+        rows = [
+            {
+                "station_id": station_id,
+                "date": day["date"],
+                "hour": day.get("peak_hour"),
+                "passenger_count": day["passenger_count"],
+            }
+            for station_id, ridership in ridership_by_stop.items()
+            for day in ridership.get("week_data", [])
+        ]
+        if rows:
+            async with ctx.session() as db:
+                changed += await db.run_sync(rollups.replace_ridership, rows)
+                await db.commit()
+        await ctx.save(position=start + len(batch), changed=changed)
+    return changed
+
+
+_synced: Dict[str, Optional[datetime]] = {}
+
+
+async def sync_indexes(ctx: JobContext) -> int:
+    """
+    다른 워커가 정류소/노선 수집을 마쳤으면 이 워커의 인덱스와 카탈로그 재생성.
+
+    ingestion_state 의 last_finished_at 이 마지막으로 본 값과 다를 때만 다시 읽는다.
+    워커마다 실행되므로 GBIS 응답 원문 캐시 정리도 여기서 수행한다.
+    """
+    await real_statistics.api_client.purge_cache()
+    async with ctx.session() as db:
+        finished = dict((await db.execute(
+            select(IngestionState.name, IngestionState.last_finished_at)
+            .where(IngestionState.name.in_(["stops", "routes"]))
+        )).all())
+        reloaded = 0
+        stops_changed = finished.get("stops") != _synced.get("stops")
+        routes_changed = finished.get("routes") != _synced.get("routes")
+        if stops_changed:
+            await real_statistics.refresh_stop_index(db)
+            _synced["stops"] = finished.get("stops")
+            reloaded += 1
+        if routes_changed:
+            await real_statistics.refresh_route_graph(db)
+            _synced["routes"] = finished.get("routes")
+            reloaded += 1
+        if stops_changed or routes_changed:
+            await real_statistics.refresh_catalog(db)
+    return reloaded
+
+
+JOBS = {
+    "stops": ingest_stops,
+    "routes": ingest_routes,
+    "ridership": ingest_ridership,
+}
+
+
+def _enabled_jobs(value: str) -> List[str]:
+    """INGEST_JOBS 의 작업 이름 목록. 알 수 없는 이름은 경고 후 건너뛴다."""
+    names = []
+    for name in (n.strip() for n in value.split(",")):
+        if not name:
+            continue
+        if name not in JOBS:
+            logger.warning(
+                f"INGEST_JOBS 의 알 수 없는 작업 무시: {name} (가능한 값: {', '.join(JOBS)})"
+            )
+            continue
+        names.append(name)
+    return names
+
+
+scheduler = IngestionScheduler(AsyncSessionLocal)
+for _name in _enabled_jobs(os.getenv("INGEST_JOBS", "stops,routes")):
+    scheduler.register(_name, JOBS[_name])
+scheduler.register("sync-indexes", sync_indexes,
+                   interval=float(os.getenv("SCHEDULER_SYNC_INTERVAL", "30")), exclusive=False)
+
+
+@router.get("/status", summary="수집 작업 상태")
+async def get_ingestion_status():
+    """
+    수집 작업별 마지막 실행 결과, 임대 보유 워커, 체크포인트, 다음 실행까지 남은 시간 조회.
+    """
+    status = await scheduler.status()
+    async with scheduler.sessions() as db:
+        status["stored"] = {
+            "stops": (await db.execute(select(func.count()).select_from(BusStop))).scalar(),
+            "routes": (await db.execute(select(func.count()).select_from(BusRoute))).scalar(),
+        }
+    return status
+
+
+@router.post("/{job}/run", status_code=202, summary="수집 작업 즉시 실행")
+async def run_ingestion_job(job: str):
+    """
+    수집 작업을 백그라운드에서 즉시 실행.
+
+    - 다른 워커가 같은 작업을 실행 중이면 임대를 얻지 못해 실행되지 않습니다
+    - 결과는 GET /api/real/ingestion/status 로 확인하세요
+    """
+    try:
+        started = scheduler.trigger(job)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"등록되지 않은 수집 작업입니다: {job}")
+    return {"job": job, "started": started}
@@ -0,0 +1,88 @@
+"""/metrics 엔드포인트와 요청 지연 시간 측정 미들웨어."""
+
+import time
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.api import ingestion, real_statistics
+from app.services import metrics
+
+router = APIRouter(tags=["metrics"])
+
+
+class MetricsMiddleware:
+    """
+    라우트 템플릿별 요청 처리 시간과 처리 중 요청 수 기록 (순수 ASGI 미들웨어).
+
+    라우팅 후 scope["route"] 가 채워지므로 응답이 끝난 뒤 템플릿을 읽는다.
+    라우트가 없는 요청(404)은 unmatched 로 모아 레이블 수가 늘지 않게 한다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        token = metrics.current_context.set(scope)
+        metrics.HTTP_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.HTTP_IN_FLIGHT.dec()
+            route = scope.get("route")
+            metrics.HTTP_REQUEST_SECONDS.labels(
+                scope["method"], getattr(route, "path", "unmatched"), status
+            ).observe(time.perf_counter() - start)
+            metrics.current_context.reset(token)
+
+
+def _collect_caches():
+    """GBIS 상세 조회 캐시의 적중/미스와 적중률."""
+    stats = real_statistics.api_client.cache_stats()
+    caches = [(name, stats[name]) for name in ("stop_info", "route_info")]
+    yield ("gbis_cache_hits", "counter", "GBIS 상세 조회 캐시 적중 수",
+           [({"cache": name}, s["hits"]) for name, s in caches])
+    yield ("gbis_cache_misses", "counter", "GBIS 상세 조회 캐시 미스 수",
+           [({"cache": name}, s["misses"]) for name, s in caches])
+    yield ("gbis_cache_hit_ratio", "gauge", "GBIS 상세 조회 캐시 적중률",
+           [({"cache": name}, s["hit_ratio"]) for name, s in caches])
+    yield ("gbis_cache_inflight", "gauge", "같은 키로 진행 중인 캐시 적재 수",
+           [({"cache": name}, s["inflight"]) for name, s in caches])
+
+
+def _collect_circuits():
+    yield ("gbis_circuit_open", "gauge", "GBIS 엔드포인트 서킷 브레이커 열림 여부",
+           [({"endpoint": endpoint}, float(breaker.state != "closed"))
+            for endpoint, breaker in real_statistics.api_client.breakers.items()])
+
+
+def _collect_jobs():
+    running = ingestion.scheduler._running
+    yield ("ingestion_jobs_running", "gauge", "이 워커에서 실행 중인 수집 작업",
+           [({"job": name}, float(name in running)) for name in ingestion.scheduler.jobs])
+
+
+metrics.REGISTRY.add_collector(_collect_caches)
+metrics.REGISTRY.add_collector(_collect_circuits)
+metrics.REGISTRY.add_collector(_collect_jobs)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics():
+    """Prometheus 텍스트 형식 메트릭."""
+    return PlainTextResponse(
+        metrics.REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
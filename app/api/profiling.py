@@ -0,0 +1,72 @@
+"""요청 프로파일링 미들웨어 (PROFILE_ENABLED=true 일 때만 등록).
+
+PROFILE_SAMPLE_RATE 비율의 요청, 또는 PROFILE_HEADER 헤더 값이
+PROFILE_TOKEN 과 같은 요청을 샘플링 프로파일러로 기록해 PROFILE_DIR 에
+저장한다. 비활성화 시 미들웨어 자체를 등록하지 않으므로 요청 경로에
+추가 비용이 없다.
+"""
+
+import asyncio
+import hmac
+import logging
+import os
+import random
+
+from app.services.profiler import SamplingProfiler, write_profile
+
+logger = logging.getLogger(__name__)
+
+PROFILE_ENABLED = os.getenv("PROFILE_ENABLED", "false").lower() == "true"
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_HEADER = os.getenv("PROFILE_HEADER", "X-Profile").lower().encode("latin-1")
+# 비어 있으면 헤더로는 프로파일링할 수 없음
+PROFILE_TOKEN = os.getenv("PROFILE_TOKEN", "")
+PROFILE_DIR = os.getenv("PROFILE_DIR", "./profiles")
+PROFILE_FORMAT = os.getenv("PROFILE_FORMAT", "collapsed").lower()  # collapsed | speedscope
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "1"))
+
+
+class ProfilingMiddleware:
+    """샘플링된 요청의 스택을 기록해 라우트/처리 시간 태그와 함께 파일로 저장."""
+
+    def __init__(self, app, sample_rate: float = None, token: str = None,
+                 directory: str = None, fmt: str = None, interval_ms: float = None):
+        self.app = app
+        self.sample_rate = PROFILE_SAMPLE_RATE if sample_rate is None else sample_rate
+        self.token = (PROFILE_TOKEN if token is None else token).encode("latin-1")
+        self.directory = directory or PROFILE_DIR
+        self.format = fmt or PROFILE_FORMAT
+        self.interval = (interval_ms or PROFILE_INTERVAL_MS) / 1000
+        self.profiler = SamplingProfiler(self.interval)
+
+    def _should_profile(self, scope) -> bool:
+        if self.token:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER and hmac.compare_digest(value, self.token):
+                    return True
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        coro = self.app(scope, receive, send)
+        session = self.profiler.begin(coro)
+        try:
+            await coro
+        finally:
+            self.profiler.end(session)
+            route = getattr(scope.get("route"), "path", scope["path"])
+            try:
+                path = await asyncio.to_thread(
+                    write_profile, session, scope["method"], route,
+                    self.directory, self.format,
+                )
+                breakdown = ", ".join(
+                    f"{kind} {weight / 1000:.1f} ms" for kind, weight in session.kinds.items()
+                )
+                logger.info(f"프로파일 저장: {path} ({session.duration * 1000:.1f} ms: {breakdown})")
+            except Exception as e:
+                # 진단 기능이므로 저장 실패가 요청을 실패시키지 않게 한다
+                logger.warning(f"프로파일 저장 실패: {e!r}")
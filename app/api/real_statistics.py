@@ -1,88 +1,134 @@
 """실제 API 데이터를 사용하는 통계 분석 API."""
 
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from typing import List, Optional
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api import fast_json
+from app.api.conditional import make_etag, not_modified
 from app.services.real_api_client import RealBusAPIClient
-from app.database.models import BusStop, BusRoute, RidershipData
-from app.database.config import get_db
-from app.models.ridership import StopInfo, WeeklyRidership, DailyRidership
-from datetime import datetime, timedelta
+from app.services.resilience import UpstreamUnavailableError
+from app.services import catalog as catalog_module
+from app.services.route_graph import RouteGraph
+from app.services.spatial import StopIndex
+from app.database.models import BusStop, BusRoute, IngestionState, RouteStation
+from app.database.config import get_async_db
+from app.models.ridership import NearbyStop, StopInfo
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/real", tags=["real-statistics"])
 api_client = RealBusAPIClient()
+stop_index = StopIndex()
+route_graph = RouteGraph()
+# 레거시 /routes, /stops 카탈로그 (CATALOG_SOURCE=db 이면 저장된 노선/정류소로 채움)
+catalog = catalog_module.initial_catalog()
 
+NOT_INGESTED_DETAIL = (
+    "저장된 정류소 정보가 없습니다. 수집 스케줄러 실행을 기다리거나 "
+    "POST /api/real/ingestion/stops/run 으로 수집을 시작하세요."
+)
 
-@router.get("/fetch-stops", summary="판교동 정류소 데이터 수집")
-async def fetch_pangyeo_stops(db: Session = Depends(get_db)):
+
+async def refresh_stop_index(db: AsyncSession) -> int:
+    """DB 에 저장된 정류소로 공간 인덱스 재생성."""
+    result = await db.execute(
+        select(BusStop.station_id, BusStop.station_name, BusStop.latitude, BusStop.longitude)
+    )
+    return stop_index.load(
+        {"stop_id": station_id, "stop_name": name, "latitude": lat, "longitude": lon}
+        for station_id, name, lat, lon in result
+    )
+
+
+async def refresh_route_graph(db: AsyncSession) -> int:
+    """DB 에 저장된 노선 경유 정류소로 노선 그래프 전체 재생성."""
+    result = await db.execute(
+        select(RouteStation.route_id, BusRoute.route_name,
+               RouteStation.station_id, RouteStation.station_name)
+        .outerjoin(BusRoute, BusRoute.route_id == RouteStation.route_id)
+        .order_by(RouteStation.route_id, RouteStation.sequence)
+    )
+    routes: dict = {}
+    for route_id, route_name, station_id, station_name in result:
+        routes.setdefault(route_id, (route_name or route_id, []))[1].append(
+            (station_id, station_name)
+        )
+    return route_graph.load(
+        (route_id, route_name, stations) for route_id, (route_name, stations) in routes.items()
+    )
+
+
+STOP_COLUMNS = (BusStop.station_id, BusStop.station_name, BusStop.latitude, BusStop.longitude)
+
+
+def _stop_list(rows) -> list:
+    """(station_id, station_name, latitude, longitude) 행을 StopInfo 목록으로 변환.
+
+    빠른 JSON 모드에서는 모델 생성 없이 같은 필드의 dict 를 만든다.
+    """
+    if fast_json.enabled():
+        return [
+            {"stop_id": station_id, "stop_name": name, "latitude": lat, "longitude": lon}
+            for station_id, name, lat, lon in rows
+        ]
+    return [
+        StopInfo(stop_id=station_id, stop_name=name, latitude=lat, longitude=lon)
+        for station_id, name, lat, lon in rows
+    ]
+
+
+async def refresh_catalog(db: AsyncSession) -> int:
+    """CATALOG_SOURCE=db 이면 저장된 노선/정류소로 카탈로그 교체. 노선 수 반환."""
+    if catalog_module.CATALOG_SOURCE != "db":
+        return len(catalog.snapshot.routes)
+    snapshot = await db.run_sync(catalog.load_db)
+    return len(snapshot.routes)
+
+
+def _require_stop_index() -> None:
+    if not len(stop_index):
+        raise HTTPException(status_code=404, detail=NOT_INGESTED_DETAIL)
+
+
+@router.get("/fetch-stops", summary="판교동 정류소 수집 현황")
+async def fetch_pangyeo_stops(db: AsyncSession = Depends(get_async_db)):
     """
-    경기도공공데이터 포털에서 판교동 정류소 정보를 조회하고 DB에 저장.
+    DB에 수집된 판교동 정류소 목록과 정류소 수집 작업 상태 조회.
     
     - 좌표 범위: 37.3940~37.4050, 127.1050~127.1200
-    - 결과를 데이터베이스에 저장
+    - 정류소 수집은 백그라운드 스케줄러가 주기적으로 수행하며, 이 엔드포인트는 DB만 읽습니다
+    - 즉시 수집하려면 POST /api/real/ingestion/stops/run 을 호출하세요
     """
-    try:
-        stops = await api_client.get_stops_in_area(
-            lat_min=37.3940,
-            lat_max=37.4050,
-            lon_min=127.1050,
-            lon_max=127.1200
+    result = await db.execute(
+        select(*STOP_COLUMNS)
+        .where(BusStop.latitude.between(37.3940, 37.4050),
+               BusStop.longitude.between(127.1050, 127.1200))
+        .order_by(BusStop.station_id)
+    )
+    stops = result.all()
+    
+    if not stops:
+        raise HTTPException(
+            status_code=404,
+            detail=NOT_INGESTED_DETAIL
         )
-        
-        if not stops:
-            raise HTTPException(
-                status_code=404,
-                detail="정류소 정보를 조회할 수 없습니다. API 키를 확인하세요."
-            )
-        
-        # 데이터베이스에 저장
-        saved_count = 0
-        for stop in stops:
-            existing = db.query(BusStop).filter(
-                BusStop.station_id == stop["stationId"]
-            ).first()
-            
-            if existing:
-                existing.station_name = stop["stationName"]
-                existing.latitude = stop["latitude"]
-                existing.longitude = stop["longitude"]
-                existing.bus_route_count = stop.get("busRouteCount", 0)
-                existing.updated_at = datetime.utcnow()
-            else:
-                new_stop = BusStop(
-                    station_id=stop["stationId"],
-                    station_name=stop["stationName"],
-                    latitude=stop["latitude"],
-                    longitude=stop["longitude"],
-                    bus_route_count=stop.get("busRouteCount", 0)
-                )
-                db.add(new_stop)
-            
-            saved_count += 1
-        
-        db.commit()
-        
-        return {
-            "message": "정류소 데이터 수집 완료",
-            "total_stops": len(stops),
-            "saved_stops": saved_count,
-            "stops": [
-                StopInfo(
-                    stop_id=stop["stationId"],
-                    stop_name=stop["stationName"],
-                    latitude=stop["latitude"],
-                    longitude=stop["longitude"]
-                )
-                for stop in stops
-            ]
-        }
-        
-    except Exception as e:
-        logger.error(f"정류소 데이터 수집 오류: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    
+    state = await db.get(IngestionState, "stops")
+    content = {
+        "message": "정류소 데이터 조회 완료",
+        "total_stops": len(stops),
+        "ingestion": {
+            "status": state.status if state else None,
+            "last_finished_at": state.last_finished_at if state else None,
+            "items_changed": state.items_changed if state else 0,
+        },
+        "stops": _stop_list(stops)
+    }
+    if fast_json.enabled():
+        return fast_json.fast_response(content)
+    return content
 
 
 @router.get("/stops/{stop_id}/info", summary="정류소 상세 정보 조회")
@@ -103,6 +149,14 @@ async def get_stop_detail(stop_id: str):
         
         return stop_info
         
+    except HTTPException:
+        raise
+    except UpstreamUnavailableError as e:
+        logger.warning(f"정류소 상세 정보 조회 오류: {str(e)}")
+        raise HTTPException(
+            status_code=503,
+            detail="경기버스정보 API에 일시적으로 접근할 수 없습니다. 잠시 후 다시 시도하세요."
+        )
     except Exception as e:
         logger.error(f"정류소 상세 정보 조회 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -114,6 +168,7 @@ async def get_route_detail(route_id: str):
     특정 노선의 상세 정보를 API에서 조회.
     
     - 노선명, 운행 구간, 경유 정류소 정보 포함
+    - 경유 정류소 순서 저장은 노선 수집 작업(routes)이 담당
     """
     try:
         route_info = await api_client.get_route_info(route_id)
@@ -126,32 +181,154 @@ async def get_route_detail(route_id: str):
         
         return route_info
         
+    except HTTPException:
+        raise
+    except UpstreamUnavailableError as e:
+        logger.warning(f"노선 상세 정보 조회 오류: {str(e)}")
+        raise HTTPException(
+            status_code=503,
+            detail="경기버스정보 API에 일시적으로 접근할 수 없습니다. 잠시 후 다시 시도하세요."
+        )
     except Exception as e:
         logger.error(f"노선 상세 정보 조회 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/diagnostics", summary="업스트림 연동 상태 진단")
+async def get_diagnostics():
+    """
+    경기버스정보 API 연동 상태 조회.
+    
+    - 재시도 횟수, 캐시 대체 응답 수
+    - 엔드포인트별 서킷 브레이커 상태 및 상태 전이 횟수
+    - 엔드포인트별 토큰 버킷 잔량과 남은 일일 할당량 추정
+    """
+    return {
+        **api_client.resilience_stats(),
+        "rate_limit": api_client.rate_limiter.stats(),
+    }
+
+
+@router.get("/cache/stats", summary="업스트림 응답 캐시 통계")
+async def get_cache_stats():
+    """
+    정류소/노선 상세 조회 캐시의 적중, 미스, 제거 카운터 조회.
+    """
+    return api_client.cache_stats()
+
+
 @router.get("/stops", response_model=List[StopInfo], summary="DB에 저장된 정류소 목록")
-async def get_saved_stops(db: Session = Depends(get_db)):
+async def get_saved_stops(request: Request, response: Response,
+                          db: AsyncSession = Depends(get_async_db)):
     """
-    데이터베이스에 저장된 판교동 정류소 목록 조회.
+    데이터베이스에 저장된 판교동 정류소 목록 조회 (정류소 ID 순).
     
-    /fetch-stops 엔드포인트로 먼저 데이터를 수집해야 합니다.
+    수집 스케줄러가 저장한 데이터를 조회합니다.
+    정류소 수와 최종 변경 시각으로 만든 ETag 를 If-None-Match 로 보내면
+    데이터가 바뀌지 않은 경우 행을 읽지 않고 304 를 반환합니다.
     """
-    stops = db.query(BusStop).all()
+    count, last_updated = (await db.execute(
+        select(func.count(), func.max(BusStop.updated_at))
+    )).one()
     
-    if not stops:
+    if not count:
         raise HTTPException(
             status_code=404,
-            detail="저장된 정류소 정보가 없습니다. /fetch-stops 엔드포인트를 먼저 호출하세요."
+            detail=NOT_INGESTED_DETAIL
         )
     
-    return [
-        StopInfo(
-            stop_id=stop.station_id,
-            stop_name=stop.station_name,
-            latitude=stop.latitude,
-            longitude=stop.longitude
-        )
-        for stop in stops
-    ]
+    cached = not_modified(request, response, make_etag("real-stops", count, last_updated))
+    if cached is not None:
+        return cached
+    
+    result = await db.execute(select(*STOP_COLUMNS).order_by(BusStop.station_id))
+    stops = _stop_list(result.all())
+    
+    if fast_json.enabled():
+        return fast_json.fast_response(stops, response)
+    return stops
+
+
+@router.get("/stops/nearest", response_model=List[NearbyStop], summary="가장 가까운 정류소")
+async def get_nearest_stops(
+    lat: float = Query(..., ge=-90, le=90, description="기준 위도"),
+    lon: float = Query(..., ge=-180, le=180, description="기준 경도"),
+    limit: int = Query(5, ge=1, le=100, description="조회할 정류소 개수"),
+    max_distance_m: Optional[float] = Query(None, gt=0, description="최대 거리(미터)"),
+):
+    """
+    기준 좌표에서 가장 가까운 정류소 목록 (거리순).
+    
+    저장된 정류소의 인메모리 공간 인덱스를 사용하며 GBIS 를 호출하지 않습니다.
+    """
+    _require_stop_index()
+    return stop_index.nearest(lat, lon, limit, max_distance_m)
+
+
+@router.get("/stops/within", response_model=List[NearbyStop], summary="반경 내 정류소")
+async def get_stops_within(
+    lat: float = Query(..., ge=-90, le=90, description="기준 위도"),
+    lon: float = Query(..., ge=-180, le=180, description="기준 경도"),
+    radius_m: float = Query(300, gt=0, le=5000, description="반경(미터)"),
+    limit: Optional[int] = Query(None, ge=1, description="최대 개수"),
+):
+    """
+    기준 좌표에서 radius_m 이내 정류소 목록 (거리순).
+    """
+    _require_stop_index()
+    return stop_index.within(lat, lon, radius_m, limit)
+
+
+@router.get("/stops/bbox", response_model=List[StopInfo], summary="영역 내 정류소")
+async def get_stops_in_bbox(
+    lat_min: float = Query(..., ge=-90, le=90),
+    lat_max: float = Query(..., ge=-90, le=90),
+    lon_min: float = Query(..., ge=-180, le=180),
+    lon_max: float = Query(..., ge=-180, le=180),
+):
+    """
+    위경도 사각형 영역 안의 정류소 목록.
+    """
+    if lat_min > lat_max or lon_min > lon_max:
+        raise HTTPException(status_code=422, detail="최솟값이 최댓값보다 클 수 없습니다")
+    _require_stop_index()
+    return stop_index.bbox(lat_min, lat_max, lon_min, lon_max)
+
+
+@router.get("/trips", summary="환승 경로 탐색")
+async def plan_trip(
+    origin: str = Query(..., description="출발 정류소 ID"),
+    destination: str = Query(..., description="도착 정류소 ID"),
+    max_transfers: int = Query(2, ge=0, le=4, description="최대 환승 횟수"),
+):
+    """
+    저장된 노선 경유 정류소 그래프에서 출발 → 도착 경로 탐색.
+    
+    - 환승 수가 가장 적은 경로부터, 환승이 늘어날 때 이동 정류소 수가 줄어드는 경로만 반환
+    - 노선 수집 작업(routes)이 저장한 노선만 그래프에 포함됩니다
+    """
+    if origin == destination:
+        raise HTTPException(status_code=422, detail="출발과 도착 정류소가 같습니다")
+    for station_id in (origin, destination):
+        if station_id not in route_graph:
+            raise HTTPException(
+                status_code=404,
+                detail=f"노선 그래프에 없는 정류소입니다: {station_id}"
+            )
+    
+    itineraries = route_graph.plan(origin, destination, max_transfers)
+    return {
+        "origin": origin,
+        "destination": destination,
+        "max_transfers": max_transfers,
+        "itineraries": itineraries,
+        "count": len(itineraries),
+    }
+
+
+@router.get("/graph/stats", summary="노선 그래프 통계")
+async def get_graph_stats():
+    """
+    노선 그래프의 노선/정류소/구간 수와 버전 조회.
+    """
+    return route_graph.stats()
@@ -1,7 +1,13 @@
 """통계 분석 API 엔드포인트."""
 
-from fastapi import APIRouter, HTTPException
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api import fast_json
+from app.api.conditional import make_etag, not_modified
+from app.database.config import get_async_db
+from app.services import rollups
+from app.services.aggregation import RidershipCube
 from app.services.api_client import BusAPIClient
 from app.models.ridership import WeeklyRidership, StopInfo, DailyRidership
 
@@ -41,7 +47,8 @@ async def get_pangyeo_stops():
 
 
 @router.get("/weekly/{stop_id}", response_model=WeeklyRidership, summary="정류소 주간 이용자 통계")
-async def get_weekly_ridership(stop_id: str):
+async def get_weekly_ridership(stop_id: str, request: Request, response: Response,
+                               db: AsyncSession = Depends(get_async_db)):
     """
     특정 정류소의 최근 1주일 이용자 통계 조회
     
@@ -49,7 +56,21 @@ async def get_weekly_ridership(stop_id: str):
     - 주간 총 이용자 수
     - 일평균 이용자 수
     - 피크 시간대 정보
+    
+    일간 롤업 테이블에 데이터가 있으면 사용하고, 없으면 API 클라이언트로 조회
+    
+    롤업 데이터는 ETag 를 포함하며, If-None-Match 가 일치하면 집계를 읽지 않고 304 반환
     """
+    version = await db.run_sync(rollups.station_version, stop_id)
+    if version is not None:
+        cached = not_modified(request, response, make_etag("weekly", stop_id, *version))
+        if cached is not None:
+            return cached
+        ridership = await db.run_sync(rollups.load_recent_week, stop_id)
+        return WeeklyRidership(**ridership)
+    
+    # API 클라이언트 응답은 버전이 없으므로 캐시하지 않음
+    response.headers["Cache-Control"] = "no-store"
     ridership = await api_client.get_stop_ridership(stop_id)
     
     if not ridership:
@@ -69,43 +90,44 @@ async def get_weekly_ridership(stop_id: str):
 
 
 @router.get("/top-stops", response_model=List[WeeklyRidership], summary="상위 정류소 랭킹")
-async def get_top_stops(limit: int = 5):
+async def get_top_stops(limit: int = 5, db: AsyncSession = Depends(get_async_db)):
     """
     이용자 수가 많은 상위 정류소 조회
     
     - limit: 조회할 상위 정류소 개수 (기본값: 5)
     - 각 정류소의 주간 이용자 통계 반환
+    
+    주간 롤업 테이블에 데이터가 있으면 가장 최근 주 기준으로 조회
     """
+    top_weekly = await db.run_sync(rollups.load_top_weekly, limit)
+    if top_weekly:
+        if fast_json.enabled():
+            return fast_json.fast_response(top_weekly)
+        return [WeeklyRidership(**row) for row in top_weekly]
+    
     stops = await api_client.get_stops_in_area(37.3940, 37.4050, 127.1050, 127.1200)
     
     if not stops:
         raise HTTPException(status_code=404, detail="정류소 정보를 찾을 수 없습니다")
     
-    # 각 정류소의 이용자 수 조회
-    top_stops_data = []
-    for stop in stops[:limit]:
-        ridership = await api_client.get_stop_ridership(stop["stop_id"])
-        if ridership:
-            week_data = [
-                DailyRidership(**data)
-                for data in ridership.get("week_data", [])
-            ]
-            top_stops_data.append(WeeklyRidership(
-                stop_id=stop["stop_id"],
-                stop_name=stop["stop_name"],
-                week_data=week_data,
-                total_count=ridership.get("total_count", 0),
-                average_daily=ridership.get("average_daily", 0)
-            ))
-    
-    # 총 이용자 수로 정렬
-    top_stops_data.sort(key=lambda x: x.total_count, reverse=True)
-    
-    return top_stops_data[:limit]
+    # 전체 정류소의 이용자 수를 동시에 조회해 배열로 모은 뒤 상위 limit 개 선택
+    ridership_by_stop = await api_client.get_stops_ridership(
+        [stop["stop_id"] for stop in stops]
+    )
+    names = {stop["stop_id"]: stop["stop_name"] for stop in stops}
+    cube = RidershipCube.from_daily(
+        ridership_by_stop,
+        [stop["stop_id"] for stop in stops if stop["stop_id"] in ridership_by_stop],
+    )
+    
+    return [
+        cube.weekly_ridership(s, names[cube.station_ids[s]])
+        for s in cube.top_k(limit)
+    ]
 
 
 @router.get("/summary", summary="판교동 통계 요약")
-async def get_summary():
+async def get_summary(db: AsyncSession = Depends(get_async_db)):
     """
     판교동 전체 통계 요약
     
@@ -113,32 +135,37 @@ async def get_summary():
     - 전체 주간 이용자 수
     - 가장 이용량이 많은 정류소
     - 평균 이용자 수
+    - 정류소별 일 이용자 수 백분위 (p50/p90/p99)
+    
+    주간 롤업 테이블에 데이터가 있으면 가장 최근 주 기준으로 요약
     """
+    summary = await db.run_sync(rollups.load_weekly_summary)
+    if summary:
+        return summary
+    
     stops = await api_client.get_stops_in_area(37.3940, 37.4050, 127.1050, 127.1200)
     
     if not stops:
         raise HTTPException(status_code=404, detail="정류소 정보를 찾을 수 없습니다")
     
-    total_ridership = 0
-    max_ridership = 0
-    top_stop_name = ""
-    
-    for stop in stops:
-        ridership = await api_client.get_stop_ridership(stop["stop_id"])
-        if ridership:
-            count = ridership.get("total_count", 0)
-            total_ridership += count
-            if count > max_ridership:
-                max_ridership = count
-                top_stop_name = stop["stop_name"]
-    
-    return {
-        "total_stops": len(stops),
-        "total_weekly_ridership": total_ridership,
-        "top_stop": {
-            "name": top_stop_name,
-            "weekly_count": max_ridership
-        },
-        "average_per_stop": total_ridership // len(stops) if stops else 0,
-        "period": "Last 7 days"
-    }
+    ridership_by_stop = await api_client.get_stops_ridership(
+        [stop["stop_id"] for stop in stops]
+    )
+    cube = RidershipCube.from_daily(ridership_by_stop, [stop["stop_id"] for stop in stops])
+    
+    return cube.summary({stop["stop_id"]: stop["stop_name"] for stop in stops}, "Last 7 days")
+
+
+@router.get("/hourly/{stop_id}", summary="정류소 시간대별 이용 프로필")
+async def get_hourly_profile(stop_id: str, db: AsyncSession = Depends(get_async_db)):
+    """
+    특정 정류소의 시간대별 누적/평균 이용자 수 조회
+    
+    - 시간대 프로필 롤업 테이블 기준
+    """
+    profile = await db.run_sync(rollups.load_hourly_profile, stop_id)
+    
+    if not profile:
+        raise HTTPException(status_code=404, detail="해당 정류소의 데이터를 찾을 수 없습니다")
+    
+    return {"stop_id": stop_id, "hours": profile}
@@ -2,18 +2,66 @@
 
 import os
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-# 환경 변수에서 DB URL 가져오기
-DATABASE_URL = os.getenv("DB_URL", "sqlite:///./bus_statistics.db")
+# 동기/비동기 드라이버 매핑
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+SYNC_DRIVERS = {
+    "sqlite+aiosqlite": "sqlite",
+    "postgresql+asyncpg": "postgresql",
+}
+
+
+def _replace_scheme(url: str, mapping: dict) -> str:
+    scheme, sep, rest = url.partition("://")
+    return f"{mapping.get(scheme, scheme)}{sep}{rest}"
+
+
+def to_async_url(url: str) -> str:
+    """동기 드라이버 URL 을 비동기 드라이버 URL 로 변환."""
+    return _replace_scheme(url, ASYNC_DRIVERS)
+
+
+def to_sync_url(url: str) -> str:
+    """비동기 드라이버 URL 을 동기 드라이버 URL 로 변환."""
+    return _replace_scheme(url, SYNC_DRIVERS)
+
+
+def _engine_options(url: str) -> dict:
+    """커넥션 풀 설정 (인메모리 SQLite 는 단일 커넥션 풀이므로 제외)."""
+    options = {}
+    if "sqlite" in url:
+        options["connect_args"] = {"check_same_thread": False}
+        if ":memory:" in url or url.endswith("://") or url.endswith(":///"):
+            return options
+    options.update(
+        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        pool_pre_ping=True,
+    )
+    return options
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+
+# 환경 변수에서 DB URL 가져오기 (sqlite:// 또는 sqlite+aiosqlite:// 모두 허용)
+DATABASE_URL = to_sync_url(os.getenv("DB_URL", "sqlite:///./bus_statistics.db"))
+ASYNC_DATABASE_URL = to_async_url(DATABASE_URL)
+
+engine = create_engine(DATABASE_URL, **_engine_options(DATABASE_URL))
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **_engine_options(ASYNC_DATABASE_URL))
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
 
 def get_db():
     """데이터베이스 세션 생성."""
@@ -22,3 +70,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """비동기 데이터베이스 세션 생성."""
+    async with AsyncSessionLocal() as db:
+        yield db
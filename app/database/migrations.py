@@ -0,0 +1,218 @@
+"""ridership_data 스키마 마이그레이션.
+
+기존 스키마(문자열 date, 단일 컬럼 인덱스)를 Date 타입과 복합 인덱스로
+옮기고, PostgreSQL 에서는 선택적으로 월 단위 범위 파티셔닝을 적용한다.
+
+    python -m app.database.migrations upgrade
+    python -m app.database.migrations partition --start 2023-01 --months 36
+    python -m app.database.migrations ensure-partitions --ahead 3
+
+환경 변수 DB_AUTO_MIGRATE=true 이면 애플리케이션 시작 시 upgrade 를 실행하고,
+DB_PARTITION_RIDERSHIP=monthly 이면 PostgreSQL 에서 파티셔닝까지 적용한다.
+"""
+
+import argparse
+import logging
+import os
+from datetime import date
+from typing import List
+
+from sqlalchemy import Date, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from app.database.models import (
+    RidershipDaily,
+    RidershipData,
+    RidershipHourlyProfile,
+    RidershipWeekly,
+)
+
+logger = logging.getLogger(__name__)
+
+RIDERSHIP_INDEXES = {index.name for index in RidershipData.__table__.indexes}
+LEGACY_INDEXES = ("ix_ridership_data_station_id", "ix_ridership_data_date")
+ROLLUP_TABLES = (RidershipDaily, RidershipWeekly, RidershipHourlyProfile)
+COLUMNS = "id, station_id, date, hour, passenger_count, created_at"
+
+
+def _date_is_text(conn: Connection, table: str, column: str) -> bool:
+    columns = {col["name"]: col for col in inspect(conn).get_columns(table)}
+    return column in columns and not isinstance(columns[column]["type"], Date)
+
+
+def pending_migrations(conn: Connection) -> List[str]:
+    """적용이 필요한 마이그레이션 목록."""
+    insp = inspect(conn)
+    pending = []
+    if insp.has_table("ridership_data"):
+        indexes = {index["name"] for index in insp.get_indexes("ridership_data")}
+        if (_date_is_text(conn, "ridership_data", "date")
+                or not RIDERSHIP_INDEXES <= indexes
+                or indexes & set(LEGACY_INDEXES)):
+            pending.append("ridership_data")
+    if any(
+        insp.has_table(model.__tablename__)
+        and _date_is_text(conn, model.__tablename__, column)
+        for model, column in ((RidershipDaily, "date"), (RidershipWeekly, "week_start"))
+    ):
+        pending.append("rollups")
+    return pending
+
+
+def _migrate_ridership_data(conn: Connection) -> None:
+    if conn.dialect.name == "postgresql":
+        if _date_is_text(conn, "ridership_data", "date"):
+            conn.execute(text(
+                "ALTER TABLE ridership_data ALTER COLUMN date TYPE date USING date::date"
+            ))
+        for name in LEGACY_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        for index in RidershipData.__table__.indexes:
+            index.create(conn, checkfirst=True)
+        return
+
+    # SQLite 는 컬럼 타입 변경을 지원하지 않으므로 테이블을 다시 만들어 복사
+    for index in inspect(conn).get_indexes("ridership_data"):
+        conn.execute(text(f"DROP INDEX IF EXISTS {index['name']}"))
+    conn.execute(text("ALTER TABLE ridership_data RENAME TO ridership_data_legacy"))
+    RidershipData.__table__.create(conn)
+    date_expr = "date(date)" if conn.dialect.name == "sqlite" else "CAST(date AS DATE)"
+    conn.execute(text(
+        f"INSERT INTO ridership_data ({COLUMNS}) "
+        f"SELECT id, station_id, {date_expr}, hour, passenger_count, created_at "
+        "FROM ridership_data_legacy"
+    ))
+    conn.execute(text("DROP TABLE ridership_data_legacy"))
+
+
+def _rebuild_rollups(conn: Connection) -> None:
+    from app.services.rollups import rebuild_rollups
+
+    for model in ROLLUP_TABLES:
+        model.__table__.drop(conn, checkfirst=True)
+        model.__table__.create(conn)
+    with Session(bind=conn) as session:
+        rebuild_rollups(session)
+        session.flush()
+
+
+def upgrade(engine: Engine) -> List[str]:
+    """필요한 마이그레이션을 한 트랜잭션에서 적용하고 적용 목록 반환."""
+    with engine.begin() as conn:
+        pending = pending_migrations(conn)
+        if "ridership_data" in pending:
+            logger.info("ridership_data 스키마 마이그레이션 적용")
+            _migrate_ridership_data(conn)
+        if pending:
+            # 롤업은 원시 데이터로부터 다시 만들 수 있으므로 재생성
+            _rebuild_rollups(conn)
+    if (engine.dialect.name == "postgresql"
+            and os.getenv("DB_PARTITION_RIDERSHIP", "").lower() == "monthly"):
+        if not is_partitioned(engine):
+            today = date.today()
+            partition_ridership_monthly(engine, date(today.year - 1, 1, 1), 24)
+            pending.append("partition")
+        ensure_month_partitions(engine, ahead=int(os.getenv("DB_PARTITION_AHEAD", "3")))
+    return pending
+
+
+def _month_start(day: date, offset: int) -> date:
+    months = day.year * 12 + day.month - 1 + offset
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def _partition_ddl(parent: str, month: date) -> str:
+    upper = _month_start(month, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS ridership_data_p{month:%Y%m} PARTITION OF {parent} "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+    )
+
+
+def is_partitioned(engine: Engine) -> bool:
+    """ridership_data 가 파티션 테이블인지 여부 (PostgreSQL)."""
+    if engine.dialect.name != "postgresql":
+        return False
+    with engine.connect() as conn:
+        return bool(conn.execute(text(
+            "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = 'ridership_data'"
+        )).scalar())
+
+
+def partition_ridership_monthly(engine: Engine, start: date, months: int) -> None:
+    """
+    ridership_data 를 date 기준 월 단위 RANGE 파티션 테이블로 전환 (PostgreSQL).
+
+    새 파티션 테이블을 만들고 데이터를 복사한 뒤 이름을 교체한다. 범위 밖
+    날짜는 default 파티션으로 들어간다. id 시퀀스는 그대로 이어서 사용한다.
+    """
+    if engine.dialect.name != "postgresql":
+        raise RuntimeError("월 단위 파티셔닝은 PostgreSQL 에서만 지원합니다")
+    first = _month_start(start, 0)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE ridership_data_partitioned ("
+            " id INTEGER NOT NULL DEFAULT nextval('ridership_data_id_seq'),"
+            " station_id VARCHAR NOT NULL REFERENCES bus_stops (station_id),"
+            " date DATE NOT NULL,"
+            " hour INTEGER,"
+            " passenger_count INTEGER,"
+            " created_at TIMESTAMP WITHOUT TIME ZONE,"
+            " PRIMARY KEY (id, date)"
+            ") PARTITION BY RANGE (date)"
+        ))
+        for offset in range(months):
+            conn.execute(text(_partition_ddl("ridership_data_partitioned",
+                                              _month_start(first, offset))))
+        conn.execute(text(
+            "CREATE TABLE ridership_data_pdefault PARTITION OF ridership_data_partitioned DEFAULT"
+        ))
+        conn.execute(text(
+            f"INSERT INTO ridership_data_partitioned ({COLUMNS}) "
+            f"SELECT {COLUMNS} FROM ridership_data"
+        ))
+        conn.execute(text("ALTER SEQUENCE ridership_data_id_seq OWNED BY NONE"))
+        conn.execute(text("DROP TABLE ridership_data"))
+        conn.execute(text("ALTER TABLE ridership_data_partitioned RENAME TO ridership_data"))
+        conn.execute(text("ALTER SEQUENCE ridership_data_id_seq OWNED BY ridership_data.id"))
+        # 부모 테이블 인덱스는 모든 파티션에 전파됨
+        for index in RidershipData.__table__.indexes:
+            index.create(conn)
+
+
+def ensure_month_partitions(engine: Engine, ahead: int = 3) -> None:
+    """이번 달부터 ahead 개월 뒤까지의 파티션이 없으면 생성 (PostgreSQL)."""
+    if not is_partitioned(engine):
+        return
+    this_month = _month_start(date.today(), 0)
+    with engine.begin() as conn:
+        for offset in range(ahead + 1):
+            conn.execute(text(_partition_ddl("ridership_data", _month_start(this_month, offset))))
+
+
+def main() -> None:
+    from app.database.config import engine
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="ridership_data 스키마 마이그레이션")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("upgrade", help="Date 타입/복합 인덱스 적용 및 롤업 재생성")
+    partition = commands.add_parser("partition", help="월 단위 파티셔닝 적용 (PostgreSQL)")
+    partition.add_argument("--start", required=True, help="첫 파티션 월 (YYYY-MM)")
+    partition.add_argument("--months", type=int, default=36)
+    ensure = commands.add_parser("ensure-partitions", help="향후 월 파티션 생성")
+    ensure.add_argument("--ahead", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.command == "upgrade":
+        print("applied:", upgrade(engine) or "nothing")
+    elif args.command == "partition":
+        partition_ridership_monthly(engine, date.fromisoformat(f"{args.start}-01"), args.months)
+    else:
+        ensure_month_partitions(engine, args.ahead)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
 """SQLAlchemy 데이터베이스 모델."""
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import (
+    Column, Integer, String, Float, Date, DateTime, ForeignKey, Index, JSON, UniqueConstraint
+)
 from sqlalchemy.ext.declarative import declarative_base
-from datetime import datetime
+from sqlalchemy.orm import validates
+from datetime import date, datetime
 
 Base = declarative_base()
 
@@ -35,13 +38,101 @@ class BusRoute(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
+class RouteStation(Base):
+    """노선별 경유 정류소 순서."""
+    __tablename__ = "route_stations"
+    __table_args__ = (UniqueConstraint("route_id", "sequence"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    route_id = Column(String, index=True, nullable=False)
+    sequence = Column(Integer, nullable=False)
+    station_id = Column(String, index=True, nullable=False)
+    station_name = Column(String, nullable=False, default="")
+
+
 class RidershipData(Base):
-    """정류소별 이용자 데이터 모델."""
+    """정류소별 이용자 데이터 모델.
+    
+    조회 패턴별 복합 인덱스:
+    - (station_id, date, hour): 정류소 X 의 기간 조회
+    - (hour, date): 기간 내 특정 시간대의 전체 정류소 조회
+      (hour 동등 조건을 앞에 두어야 날짜 범위와 함께 인덱스 탐색이 가능)
+    PostgreSQL 에서는 passenger_count 를 INCLUDE 하여 커버링 인덱스가 된다.
+    """
     __tablename__ = "ridership_data"
+    __table_args__ = (
+        Index("ix_ridership_station_date_hour", "station_id", "date", "hour",
+              postgresql_include=["passenger_count"]),
+        Index("ix_ridership_hour_date", "hour", "date",
+              postgresql_include=["station_id", "passenger_count"]),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    station_id = Column(String, ForeignKey("bus_stops.station_id"), index=True)
-    date = Column(String, index=True, nullable=False)  # YYYY-MM-DD
+    station_id = Column(String, ForeignKey("bus_stops.station_id"), nullable=False)
+    date = Column(Date, nullable=False)
     hour = Column(Integer, nullable=True)  # 0-23
     passenger_count = Column(Integer, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
+    
+    @validates("date")
+    def _coerce_date(self, key, value):
+        """YYYY-MM-DD 문자열도 허용."""
+        return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+class RidershipDaily(Base):
+    """정류소별 일간 이용자 집계 (ridership_data 롤업)."""
+    __tablename__ = "ridership_daily"
+    __table_args__ = (UniqueConstraint("station_id", "date"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    station_id = Column(String, index=True, nullable=False)
+    date = Column(Date, index=True, nullable=False)
+    total_count = Column(Integer, default=0, nullable=False)
+    peak_hour = Column(Integer, nullable=True)
+    peak_count = Column(Integer, default=0, nullable=False)
+    hourly_counts = Column(JSON, nullable=False)  # 0-23시 이용자 수
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class RidershipWeekly(Base):
+    """정류소별 주간 이용자 집계 (월요일 시작)."""
+    __tablename__ = "ridership_weekly"
+    __table_args__ = (UniqueConstraint("station_id", "week_start"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    station_id = Column(String, index=True, nullable=False)
+    week_start = Column(Date, index=True, nullable=False)  # 월요일
+    total_count = Column(Integer, default=0, nullable=False)
+    days = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class RidershipHourlyProfile(Base):
+    """정류소별 시간대 이용 프로필 (전체 기간 누적)."""
+    __tablename__ = "ridership_hourly_profile"
+    __table_args__ = (UniqueConstraint("station_id", "hour"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    station_id = Column(String, index=True, nullable=False)
+    hour = Column(Integer, nullable=False)  # 0-23
+    total_count = Column(Integer, default=0, nullable=False)
+    days = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class IngestionState(Base):
+    """수집 작업 상태 (워커 간 단일 실행 임대와 재개용 체크포인트)."""
+    __tablename__ = "ingestion_state"
+    
+    name = Column(String, primary_key=True)
+    owner = Column(String, nullable=True)  # 임대 중인 워커
+    lease_until = Column(DateTime, nullable=True)
+    status = Column(String, default="idle", nullable=False)
+    checkpoint = Column(JSON, nullable=True)
+    last_started_at = Column(DateTime, nullable=True)
+    last_finished_at = Column(DateTime, nullable=True)
+    last_duration = Column(Float, nullable=True)
+    items_changed = Column(Integer, default=0, nullable=False)
+    last_error = Column(String, nullable=True)
+    runs = Column(Integer, default=0, nullable=False)
@@ -0,0 +1,157 @@
+"""대량 upsert 유틸리티."""
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import bindparam, delete, insert as core_insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.database.models import BusRoute, BusStop, RouteStation
+
+STOP_FIELDS = ("station_name", "latitude", "longitude", "bus_route_count")
+
+
+def _stop_row(stop: Dict[str, Any]) -> Dict[str, Any]:
+    """API 응답 dict 를 bus_stops 컬럼 dict 로 변환."""
+    return {
+        "station_id": stop["stationId"],
+        "station_name": stop["stationName"],
+        "latitude": stop["latitude"],
+        "longitude": stop["longitude"],
+        "bus_route_count": stop.get("busRouteCount", 0),
+    }
+
+
+def _batches(rows: List[Dict[str, Any]], size: int) -> Iterable[List[Dict[str, Any]]]:
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _dialect_insert(db: Session):
+    """SQLite/PostgreSQL 의 ON CONFLICT 지원 insert, 그 외에는 None."""
+    name = db.get_bind().dialect.name
+    if name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+        return insert
+    if name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+        return insert
+    return None
+
+
+def bulk_upsert_stops(db: Session, stops: Iterable[Dict[str, Any]],
+                      batch_size: int = 500) -> Dict[str, int]:
+    """
+    정류소 목록을 배치 단위로 upsert.
+
+    배치마다 기존 행을 한 번에 조회해 신규/변경/무변경을 분류하고,
+    신규·변경 행만 ``INSERT ... ON CONFLICT(station_id) DO UPDATE`` 로 쓴다.
+    무변경 행은 다시 쓰지 않으므로 ``updated_at`` 은 실제 변경 시각을 유지한다.
+    커밋은 호출자가 한 번에 수행한다.
+    """
+    # 같은 배치 안의 중복 stationId 는 마지막 값 사용
+    rows = list({row["station_id"]: row for row in map(_stop_row, stops)}.values())
+    counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+    insert = _dialect_insert(db)
+
+    for batch in _batches(rows, batch_size):
+        existing = {
+            row.station_id: row
+            for row in db.execute(
+                select(BusStop.station_id, *(getattr(BusStop, f) for f in STOP_FIELDS))
+                .where(BusStop.station_id.in_([r["station_id"] for r in batch]))
+            )
+        }
+        new_rows, changed_rows = [], []
+        for row in batch:
+            current = existing.get(row["station_id"])
+            if current is None:
+                new_rows.append(row)
+            elif any(getattr(current, f) != row[f] for f in STOP_FIELDS):
+                changed_rows.append(row)
+            else:
+                counts["unchanged"] += 1
+        counts["inserted"] += len(new_rows)
+        counts["updated"] += len(changed_rows)
+
+        now = datetime.utcnow()
+        if insert is not None:
+            pending = new_rows + changed_rows
+            if not pending:
+                continue
+            stmt = insert(BusStop).values(
+                [{**row, "created_at": now, "updated_at": now} for row in pending]
+            )
+            excluded = stmt.excluded
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[BusStop.station_id],
+                set_={**{f: getattr(excluded, f) for f in STOP_FIELDS}, "updated_at": now},
+                # 동시 수집으로 이미 같은 값이 들어간 행은 다시 쓰지 않음
+                where=or_(*(getattr(BusStop, f) != getattr(excluded, f) for f in STOP_FIELDS)),
+            )
+            db.execute(stmt)
+        else:
+            if new_rows:
+                db.execute(
+                    BusStop.__table__.insert(),
+                    [{**row, "created_at": now, "updated_at": now} for row in new_rows],
+                )
+            if changed_rows:
+                db.execute(
+                    update(BusStop.__table__)
+                    .where(BusStop.__table__.c.station_id == bindparam("b_station_id"))
+                    .values({**{f: bindparam(f"b_{f}") for f in STOP_FIELDS},
+                             "updated_at": now}),
+                    [{f"b_{k}": v for k, v in row.items()} for row in changed_rows],
+                )
+
+    return counts
+
+
+def upsert_route(db: Session, route_info: Dict[str, Any]) -> bool:
+    """
+    노선 기본 정보와 경유 정류소 순서 저장.
+
+    경유 정류소 목록이 바뀐 경우에만 해당 노선의 route_stations 행을 교체하고
+    True 를 반환한다. 커밋은 호출자가 수행한다. routeId 가 비어 있으면
+    ValueError 를 발생시킨다.
+    """
+    route_id = route_info.get("routeId")
+    if not route_id:
+        raise ValueError("routeId 가 없는 노선 정보는 저장할 수 없습니다")
+    values = {
+        "route_name": route_info.get("routeName", ""),
+        "route_type": route_info.get("routeTypeCd", ""),
+        "start_station": route_info.get("startStationName", ""),
+        "end_station": route_info.get("endStationName", ""),
+    }
+    route = db.execute(select(BusRoute).where(BusRoute.route_id == route_id)).scalar_one_or_none()
+    if route is None:
+        db.add(BusRoute(route_id=route_id, **values))
+    else:
+        for field, value in values.items():
+            if getattr(route, field) != value:
+                setattr(route, field, value)
+
+    stations = sorted(
+        (station["sequence"], station["stationId"], station.get("stationName", ""))
+        for station in route_info.get("stations", [])
+    )
+    current = db.execute(
+        select(RouteStation.sequence, RouteStation.station_id, RouteStation.station_name)
+        .where(RouteStation.route_id == route_id)
+        .order_by(RouteStation.sequence)
+    ).all()
+    if [tuple(row) for row in current] == stations:
+        db.flush()
+        return False
+
+    db.execute(delete(RouteStation).where(RouteStation.route_id == route_id))
+    if stations:
+        db.execute(core_insert(RouteStation), [
+            {"route_id": route_id, "sequence": sequence,
+             "station_id": station_id, "station_name": name}
+            for sequence, station_id, name in stations
+        ])
+    db.flush()
+    return True
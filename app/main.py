@@ -1,13 +1,18 @@
 """Main FastAPI application for bus searcher."""
 
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional
-from app.api import statistics, real_statistics
-from app.database import models
-from app.database.config import engine
+from app.api import ingestion, metrics, profiling, statistics, real_statistics
+from app.api.conditional import make_etag, not_modified
+from app.database import migrations, models
+from app.database.config import engine, async_engine, AsyncSessionLocal
+from app.services import metrics as metrics_registry
+from app.services.text_search import normalize
 import logging
+import os
 from dotenv import load_dotenv
 
 # 환경 변수 로드
@@ -19,12 +24,49 @@ logging.basicConfig(level=logging.INFO)
 # 데이터베이스 테이블 생성
 models.Base.metadata.create_all(bind=engine)
 
+# 스키마 마이그레이션 (선택)
+if os.getenv("DB_AUTO_MIGRATE", "false").lower() == "true":
+    migrations.upgrade(engine)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작/종료 시 공유 리소스 관리."""
+    # GBIS 커넥션 풀 생성
+    await real_statistics.api_client.start()
+    # 만료된 GBIS 응답 원문 캐시 정리 (이후 sync-indexes 작업이 주기적으로 수행)
+    await real_statistics.api_client.purge_cache()
+    # 저장된 정류소/노선으로 공간 인덱스, 노선 그래프, 카탈로그(CATALOG_SOURCE=db) 생성
+    async with AsyncSessionLocal() as db:
+        await real_statistics.refresh_stop_index(db)
+        await real_statistics.refresh_route_graph(db)
+        await real_statistics.refresh_catalog(db)
+    # 정류소/노선 수집은 요청 경로가 아닌 백그라운드 작업이 담당
+    if os.getenv("SCHEDULER_ENABLED", "false").lower() == "true":
+        await ingestion.scheduler.start()
+    try:
+        yield
+    finally:
+        await ingestion.scheduler.stop()
+        await real_statistics.api_client.close()
+        await async_engine.dispose()
+
+
 app = FastAPI(
     title="Bus Searcher API",
     description="API for searching and managing bus routes in Pangyo-dong, Seongnam",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
+# 샘플링 프로파일러 (비활성화 시 등록하지 않음)
+if profiling.PROFILE_ENABLED:
+    app.add_middleware(profiling.ProfilingMiddleware)
+
+# 요청 지연 시간/DB 쿼리 시간 측정 (/metrics)
+metrics_registry.instrument_engines()
+app.add_middleware(metrics.MetricsMiddleware)
+
 # CORS 미들웨어 추가
 app.add_middleware(
     CORSMiddleware,
@@ -37,6 +79,8 @@ app.add_middleware(
 # API 라우터 등록
 app.include_router(statistics.router)
 app.include_router(real_statistics.router)
+app.include_router(ingestion.router)
+app.include_router(metrics.router)
 
 
 class BusRoute(BaseModel):
@@ -55,32 +99,6 @@ class BusStop(BaseModel):
     location: str
 
 
-# Sample data for demonstration
-bus_routes = [
-    {
-        "id": 1,
-        "route_number": "101",
-        "origin": "Downtown",
-        "destination": "Airport",
-        "stops": ["Downtown", "Main Street", "Park Avenue", "Airport"]
-    },
-    {
-        "id": 2,
-        "route_number": "202",
-        "origin": "University",
-        "destination": "Mall",
-        "stops": ["University", "Library", "Shopping District", "Mall"]
-    }
-]
-
-bus_stops = [
-    {"id": 1, "name": "Downtown", "location": "City Center"},
-    {"id": 2, "name": "Main Street", "location": "Business District"},
-    {"id": 3, "name": "Park Avenue", "location": "Residential Area"},
-    {"id": 4, "name": "Airport", "location": "International Airport"}
-]
-
-
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -97,7 +115,13 @@ async def root():
                 "saved_stops": "/api/real/stops",
                 "stop_detail": "/api/real/stops/{stop_id}/info",
                 "route_detail": "/api/real/routes/{route_id}/info",
+                "trip_planner": "/api/real/trips",
             },
+            "ingestion": {
+                "status": "/api/real/ingestion/status",
+                "run": "/api/real/ingestion/{job}/run",
+            },
+            "metrics": "/metrics",
             "docs": "/docs"
         }
     }
@@ -110,59 +134,88 @@ async def health_check():
 
 
 @app.get("/routes", response_model=List[BusRoute])
-async def get_routes(origin: Optional[str] = None, destination: Optional[str] = None):
-    """Get all bus routes, optionally filtered by origin and destination."""
-    filtered_routes = bus_routes
-    
-    if origin:
-        filtered_routes = [r for r in filtered_routes if r["origin"].lower() == origin.lower()]
+async def get_routes(request: Request, response: Response,
+                     origin: Optional[str] = None, destination: Optional[str] = None):
+    """Get all bus routes, optionally filtered by origin and destination (ETag aware)."""
+    catalog = real_statistics.catalog.snapshot
+    cached = not_modified(request, response, make_etag(
+        "routes", catalog.version, normalize(origin or ""), normalize(destination or "")
+    ))
+    if cached is not None:
+        return cached
     
-    if destination:
-        filtered_routes = [r for r in filtered_routes if r["destination"].lower() == destination.lower()]
-    
-    return filtered_routes
+    return list(catalog.find_routes(origin, destination))
 
 
 @app.get("/routes/{route_id}", response_model=BusRoute)
 async def get_route(route_id: int):
     """Get a specific bus route by ID."""
-    for route in bus_routes:
-        if route["id"] == route_id:
-            return route
-    raise HTTPException(status_code=404, detail="Route not found")
+    route = real_statistics.catalog.snapshot.routes_by_id.get(route_id)
+    if route is None:
+        raise HTTPException(status_code=404, detail="Route not found")
+    return route
 
 
 @app.get("/stops", response_model=List[BusStop])
-async def get_stops(name: Optional[str] = None):
-    """Get all bus stops, optionally filtered by name."""
-    filtered_stops = bus_stops
+async def get_stops(request: Request, response: Response, name: Optional[str] = None):
+    """Get all bus stops, optionally filtered by name (ranked, supports Korean initials)."""
+    catalog = real_statistics.catalog.snapshot
+    cached = not_modified(request, response, make_etag("stops", catalog.version, name or ""))
+    if cached is not None:
+        return cached
     
-    if name:
-        filtered_stops = [s for s in filtered_stops if name.lower() in s["name"].lower()]
+    if not name:
+        return list(catalog.stops)
     
-    return filtered_stops
+    return [catalog.stops_by_id[stop_id] for stop_id, _ in catalog.stop_search_index.search(name)]
 
 
 @app.get("/stops/{stop_id}", response_model=BusStop)
 async def get_stop(stop_id: int):
     """Get a specific bus stop by ID."""
-    for stop in bus_stops:
-        if stop["id"] == stop_id:
-            return stop
-    raise HTTPException(status_code=404, detail="Stop not found")
+    stop = real_statistics.catalog.snapshot.stops_by_id.get(stop_id)
+    if stop is None:
+        raise HTTPException(status_code=404, detail="Stop not found")
+    return stop
+
+
+@app.get("/stops/{stop_id}/routes", response_model=List[BusRoute])
+async def get_stop_routes(stop_id: int):
+    """Get the routes that pass through a stop."""
+    catalog = real_statistics.catalog.snapshot
+    stop = catalog.stops_by_id.get(stop_id)
+    if stop is None:
+        raise HTTPException(status_code=404, detail="Stop not found")
+    return list(catalog.routes_through(stop["name"]))
 
 
 @app.get("/search")
 async def search_routes(query: str):
-    """Search for routes by any field."""
-    results = []
-    query_lower = query.lower()
-    
-    for route in bus_routes:
-        if (query_lower in route["route_number"].lower() or
-            query_lower in route["origin"].lower() or
-            query_lower in route["destination"].lower() or
-            any(query_lower in stop.lower() for stop in route["stops"])):
-            results.append(route)
+    """Search for routes by any field, ranked by match quality."""
+    catalog = real_statistics.catalog.snapshot
+    results = [catalog.routes_by_id[route_id]
+               for route_id, _ in catalog.route_search_index.search(query)]
     
     return {"query": query, "results": results, "count": len(results)}
+
+
+@app.get("/search/suggest")
+async def suggest(query: str, limit: int = Query(10, ge=1, le=50)):
+    """Autocomplete route numbers, route endpoints and stop names."""
+    catalog = real_statistics.catalog.snapshot
+    candidates = [
+        (score, "route", route_id, catalog.routes_by_id[route_id]["route_number"])
+        for route_id, score in catalog.route_search_index.suggest(query, limit)
+    ] + [
+        (score, "stop", stop_id, catalog.stops_by_id[stop_id]["name"])
+        for stop_id, score in catalog.stop_search_index.suggest(query, limit)
+    ]
+    candidates.sort(key=lambda candidate: -candidate[0])
+    
+    return {
+        "query": query,
+        "suggestions": [
+            {"type": kind, "id": item_id, "label": label, "score": score}
+            for score, kind, item_id, label in candidates[:limit]
+        ],
+    }
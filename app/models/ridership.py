@@ -65,3 +65,19 @@ class StopInfo(BaseModel):
                 "longitude": 127.1100
             }
         }
+
+
+class NearbyStop(StopInfo):
+    """기준 좌표로부터의 거리를 포함한 정류소 정보."""
+    distance_m: float
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "stop_id": "22000001",
+                "stop_name": "판교역 1번출구",
+                "latitude": 37.3950,
+                "longitude": 127.1100,
+                "distance_m": 182.4
+            }
+        }
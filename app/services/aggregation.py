@@ -0,0 +1,223 @@
+"""이용자 통계 열 지향 집계.
+
+정류소 × 일 × 시간 이용자 수를 연속된 NumPy 배열 하나에 담고 합계,
+평균, 피크 시간, 백분위, 상위 k 를 벡터 연산으로 계산한다. 정류소 수백
+개에 대한 지역 요약도 dict 반복 대신 배열 연산 몇 번으로 끝난다.
+"""
+
+from datetime import date, datetime, timedelta
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.database.models import RidershipDaily
+from app.models.ridership import DailyRidership, WeeklyRidership
+
+HOURS = 24
+DEFAULT_PERCENTILES = (50, 90, 99)
+
+
+def _as_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value))
+
+
+class RidershipCube:
+    """
+    정류소 × 일 × 시간 이용자 수 배열.
+
+    counts[s, d, h] 는 station_ids[s] 정류소의 start + d 일 h 시 이용자 수,
+    present[s, d] 는 해당 정류소-일 데이터 존재 여부이다.
+    """
+
+    def __init__(self, station_ids: Sequence[str], start: date, days: int):
+        self.station_ids = list(dict.fromkeys(station_ids))
+        self.index = {station_id: i for i, station_id in enumerate(self.station_ids)}
+        self.start = start
+        self.counts = np.zeros((len(self.station_ids), days, HOURS), dtype=np.int64)
+        self.present = np.zeros((len(self.station_ids), days), dtype=bool)
+
+    @property
+    def dates(self) -> List[date]:
+        return [self.start + timedelta(days=d) for d in range(self.counts.shape[1])]
+
+    def _coordinates(self, station_id: str, day: Any) -> Optional[Tuple[int, int]]:
+        s = self.index.get(station_id)
+        d = (_as_date(day) - self.start).days
+        if s is None or not 0 <= d < self.counts.shape[1]:
+            return None
+        return s, d
+
+    @classmethod
+    def from_hourly(cls, rows: Iterable[Tuple[str, Any, Sequence[int]]],
+                    start: date, days: int,
+                    station_ids: Optional[Sequence[str]] = None) -> "RidershipCube":
+        """(station_id, date, 24시간 분포) 행으로 생성 (일간 롤업 형식)."""
+        rows = list(rows)
+        if station_ids is None:
+            station_ids = [row[0] for row in rows]
+        cube = cls(station_ids, start, days)
+        stations, offsets, hourly = [], [], []
+        for station_id, day, hours in rows:
+            coordinates = cube._coordinates(station_id, day)
+            if coordinates is None:
+                continue
+            stations.append(coordinates[0])
+            offsets.append(coordinates[1])
+            hourly.append(hours)
+        if stations:
+            cube.counts[stations, offsets] = np.asarray(hourly, dtype=np.int64)
+            cube.present[stations, offsets] = True
+        return cube
+
+    @classmethod
+    def from_daily(cls, ridership_by_stop: Dict[str, Dict[str, Any]],
+                   station_ids: Optional[Sequence[str]] = None) -> "RidershipCube":
+        """
+        일별 합계와 피크 시간만 있는 응답(week_data)으로 생성.
+
+        시간 분포를 모르므로 하루 합계를 피크 시간 칸에 넣는다. 합계와
+        피크 시간은 원래 값 그대로 다시 계산된다.
+        """
+        if station_ids is None:
+            station_ids = list(ridership_by_stop)
+        records = [
+            (station_id, _as_date(day["date"]), day.get("peak_hour"), day["passenger_count"])
+            for station_id, ridership in ridership_by_stop.items()
+            for day in ridership.get("week_data", [])
+        ]
+        if not records:
+            return cls(station_ids, date.today(), 0)
+        first = min(record[1] for record in records)
+        last = max(record[1] for record in records)
+        cube = cls(station_ids, first, (last - first).days + 1)
+        stations, offsets, hours, counts = [], [], [], []
+        for station_id, day, peak_hour, count in records:
+            coordinates = cube._coordinates(station_id, day)
+            if coordinates is None:
+                continue
+            stations.append(coordinates[0])
+            offsets.append(coordinates[1])
+            hours.append(peak_hour if peak_hour is not None and 0 <= peak_hour < HOURS else 0)
+            counts.append(count)
+        if stations:
+            np.add.at(cube.counts, (stations, offsets, hours), counts)
+            cube.present[stations, offsets] = True
+        return cube
+
+    @cached_property
+    def daily_totals(self) -> np.ndarray:
+        """정류소 × 일 합계."""
+        return self.counts.sum(axis=2)
+
+    @cached_property
+    def station_totals(self) -> np.ndarray:
+        """정류소별 기간 합계."""
+        return self.daily_totals.sum(axis=1)
+
+    @cached_property
+    def days_present(self) -> np.ndarray:
+        """정류소별 데이터가 있는 일수."""
+        return self.present.sum(axis=1)
+
+    def daily_average(self) -> np.ndarray:
+        """정류소별 일평균 (데이터가 있는 날 기준, 정수 내림)."""
+        return self.station_totals // np.maximum(self.days_present, 1)
+
+    def peak_hours(self) -> np.ndarray:
+        """정류소 × 일 피크 시간, 이용자가 없으면 -1."""
+        peaks = self.counts.argmax(axis=2)
+        return np.where(self.counts.max(axis=2) > 0, peaks, -1)
+
+    def hourly_mean(self) -> np.ndarray:
+        """정류소 × 시간 평균 이용자 수 (데이터가 있는 날 기준)."""
+        return self.counts.sum(axis=1) / np.maximum(self.days_present, 1)[:, None]
+
+    def percentiles(self, q: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """데이터가 있는 정류소-일 합계의 백분위."""
+        values = self.daily_totals[self.present]
+        if not values.size:
+            return {f"p{p:g}": 0.0 for p in q}
+        return {
+            f"p{p:g}": round(float(v), 2)
+            for p, v in zip(q, np.percentile(values, q))
+        }
+
+    def top_k(self, k: int) -> List[int]:
+        """기간 합계 상위 k 정류소 인덱스 (내림차순, 동점은 정류소 순서)."""
+        totals = self.station_totals
+        k = min(k, totals.size)
+        if k <= 0:
+            return []
+        candidates = np.arange(totals.size)
+        if k < totals.size:
+            candidates = np.argpartition(-totals, k - 1)[:k]
+        order = np.lexsort((candidates, -totals[candidates]))
+        return candidates[order].tolist()
+
+    def week_data(self, s: int) -> List[DailyRidership]:
+        """정류소의 일별 통계 (최신순, 데이터가 있는 날만)."""
+        station_id = self.station_ids[s]
+        totals = self.daily_totals[s]
+        peaks = self.peak_hours()[s]
+        dates = self.dates
+        return [
+            DailyRidership(
+                date=dates[d].isoformat(),
+                stop_id=station_id,
+                passenger_count=int(totals[d]),
+                peak_hour=int(peaks[d]) if peaks[d] >= 0 else None,
+            )
+            for d in np.flatnonzero(self.present[s])[::-1]
+        ]
+
+    def weekly_ridership(self, s: int, stop_name: Optional[str] = None) -> WeeklyRidership:
+        """정류소 인덱스 s 의 WeeklyRidership."""
+        return WeeklyRidership(
+            stop_id=self.station_ids[s],
+            stop_name=stop_name,
+            week_data=self.week_data(s),
+            total_count=int(self.station_totals[s]),
+            average_daily=int(self.daily_average()[s]),
+        )
+
+    def summary(self, names: Dict[str, str], period: str,
+                q: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+        """지역 요약: 전체 합계, 최다 이용 정류소, 정류소 평균, 일 합계 백분위."""
+        totals = self.station_totals
+        total_stops = totals.size
+        total = int(totals.sum())
+        top_name, top_count = "", 0
+        if total_stops and totals.max() > 0:
+            s = int(totals.argmax())
+            top_name = names.get(self.station_ids[s], self.station_ids[s])
+            top_count = int(totals[s])
+        return {
+            "total_stops": total_stops,
+            "total_weekly_ridership": total,
+            "top_stop": {"name": top_name, "weekly_count": top_count},
+            "average_per_stop": total // total_stops if total_stops else 0,
+            "period": period,
+            "daily_percentiles": self.percentiles(q),
+        }
+
+
+def load_cube(db: Session, start: date, end: date,
+              station_ids: Optional[Sequence[str]] = None) -> RidershipCube:
+    """일간 롤업에서 [start, end] 기간 큐브 로드."""
+    query = (
+        select(RidershipDaily.station_id, RidershipDaily.date, RidershipDaily.hourly_counts)
+        .where(RidershipDaily.date >= start, RidershipDaily.date <= end)
+        .order_by(RidershipDaily.station_id)
+    )
+    if station_ids is not None:
+        query = query.where(RidershipDaily.station_id.in_(list(station_ids)))
+    return RidershipCube.from_hourly(
+        db.execute(query).all(), start, (end - start).days + 1, station_ids
+    )
@@ -1,8 +1,10 @@
 """경기버스정보 API 클라이언트."""
 
+import asyncio
 import httpx
+import numpy as np
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
 class BusAPIClient:
@@ -12,6 +14,7 @@ class BusAPIClient:
         self.api_key = os.getenv("BUSINFO_API_KEY", "test_key")
         self.base_url = os.getenv("BUSINFO_API_BASE_URL", "https://www.api.bus.go.kr")
         self.timeout = 10.0
+        self.max_concurrency = int(os.getenv("BUSINFO_RIDERSHIP_CONCURRENCY", "16"))
     
     async def get_stops_in_area(self, lat_min: float, lat_max: float, 
                                 lon_min: float, lon_max: float) -> List[Dict[str, Any]]:
@@ -33,6 +36,29 @@ class BusAPIClient:
             print(f"API 오류: {str(e)}")
             return {}
     
+    async def get_stops_ridership(self, stop_ids: List[str],
+                                  max_concurrency: Optional[int] = None
+                                  ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 정류소의 이용자 수 정보를 동시에 조회.
+        
+        동시 요청 수는 max_concurrency 로 제한하며, 조회에 실패한
+        정류소는 결과에서 제외한다.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        
+        async def fetch(stop_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get_stop_ridership(stop_id)
+        
+        unique_ids = list(dict.fromkeys(stop_ids))
+        results = await asyncio.gather(*(fetch(stop_id) for stop_id in unique_ids))
+        return {
+            stop_id: ridership
+            for stop_id, ridership in zip(unique_ids, results)
+            if ridership
+        }
+    
     async def _fetch_mock_stops(self) -> List[Dict[str, Any]]:
         """목데이터: 판교동 정류소 목록."""
         return [
@@ -64,24 +90,25 @@ class BusAPIClient:
     
     async def _fetch_mock_ridership(self, stop_id: str) -> Dict[str, Any]:
         """목데이터: 정류소별 이용자 수."""
-        import random
-        from datetime import datetime, timedelta
-        
-        # 최근 7일 데이터 생성
-        ridership_data = []
-        for i in range(7):
-            date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
-            daily_count = random.randint(100, 500)
-            ridership_data.append({
-                "date": date,
+        # 최근 7일 데이터 생성 (일별 이용자 수와 피크 시간을 한 번에 생성)
+        rng = np.random.default_rng()
+        daily_counts = rng.integers(100, 501, size=7)
+        peak_hours = rng.integers(7, 10, size=7)
+        today = datetime.now()
+        ridership_data = [
+            {
+                "date": (today - timedelta(days=i)).strftime("%Y-%m-%d"),
                 "stop_id": stop_id,
-                "passenger_count": daily_count,
-                "peak_hour": random.randint(7, 9),
-            })
+                "passenger_count": int(count),
+                "peak_hour": int(peak_hour),
+            }
+            for i, (count, peak_hour) in enumerate(zip(daily_counts, peak_hours))
+        ]
+        total_count = int(daily_counts.sum())
         
         return {
             "stop_id": stop_id,
             "week_data": ridership_data,
-            "total_count": sum(d["passenger_count"] for d in ridership_data),
-            "average_daily": sum(d["passenger_count"] for d in ridership_data) // 7,
+            "total_count": total_count,
+            "average_daily": total_count // 7,
         }
@@ -0,0 +1,99 @@
+"""업스트림 응답용 TTL + LRU 캐시."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    항목별 만료 시간과 최대 크기를 가진 LRU 캐시.
+
+    같은 키에 대한 동시 미스는 하나의 로더 호출로 합쳐진다(single-flight).
+    빈 값({}, [], None)은 조회 실패로 보고 캐시하지 않으며, cacheable 이
+    주어지면 그 검사를 통과한 값만 캐시한다 (예: ID 필드가 있는 응답).
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0,
+                 cacheable: Optional[Callable[[Any], bool]] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.cacheable = cacheable
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.coalesced = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 값 반환, 없거나 만료되었으면 None."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.expirations += 1
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """값 저장, 용량 초과 시 가장 오래 사용되지 않은 항목 제거."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """항목 제거."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 항목 제거."""
+        self._data.clear()
+
+    async def get_or_load(self, key: Hashable,
+                          loader: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시 조회 후 미스면 로더 실행, 동시 미스는 한 번만 로드."""
+        value = self.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+        # 먼저 요청한 쪽이 취소되어도 로드는 계속되도록 보호
+        return await asyncio.shield(task)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = await loader()
+        if value and (self.cacheable is None or self.cacheable(value)):
+            self.set(key, value)
+        return value
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스/제거 카운터."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "coalesced": self.coalesced,
+            "inflight": len(self._inflight),
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
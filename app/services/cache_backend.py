@@ -0,0 +1,213 @@
+"""업스트림 XML 응답 원문 저장용 캐시 백엔드."""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class CachedPayload(NamedTuple):
+    """캐시된 응답 원문과 수집 시각(epoch 초)."""
+    body: str
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        """수집 후 경과 시간(초)."""
+        return time.time() - self.fetched_at
+
+
+def payload_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """엔드포인트와 파라미터로 캐시 키 생성 (API 키 제외)."""
+    query = "&".join(
+        f"{name}={params[name]}" for name in sorted(params) if name != "apiKey"
+    )
+    return f"{endpoint}?{query}"
+
+
+class CacheBackend(ABC):
+    """응답 원문 캐시 백엔드 인터페이스."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[CachedPayload]:
+        """캐시된 응답 조회."""
+
+    @abstractmethod
+    async def set(self, key: str, body: str,
+                  fetched_at: Optional[float] = None) -> None:
+        """응답 저장."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """응답 제거."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """전체 제거."""
+
+    async def purge(self, older_than: float) -> int:
+        """지정 시간(초)보다 오래된 응답 제거 후 제거 건수 반환."""
+        return 0
+
+    async def close(self) -> None:
+        """백엔드 리소스 정리."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """프로세스 메모리 기반 백엔드 (재시작 시 소멸)."""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, CachedPayload]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[CachedPayload]:
+        payload = self._data.get(key)
+        if payload is not None:
+            self._data.move_to_end(key)
+        return payload
+
+    async def set(self, key: str, body: str,
+                  fetched_at: Optional[float] = None) -> None:
+        self._data[key] = CachedPayload(body, fetched_at or time.time())
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    async def clear(self) -> None:
+        self._data.clear()
+
+    async def purge(self, older_than: float) -> int:
+        cutoff = time.time() - older_than
+        expired = [key for key, payload in self._data.items() if payload.fetched_at < cutoff]
+        for key in expired:
+            del self._data[key]
+        return len(expired)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    로컬 SQLite 파일 기반 백엔드.
+
+    WAL 모드로 열어 같은 호스트의 여러 워커가 한 파일을 공유한다.
+    디스크 I/O 는 스레드에서 실행해 이벤트 루프를 막지 않는다.
+    만료/초과 응답은 purge() 가 제거하며, RealBusAPIClient.purge_cache() 가 주기적으로 호출한다.
+    """
+
+    def __init__(self, path: str = "./upstream_cache.db", max_entries: int = 10000):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        with self._lock:
+            self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        """커넥션 반환 (close 이후 호출되면 다시 연다). _lock 안에서 호출."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS upstream_cache ("
+                " key TEXT PRIMARY KEY,"
+                " body TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_upstream_cache_fetched_at "
+                "ON upstream_cache (fetched_at)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _get(self, key: str) -> Optional[CachedPayload]:
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT body, fetched_at FROM upstream_cache WHERE key = ?", (key,)
+            ).fetchone()
+        return CachedPayload(*row) if row else None
+
+    def _set(self, key: str, body: str, fetched_at: float) -> None:
+        with self._lock:
+            # 다른 워커가 더 최신 응답을 저장했다면 덮어쓰지 않음
+            conn = self._connection()
+            conn.execute(
+                "INSERT INTO upstream_cache (key, body, fetched_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET body = excluded.body, "
+                "fetched_at = excluded.fetched_at "
+                "WHERE excluded.fetched_at >= upstream_cache.fetched_at",
+                (key, body, fetched_at),
+            )
+            conn.commit()
+
+    def _execute(self, sql: str, params: tuple = ()) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute(sql, params)
+            conn.commit()
+
+    def _purge(self, cutoff: float) -> int:
+        with self._lock:
+            conn = self._connection()
+            removed = conn.execute(
+                "DELETE FROM upstream_cache WHERE fetched_at < ?", (cutoff,)
+            ).rowcount
+            # 최대 건수를 넘으면 오래된 응답부터 제거
+            removed += conn.execute(
+                "DELETE FROM upstream_cache WHERE key IN ("
+                " SELECT key FROM upstream_cache"
+                " ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+            conn.commit()
+        return removed
+
+    async def get(self, key: str) -> Optional[CachedPayload]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, body: str,
+                  fetched_at: Optional[float] = None) -> None:
+        await asyncio.to_thread(self._set, key, body, fetched_at or time.time())
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(
+            self._execute, "DELETE FROM upstream_cache WHERE key = ?", (key,)
+        )
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM upstream_cache")
+
+    async def purge(self, older_than: float) -> int:
+        """지정 시간(초)보다 오래된 응답과 max_entries 를 넘는 오래된 응답 제거."""
+        return await asyncio.to_thread(self._purge, time.time() - older_than)
+
+    async def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def create_cache_backend() -> Optional[CacheBackend]:
+    """
+    환경 변수로 백엔드 선택.
+
+    BUSINFO_CACHE_BACKEND: memory(기본) | sqlite | none
+    """
+    backend = os.getenv("BUSINFO_CACHE_BACKEND", "memory").lower()
+    max_entries = int(os.getenv("BUSINFO_CACHE_MAX_ENTRIES", "10000"))
+    if backend == "sqlite":
+        return SQLiteCacheBackend(
+            os.getenv("BUSINFO_CACHE_PATH", "./upstream_cache.db"), max_entries
+        )
+    if backend == "memory":
+        return MemoryCacheBackend(max_entries)
+    return None
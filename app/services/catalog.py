@@ -0,0 +1,186 @@
+"""노선/정류소 카탈로그 (레거시 /routes, /stops 엔드포인트용).
+
+카탈로그 데이터를 불러올 때마다 ID, 정규화한 기점/종점, 정류소 이름별
+인덱스와 검색 인덱스를 모두 갖춘 불변 스냅샷을 새로 만들고 참조 하나만
+바꿔 끼운다(copy-on-write). 요청 처리기는 시작할 때 스냅샷 하나를 잡고
+끝까지 그것만 보므로, 갱신 중에도 절반만 바뀐 상태를 보지 않는다.
+
+데이터 원천은 CATALOG_SOURCE 로 고른다.
+- sample: 내장 예시 데이터 (기본값)
+- file: CATALOG_PATH 의 JSON 파일 ({"routes": [...], "stops": [...]})
+- db: 수집 작업이 저장한 bus_routes / route_stations / bus_stops
+"""
+
+import hashlib
+import json
+import logging
+import os
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.database.models import BusRoute, BusStop, RouteStation
+from app.services.text_search import TextIndex, normalize
+
+logger = logging.getLogger(__name__)
+
+CATALOG_SOURCE = os.getenv("CATALOG_SOURCE", "sample")
+CATALOG_PATH = os.getenv("CATALOG_PATH", "./catalog.json")
+
+Record = Dict[str, Any]
+
+SAMPLE_ROUTES: List[Record] = [
+    {
+        "id": 1,
+        "route_number": "101",
+        "origin": "Downtown",
+        "destination": "Airport",
+        "stops": ["Downtown", "Main Street", "Park Avenue", "Airport"]
+    },
+    {
+        "id": 2,
+        "route_number": "202",
+        "origin": "University",
+        "destination": "Mall",
+        "stops": ["University", "Library", "Shopping District", "Mall"]
+    }
+]
+
+SAMPLE_STOPS: List[Record] = [
+    {"id": 1, "name": "Downtown", "location": "City Center"},
+    {"id": 2, "name": "Main Street", "location": "Business District"},
+    {"id": 3, "name": "Park Avenue", "location": "Residential Area"},
+    {"id": 4, "name": "Airport", "location": "International Airport"}
+]
+
+
+def _group(records: Iterable[Record], key) -> Mapping[str, Tuple[Record, ...]]:
+    groups: Dict[str, List[Record]] = {}
+    for record in records:
+        for value in key(record):
+            groups.setdefault(normalize(value), []).append(record)
+    return MappingProxyType({k: tuple(v) for k, v in groups.items()})
+
+
+class CatalogSnapshot:
+    """한 시점의 카탈로그와 인덱스. 만든 뒤에는 바꾸지 않는다."""
+
+    def __init__(self, routes: Iterable[Record], stops: Iterable[Record]):
+        self.routes: Tuple[Record, ...] = tuple(routes)
+        self.stops: Tuple[Record, ...] = tuple(stops)
+        self.routes_by_id: Mapping[int, Record] = MappingProxyType(
+            {route["id"]: route for route in self.routes}
+        )
+        self.stops_by_id: Mapping[int, Record] = MappingProxyType(
+            {stop["id"]: stop for stop in self.stops}
+        )
+        self.routes_by_origin = _group(self.routes, lambda r: [r["origin"]])
+        self.routes_by_destination = _group(self.routes, lambda r: [r["destination"]])
+        # 한 노선이 같은 정류소를 두 번 지나도 한 번만 포함
+        self.routes_by_stop_name = _group(self.routes, lambda r: dict.fromkeys(r["stops"]))
+        self.route_search_index = TextIndex.build(
+            (
+                route["id"],
+                [(route["route_number"], 3.0), (route["origin"], 2.0),
+                 (route["destination"], 2.0), *((stop, 1.0) for stop in route["stops"])],
+            )
+            for route in self.routes
+        )
+        self.stop_search_index = TextIndex.build(
+            (stop["id"], [(stop["name"], 1.0)]) for stop in self.stops
+        )
+        self.version = hashlib.blake2b(
+            json.dumps([self.routes, self.stops], sort_keys=True).encode(), digest_size=16
+        ).hexdigest()
+
+    def find_routes(self, origin: Optional[str] = None,
+                    destination: Optional[str] = None) -> Tuple[Record, ...]:
+        """기점/종점(대소문자 무시) 조건에 맞는 노선 (카탈로그 순서)."""
+        if not origin and not destination:
+            return self.routes
+        candidates = []
+        if origin:
+            candidates.append(self.routes_by_origin.get(normalize(origin), ()))
+        if destination:
+            candidates.append(self.routes_by_destination.get(normalize(destination), ()))
+        if len(candidates) == 1:
+            return candidates[0]
+        smaller, larger = sorted(candidates, key=len)
+        ids = {route["id"] for route in larger}
+        return tuple(route for route in smaller if route["id"] in ids)
+
+    def routes_through(self, stop_name: str) -> Tuple[Record, ...]:
+        return self.routes_by_stop_name.get(normalize(stop_name), ())
+
+
+class Catalog:
+    """현재 스냅샷을 가리키는 참조. load() 는 새 스냅샷을 만든 뒤 한 번에 교체한다."""
+
+    def __init__(self, routes: Iterable[Record] = (), stops: Iterable[Record] = ()):
+        self._snapshot = CatalogSnapshot(routes, stops)
+
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        return self._snapshot
+
+    def load(self, routes: Iterable[Record], stops: Iterable[Record]) -> CatalogSnapshot:
+        snapshot = CatalogSnapshot(routes, stops)
+        self._snapshot = snapshot
+        return snapshot
+
+    def load_file(self, path: str) -> CatalogSnapshot:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return self.load(data.get("routes", []), data.get("stops", []))
+
+    def load_db(self, db: Session) -> CatalogSnapshot:
+        """저장된 노선/정류소로 교체 (ID 는 각 테이블의 정수 기본키)."""
+        stations: Dict[str, List[str]] = {}
+        for route_id, name in db.execute(
+            select(RouteStation.route_id, RouteStation.station_name)
+            .order_by(RouteStation.route_id, RouteStation.sequence)
+        ):
+            stations.setdefault(route_id, []).append(name)
+        routes = [
+            {
+                "id": row.id,
+                "route_number": row.route_name,
+                "origin": row.start_station,
+                "destination": row.end_station,
+                "stops": stations.get(row.route_id, []),
+            }
+            for row in db.execute(
+                select(BusRoute.id, BusRoute.route_id, BusRoute.route_name,
+                       BusRoute.start_station, BusRoute.end_station).order_by(BusRoute.id)
+            )
+        ]
+        stops = [
+            {"id": row.id, "name": row.station_name,
+             "location": f"{row.latitude:.6f}, {row.longitude:.6f}"}
+            for row in db.execute(
+                select(BusStop.id, BusStop.station_name, BusStop.latitude, BusStop.longitude)
+                .order_by(BusStop.id)
+            )
+        ]
+        return self.load(routes, stops)
+
+
+def initial_catalog() -> Catalog:
+    """
+    CATALOG_SOURCE 에 따른 시작 카탈로그 (db 는 lifespan 에서 채운다).
+
+    file 원천의 파일이 없거나 형식이 잘못되면 임포트가 실패하지 않도록
+    오류를 기록하고 빈 카탈로그로 시작한다.
+    """
+    if CATALOG_SOURCE == "file":
+        catalog = Catalog()
+        try:
+            catalog.load_file(CATALOG_PATH)
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.error(f"카탈로그 파일을 읽지 못해 빈 카탈로그로 시작: {CATALOG_PATH} ({e!r})")
+        return catalog
+    if CATALOG_SOURCE == "db":
+        return Catalog()
+    return Catalog(SAMPLE_ROUTES, SAMPLE_STOPS)
@@ -0,0 +1,312 @@
+"""인프로세스 메트릭 레지스트리 (Prometheus 텍스트 형식).
+
+카운터/게이지/히스토그램은 레이블 값 조합마다 자식 객체를 하나씩 두고,
+측정은 숫자 덧셈과 bisect 한 번으로 끝난다. 누적 버킷 계산과 문자열
+조립은 /metrics 조회 시에만 한다. 이벤트 루프 스레드에서 갱신한다고
+가정하므로 잠금을 쓰지 않는다.
+
+요청 처리 중의 DB 쿼리 시간은 ``current_context`` 로 어느 핸들러(라우트
+템플릿, 또는 수집 작업)에서 실행됐는지 구분한다.
+"""
+
+import functools
+import math
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FAST_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+# (이름, 종류, 설명, [(레이블, 값), ...])
+Family = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            k, str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        )
+        for k, v in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+
+    @abstractmethod
+    def _new_child(self) -> Any:
+        """레이블 값 조합 하나의 측정 객체 생성."""
+
+    def labels(self, *values: Any) -> Any:
+        """레이블 값 조합의 자식 (처음 보는 조합이면 생성)."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 레이블 {self.labelnames} 가 필요합니다")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def _label_dict(self, values: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, map(str, values)))
+
+    @abstractmethod
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        """(샘플 이름, 레이블, 값) 목록."""
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._children[()].inc(amount)
+
+    def samples(self):
+        return [(self.name + "_total", self._label_dict(k), c.value)
+                for k, c in self._children.items()]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._children[()].dec(amount)
+
+    def set(self, value: float) -> None:
+        self._children[()].set(value)
+
+    def samples(self):
+        return [(self.name, self._label_dict(k), c.value) for k, c in self._children.items()]
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._children[()].observe(value)
+
+    def samples(self):
+        result = []
+        for key, child in self._children.items():
+            labels = self._label_dict(key)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), child.counts):
+                cumulative += count
+                result.append((self.name + "_bucket",
+                               {**labels, "le": _format_value(bound)}, cumulative))
+            result.append((self.name + "_sum", labels, child.sum))
+            result.append((self.name + "_count", labels, cumulative))
+        return result
+
+
+class Registry:
+    """메트릭과 조회 시점 수집기(collector) 모음."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: List[Callable[[], Iterable[Family]]] = []
+
+    def _register(self, metric: _Metric) -> Any:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 메트릭입니다: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collector: Callable[[], Iterable[Family]]) -> None:
+        """조회할 때마다 호출해 값을 읽는 수집기 등록 (기존 통계 객체 노출용)."""
+        self._collectors.append(collector)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식 (0.0.4)."""
+        lines: List[str] = []
+
+        def family(name: str, kind: str, documentation: str, samples) -> None:
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample_name, labels, value in samples:
+                lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+
+        for metric in self._metrics.values():
+            family(metric.name, metric.kind, metric.documentation, metric.samples())
+        for collector in self._collectors:
+            for name, kind, documentation, values in collector():
+                suffix = "_total" if kind == "counter" else ""
+                family(name, kind, documentation,
+                       [(name + suffix, labels, value) for labels, value in values])
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (라우트 템플릿별)",
+    ["method", "route", "status"],
+)
+HTTP_IN_FLIGHT = REGISTRY.gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수")
+GBIS_REQUEST_SECONDS = REGISTRY.histogram(
+    "gbis_request_duration_seconds", "GBIS 업스트림 호출 시간 (재시도 시도마다)",
+    ["endpoint", "status"],
+)
+GBIS_IN_FLIGHT = REGISTRY.gauge(
+    "gbis_requests_in_flight", "진행 중인 GBIS 업스트림 호출 수", ["endpoint"]
+)
+GBIS_PAYLOAD_CACHE = REGISTRY.counter(
+    "gbis_payload_cache", "GBIS 응답 원문 캐시 조회 결과 (fresh/stale/miss/fallback)",
+    ["endpoint", "result"],
+)
+GBIS_RETRIES = REGISTRY.counter(
+    "gbis_retries", "GBIS 업스트림 재시도 수 (retry: 재시도, exhausted: 재시도 소진)",
+    ["endpoint", "outcome"],
+)
+GBIS_CIRCUIT_TRANSITIONS = REGISTRY.counter(
+    "gbis_circuit_transitions", "GBIS 서킷 브레이커 상태 전이 수",
+    ["endpoint", "from_state", "to_state"],
+)
+GBIS_CIRCUIT_REJECTED = REGISTRY.counter(
+    "gbis_circuit_rejected", "서킷 브레이커가 열려 있어 거부된 GBIS 호출 수", ["endpoint"],
+)
+XML_PARSE_SECONDS = REGISTRY.histogram(
+    "gbis_xml_parse_duration_seconds", "GBIS XML 응답 파싱 시간", ["kind"],
+    buckets=FAST_BUCKETS,
+)
+DB_QUERY_SECONDS = REGISTRY.histogram(
+    "db_query_duration_seconds", "DB 쿼리 실행 시간 (핸들러별)", ["handler"],
+    buckets=FAST_BUCKETS,
+)
+
+# HTTP 요청이면 ASGI scope, 수집 작업이면 {"handler": "job:<name>"}
+current_context: ContextVar[Optional[Dict[str, Any]]] = ContextVar("metrics_context", default=None)
+
+
+def handler_label() -> str:
+    """현재 실행 중인 핸들러 이름 (라우트 템플릿, 작업 이름 또는 other)."""
+    context = current_context.get()
+    if context is None:
+        return "other"
+    route = context.get("route")
+    if route is not None:
+        return getattr(route, "path", "unmatched")
+    return context.get("handler", "unmatched")
+
+
+def timed(child: Any) -> Callable:
+    """동기 함수 실행 시간을 히스토그램 자식에 기록하는 데코레이터."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                child.observe(time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+_instrumented = False
+
+
+def instrument_engines() -> None:
+    """모든 SQLAlchemy 엔진의 쿼리 실행 시간을 DB_QUERY_SECONDS 에 기록 (한 번만 등록)."""
+    global _instrumented
+    if _instrumented:
+        return
+    _instrumented = True
+
+    @event.listens_for(Engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+    @event.listens_for(Engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get("metrics_started")
+        if started:
+            DB_QUERY_SECONDS.labels(handler_label()).observe(time.perf_counter() - started.pop())
+
+    @event.listens_for(Engine, "handle_error")
+    def _error(context):
+        # 실패한 쿼리는 after_cursor_execute 가 호출되지 않으므로 시작 시각만 제거
+        connection = context.connection
+        if connection is not None and connection.info.get("metrics_started"):
+            connection.info["metrics_started"].pop()
@@ -0,0 +1,211 @@
+"""요청 단위 통계적 프로파일러.
+
+샘플러 스레드가 PROFILE_INTERVAL_MS 마다 프로파일 중인 요청을 살펴 스택을
+하나씩 기록한다.
+
+- 요청 태스크가 이벤트 루프에서 실행 중이면 루프 스레드의 현재 스택을 읽고,
+  그 사이 루프 스레드의 CPU 시간이 늘었으면 [cpu], 아니면 [blocked]
+  (루프를 막는 동기 I/O 등)로 분류한다.
+- 요청 태스크가 대기 중이면 코루틴의 cr_await 사슬을 따라 대기 지점까지의
+  스택을 [await] 으로 기록한다.
+
+각 샘플은 직전 샘플 이후 경과 시간으로 가중하므로 세 분류의 합이 요청의
+벽시계 시간이 된다. 결과는 collapsed-stack
+(flamegraph.pl, speedscope 등에서 열림) 또는 speedscope JSON 으로 저장하며,
+최상위 프레임과 파일 이름에 라우트와 처리 시간을 남긴다.
+
+샘플러 스레드는 프로파일 중인 요청이 있을 때만 돈다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Stack = Tuple[str, ...]
+
+CPU, BLOCKED, AWAIT = "[cpu]", "[blocked]", "[await]"
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    path = code.co_filename.replace("\\", "/").split("/")
+    return f"{getattr(code, 'co_qualname', code.co_name)} ({'/'.join(path[-2:])}:{frame.f_lineno})"
+
+
+def _await_frames(coro: Any) -> List[Any]:
+    """코루틴/제너레이터의 대기 사슬을 바깥쪽부터 따라간 프레임 목록."""
+    frames = []
+    obj = coro
+    while obj is not None:
+        frame = (getattr(obj, "cr_frame", None) or getattr(obj, "gi_frame", None)
+                 or getattr(obj, "ag_frame", None))
+        if frame is not None:
+            frames.append(frame)
+        obj = (getattr(obj, "cr_await", None) or getattr(obj, "gi_yieldfrom", None)
+               or getattr(obj, "ag_await", None))
+    return frames
+
+
+def _thread_cpu_clock(thread_id: int) -> Optional[int]:
+    if not hasattr(time, "pthread_getcpuclockid"):
+        return None
+    try:
+        return time.pthread_getcpuclockid(thread_id)
+    except OSError:
+        return None
+
+
+class ProfileSession:
+    """프로파일 중인 요청 하나의 샘플."""
+
+    def __init__(self, coro: Any, task: "asyncio.Task[Any]", loop: asyncio.AbstractEventLoop):
+        self.coro = coro
+        self.task = task
+        self.loop = loop
+        self.thread_id = threading.get_ident()
+        self.cpu_clock = _thread_cpu_clock(self.thread_id)
+        self.samples: Counter = Counter()
+        self.kinds: Counter = Counter()
+        self.started = time.perf_counter()
+        self.duration = 0.0
+
+    def _running_stack(self, frames: Dict[int, Any]) -> Stack:
+        frame = frames.get(self.thread_id)
+        root = getattr(self.coro, "cr_frame", None)
+        stack = []
+        while frame is not None and frame is not root:
+            stack.append(_frame_label(frame))
+            frame = frame.f_back
+        if frame is root and root is not None:
+            stack.append(_frame_label(root))
+        return tuple(reversed(stack))
+
+    def sample(self, frames: Dict[int, Any], cpu_delta: Optional[float],
+               elapsed: float) -> None:
+        """elapsed 초 동안의 상태를 현재 스택 하나로 기록 (마이크로초 가중치)."""
+        if asyncio.current_task(self.loop) is self.task:
+            if cpu_delta is None:
+                kind = CPU
+            else:
+                kind = CPU if cpu_delta >= elapsed / 2 else BLOCKED
+            stack = self._running_stack(frames)
+        else:
+            kind = AWAIT
+            stack = tuple(_frame_label(frame) for frame in _await_frames(self.coro))
+        weight = max(int(elapsed * 1e6), 1)
+        self.kinds[kind] += weight
+        self.samples[(kind,) + stack] += weight
+
+
+class SamplingProfiler:
+    """세션이 있을 때만 도는 샘플러 스레드."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._sessions: List[ProfileSession] = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def begin(self, coro: Any) -> ProfileSession:
+        session = ProfileSession(coro, asyncio.current_task(), asyncio.get_running_loop())
+        with self._lock:
+            self._sessions.append(session)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+                self._thread.start()
+        return session
+
+    def end(self, session: ProfileSession) -> None:
+        """세션 제거. 샘플링 중이면 그 회차가 끝날 때까지 기다린다."""
+        session.duration = time.perf_counter() - session.started
+        with self._lock:
+            self._sessions.remove(session)
+
+    def _run(self) -> None:
+        # 샘플러도 GIL 을 얻어야 하므로 CPU 를 쓰는 구간에서는 간격이 늘어난다.
+        # 고정 간격 대신 실제 경과 시간을 가중치로 써서 [cpu] 가 과소 집계되지 않게 한다.
+        last_cpu: Dict[int, float] = {}
+        last_tick = time.perf_counter()
+        while True:
+            time.sleep(self.interval)
+            # 샘플링 회차 전체를 잠금 안에서 수행해, end() 이후에는 세션의
+            # samples 가 더 바뀌지 않도록 한다 (저장 스레드와의 경합 방지).
+            with self._lock:
+                if not self._sessions:
+                    self._thread = None
+                    return
+                now = time.perf_counter()
+                frames = sys._current_frames()
+                cpu_now: Dict[int, Optional[float]] = {}
+                for session in self._sessions:
+                    clock = session.cpu_clock
+                    if clock is not None and clock not in cpu_now:
+                        cpu_now[clock] = time.clock_gettime(clock)
+                    delta = None
+                    if clock is not None:
+                        previous = last_cpu.get(clock)
+                        delta = cpu_now[clock] - previous if previous is not None else None
+                    session.sample(frames, delta, min(now - last_tick, now - session.started))
+            last_cpu.update({k: v for k, v in cpu_now.items() if v is not None})
+            last_tick = now
+
+
+def _slug(text: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", text).strip("_") or "root"
+
+
+def write_profile(session: ProfileSession, method: str, route: str, directory: str,
+                  fmt: str) -> str:
+    """
+    세션을 collapsed 또는 speedscope 파일로 저장하고 경로 반환.
+
+    collapsed 의 값은 마이크로초, speedscope 의 가중치는 밀리초 단위다.
+    """
+    duration_ms = session.duration * 1000
+    title = f"{method} {route} ({duration_ms:.1f} ms)"
+    os.makedirs(directory, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%dT%H%M%S.%f")
+    base = os.path.join(directory, f"{stamp}_{method}_{_slug(route)}_{duration_ms:.0f}ms")
+
+    if fmt == "speedscope":
+        frame_index: Dict[str, int] = {}
+        samples, weights = [], []
+        for stack, count in session.samples.items():
+            samples.append([
+                frame_index.setdefault(name, len(frame_index)) for name in (title,) + stack
+            ])
+            weights.append(count / 1000)
+        document = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": [{"name": name} for name in frame_index]},
+            "profiles": [{
+                "type": "sampled",
+                "name": title,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": duration_ms,
+                "samples": samples,
+                "weights": weights,
+            }],
+            "name": title,
+            "exporter": "bus-searcher",
+        }
+        path = base + ".speedscope.json"
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False)
+    else:
+        path = base + ".collapsed"
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in session.samples.most_common():
+                f.write(";".join((title,) + stack) + f" {count}\n")
+    return path
@@ -0,0 +1,289 @@
+"""GBIS API 키 사용량 제한용 토큰 버킷.
+
+엔드포인트별로 초당 보충 속도와 최대 버스트를 가진 버킷을 두고, 토큰이
+없으면 max_wait 초까지 대기한 뒤에도 부족하면 요청을 버린다(load shedding).
+SQLite 저장소를 쓰면 같은 호스트의 uvicorn 워커들이 버킷과 일일 사용량을
+공유한다.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, Tuple
+
+from app.services.resilience import UpstreamUnavailableError
+
+
+class RateLimitExceeded(UpstreamUnavailableError):
+    """토큰 또는 일일 할당량이 소진되어 요청을 버림."""
+
+
+def _today() -> str:
+    return time.strftime("%Y-%m-%d")
+
+
+class BucketStore(ABC):
+    """토큰 버킷 상태 저장소."""
+
+    @abstractmethod
+    def try_take(self, name: str, rate: float, capacity: float,
+                 daily_quota: int) -> Tuple[float, Optional[str]]:
+        """
+        토큰 하나를 시도해서 가져간다.
+
+        (0, None) 이면 성공, (대기 초, None) 이면 그만큼 뒤 재시도,
+        (0, 사유) 이면 일일 할당량 소진.
+        """
+
+    @abstractmethod
+    def snapshot(self, name: str, rate: float, capacity: float) -> Dict[str, float]:
+        """현재 토큰 수와 오늘 사용량."""
+
+    @abstractmethod
+    def used_today(self) -> int:
+        """오늘 전체 엔드포인트 사용량."""
+
+
+def _refill(tokens: float, updated_at: float, rate: float,
+            capacity: float, now: float) -> float:
+    return min(capacity, tokens + (now - updated_at) * rate)
+
+
+class MemoryBucketStore(BucketStore):
+    """프로세스 내 버킷 저장소."""
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._usage: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def try_take(self, name, rate, capacity, daily_quota):
+        now = time.time()
+        with self._lock:
+            if daily_quota and self._used_today() >= daily_quota:
+                return 0.0, "일일 할당량 소진"
+            tokens, updated_at = self._buckets.get(name, (capacity, now))
+            tokens = _refill(tokens, updated_at, rate, capacity, now)
+            if tokens < 1:
+                self._buckets[name] = (tokens, now)
+                return (1 - tokens) / rate, None
+            self._buckets[name] = (tokens - 1, now)
+            key = (_today(), name)
+            self._usage[key] = self._usage.get(key, 0) + 1
+            return 0.0, None
+
+    def snapshot(self, name, rate, capacity):
+        now = time.time()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(name, (capacity, now))
+            return {
+                "tokens": round(_refill(tokens, updated_at, rate, capacity, now), 2),
+                "used_today": self._usage.get((_today(), name), 0),
+            }
+
+    def _used_today(self) -> int:
+        today = _today()
+        return sum(count for (day, _), count in self._usage.items() if day == today)
+
+    def used_today(self) -> int:
+        with self._lock:
+            return self._used_today()
+
+
+class SQLiteBucketStore(BucketStore):
+    """
+    SQLite 파일 기반 버킷 저장소.
+
+    BEGIN IMMEDIATE 트랜잭션으로 읽기-보충-차감을 원자적으로 수행하므로
+    여러 워커 프로세스가 같은 파일을 안전하게 공유한다.
+    """
+
+    def __init__(self, path: str = "./rate_limit.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30,
+                                     isolation_level=None)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS token_buckets ("
+                " name TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS quota_usage ("
+                " day TEXT NOT NULL, name TEXT NOT NULL, count INTEGER NOT NULL,"
+                " PRIMARY KEY (day, name))"
+            )
+
+    def try_take(self, name, rate, capacity, daily_quota):
+        now = time.time()
+        today = _today()
+        with self._lock:
+            conn = self._conn
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if daily_quota:
+                    used = conn.execute(
+                        "SELECT COALESCE(SUM(count), 0) FROM quota_usage WHERE day = ?",
+                        (today,),
+                    ).fetchone()[0]
+                    if used >= daily_quota:
+                        conn.execute("COMMIT")
+                        return 0.0, "일일 할당량 소진"
+                row = conn.execute(
+                    "SELECT tokens, updated_at FROM token_buckets WHERE name = ?", (name,)
+                ).fetchone()
+                tokens = _refill(*(row or (capacity, now)), rate, capacity, now)
+                wait = 0.0
+                if tokens < 1:
+                    wait = (1 - tokens) / rate
+                else:
+                    tokens -= 1
+                    conn.execute(
+                        "INSERT INTO quota_usage (day, name, count) VALUES (?, ?, 1) "
+                        "ON CONFLICT(day, name) DO UPDATE SET count = count + 1",
+                        (today, name),
+                    )
+                conn.execute(
+                    "INSERT INTO token_buckets (name, tokens, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, "
+                    "updated_at = excluded.updated_at",
+                    (name, tokens, now),
+                )
+                conn.execute("COMMIT")
+                return wait, None
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    def snapshot(self, name, rate, capacity):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tokens, updated_at FROM token_buckets WHERE name = ?", (name,)
+            ).fetchone()
+            used = self._conn.execute(
+                "SELECT count FROM quota_usage WHERE day = ? AND name = ?", (_today(), name)
+            ).fetchone()
+        tokens = _refill(*(row or (capacity, now)), rate, capacity, now)
+        return {"tokens": round(tokens, 2), "used_today": used[0] if used else 0}
+
+    def used_today(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COALESCE(SUM(count), 0) FROM quota_usage WHERE day = ?", (_today(),)
+            ).fetchone()[0]
+
+
+class RateLimiter:
+    """엔드포인트별 토큰 버킷과 일일 할당량을 적용하는 제한기."""
+
+    def __init__(self, budgets: Dict[str, Tuple[float, float]],
+                 store: Optional[BucketStore] = None, max_wait: float = 2.0,
+                 daily_quota: int = 0, default_budget: Tuple[float, float] = (10.0, 20.0)):
+        self.budgets = budgets
+        self.default_budget = default_budget
+        self.store = store or MemoryBucketStore()
+        self.max_wait = max_wait
+        self.daily_quota = daily_quota
+        self.waited = 0
+        self.shed = 0
+
+    def budget(self, name: str) -> Tuple[float, float]:
+        """(초당 보충 속도, 최대 버스트)."""
+        return self.budgets.get(name, self.default_budget)
+
+    async def acquire(self, name: str) -> None:
+        """토큰 하나 획득, max_wait 안에 얻지 못하면 RateLimitExceeded."""
+        rate, capacity = self.budget(name)
+        deadline = time.monotonic() + self.max_wait
+        waited = False
+        while True:
+            wait, reason = await asyncio.to_thread(
+                self.store.try_take, name, rate, capacity, self.daily_quota
+            )
+            if reason is not None:
+                self.shed += 1
+                raise RateLimitExceeded(f"{name}: {reason}")
+            if wait <= 0:
+                return
+            if time.monotonic() + wait > deadline:
+                self.shed += 1
+                raise RateLimitExceeded(f"{name}: 요청 한도 초과")
+            if not waited:
+                self.waited += 1
+                waited = True
+            await asyncio.sleep(wait)
+
+    def stats(self) -> Dict[str, Any]:
+        """엔드포인트별 버킷 상태와 남은 일일 할당량 추정."""
+        endpoints = {}
+        for name in self.budgets:
+            rate, capacity = self.budget(name)
+            endpoints[name] = {
+                "rate_per_second": rate,
+                "burst": capacity,
+                **self.store.snapshot(name, rate, capacity),
+            }
+
+        quota: Dict[str, Any] = {"daily_quota": self.daily_quota or None}
+        used = self.store.used_today()
+        quota["used_today"] = used
+        if self.daily_quota:
+            now = time.localtime()
+            elapsed = now.tm_hour * 3600 + now.tm_min * 60 + now.tm_sec
+            projected = int(used * 86400 / elapsed) if elapsed else used
+            quota["remaining"] = max(0, self.daily_quota - used)
+            quota["projected_daily_usage"] = projected
+            # 현재 사용 속도가 유지될 때 할당량이 소진되기까지 남은 시간(초)
+            quota["seconds_until_exhausted"] = (
+                int(quota["remaining"] * elapsed / used) if used else None
+            )
+
+        return {
+            "endpoints": endpoints,
+            "quota": quota,
+            "waited": self.waited,
+            "shed": self.shed,
+            "max_wait": self.max_wait,
+        }
+
+
+def parse_budgets(spec: str) -> Dict[str, Tuple[float, float]]:
+    """'name=rate:burst,name=rate:burst' 형식의 예산 설정 파싱."""
+    budgets = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, value = item.partition("=")
+        rate, _, burst = value.partition(":")
+        budgets[name.strip()] = (float(rate), float(burst or rate))
+    return budgets
+
+
+def create_rate_limiter(endpoints: Dict[str, str]) -> RateLimiter:
+    """
+    환경 변수로 제한기 생성.
+
+    endpoints 는 설정용 짧은 이름 → 엔드포인트 경로 매핑이다.
+    BUSINFO_RATE_LIMITS 예: station_search=5:10,station_info=10:20
+    """
+    default_budget = (
+        float(os.getenv("BUSINFO_RATE_PER_SECOND", "10")),
+        float(os.getenv("BUSINFO_RATE_BURST", "20")),
+    )
+    overrides = parse_budgets(os.getenv("BUSINFO_RATE_LIMITS", ""))
+    budgets = {
+        path: overrides.get(name, default_budget) for name, path in endpoints.items()
+    }
+    store: BucketStore = MemoryBucketStore()
+    if os.getenv("BUSINFO_RATE_LIMIT_BACKEND", "memory").lower() == "sqlite":
+        store = SQLiteBucketStore(os.getenv("BUSINFO_RATE_LIMIT_PATH", "./rate_limit.db"))
+    return RateLimiter(
+        budgets,
+        store=store,
+        max_wait=float(os.getenv("BUSINFO_RATE_MAX_WAIT", "2.0")),
+        daily_quota=int(os.getenv("BUSINFO_DAILY_QUOTA", "0")),
+        default_budget=default_budget,
+    )
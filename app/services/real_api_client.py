@@ -1,108 +1,406 @@
 """경기도공공데이터 포털 실제 API 클라이언트."""
 
+import asyncio
 import httpx
+import math
 import os
-from typing import List, Dict, Any
-from datetime import datetime, timedelta
+import re
+from typing import List, Dict, Any, Optional
 import xml.etree.ElementTree as ET
 import logging
+import time
+from app.services import metrics
+from app.services.cache import TTLCache
+from app.services.cache_backend import CacheBackend, create_cache_backend, payload_key
+from app.services.rate_limit import RateLimitExceeded, create_rate_limiter
+from app.services.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    UpstreamError,
+    UpstreamUnavailableError,
+)
+from app.services.tiling import Tile, TileCoverage, initial_tiles
+from app.services import xml_stream
 
 logger = logging.getLogger(__name__)
 
+# GBIS 응답 헤더의 처리 결과 코드 (0: 정상, 4: 결과 없음, 그 외: 키/한도/시스템 오류)
+RESULT_CODE = re.compile(r"<resultCode>\s*(\d+)\s*</resultCode>")
+RESULT_OK = 0
+
+
+def result_code(body: str) -> Optional[int]:
+    """응답 원문의 resultCode (헤더가 없으면 None). 본문 앞부분만 검사한다."""
+    match = RESULT_CODE.search(body, 0, 2048)
+    return int(match.group(1)) if match else None
+
 
 class RealBusAPIClient:
-    """경기도공공데이터 포털 Open API 클라이언트."""
+    """경기도공공데이터 포털 Open API 클라이언트.
+    
+    하나의 ``httpx.AsyncClient`` 커넥션 풀을 재사용한다. 애플리케이션
+    lifespan 에서 ``start()`` / ``close()`` 를 호출하며, 시작 전에 호출되면
+    첫 요청 시 풀을 생성한다.
+    """
+    
+    STATION_SEARCH = "stationinfo/getStationByPolyline"
+    STATION_INFO = "stationinfo/getStationWithBusLisInfo"
+    ROUTE_INFO = "routeinfo/getRouteWithStationList"
     
-    def __init__(self):
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None,
+                 cache_backend: Optional[CacheBackend] = None):
         self.api_key = os.getenv("BUSINFO_API_KEY", "")
-        # 경기버스정보 API 엔드포인트
-        self.base_url = "http://openapi.gbis.go.kr/ws/rest"
+        # 경기버스정보 API 엔드포인트 (로컬 시뮬레이터/벤치마크용 가짜 서버로 교체 가능)
+        self.base_url = os.getenv(
+            "BUSINFO_GBIS_BASE_URL", "http://openapi.gbis.go.kr/ws/rest"
+        ).rstrip("/")
         self.timeout = 30.0
+        # 커넥션 풀 설정
+        self.max_connections = int(os.getenv("BUSINFO_MAX_CONNECTIONS", "20"))
+        self.max_keepalive_connections = int(
+            os.getenv("BUSINFO_MAX_KEEPALIVE_CONNECTIONS", "10")
+        )
+        self.keepalive_expiry = float(os.getenv("BUSINFO_KEEPALIVE_EXPIRY", "30"))
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        # 지역 조회 타일링 설정
+        self.search_radius = float(os.getenv("BUSINFO_SEARCH_RADIUS", "1000"))
+        self.page_size = int(os.getenv("BUSINFO_PAGE_SIZE", "100"))
+        self.max_tile_depth = int(os.getenv("BUSINFO_MAX_TILE_DEPTH", "4"))
+        self.max_concurrency = int(os.getenv("BUSINFO_MAX_CONCURRENCY", "8"))
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.tile_coverage = TileCoverage(
+            ttl=float(os.getenv("BUSINFO_TILE_TTL", "3600"))
+        )
+        # 정류소/노선 상세 응답 캐시 (엔드포인트별 TTL)
+        self.stop_info_cache = TTLCache(
+            maxsize=int(os.getenv("BUSINFO_STOP_CACHE_SIZE", "4096")),
+            ttl=float(os.getenv("BUSINFO_STOP_CACHE_TTL", "86400")),
+            cacheable=lambda info: bool(info.get("stationId")),
+        )
+        self.route_info_cache = TTLCache(
+            maxsize=int(os.getenv("BUSINFO_ROUTE_CACHE_SIZE", "1024")),
+            ttl=float(os.getenv("BUSINFO_ROUTE_CACHE_TTL", "86400")),
+            cacheable=lambda info: bool(info.get("routeId")),
+        )
+        # 응답 원문 캐시 백엔드 (재시작/워커 간 공유) 및 stale-while-revalidate 설정
+        self.cache_backend = cache_backend or create_cache_backend()
+        self.payload_ttl = {
+            self.STATION_SEARCH: self.tile_coverage.ttl,
+            self.STATION_INFO: self.stop_info_cache.ttl,
+            self.ROUTE_INFO: self.route_info_cache.ttl,
+        }
+        self.stale_ttl = float(os.getenv("BUSINFO_CACHE_STALE_TTL", "604800"))
+        self._revalidating: Dict[str, "asyncio.Task[Any]"] = {}
+        # 만료된 응답 원문 정리 주기 (초)
+        self.cache_purge_interval = float(os.getenv("BUSINFO_CACHE_PURGE_INTERVAL", "3600"))
+        self._last_purge: Optional[float] = None
+        # 재시도 및 엔드포인트별 서킷 브레이커
+        self.retry_policy = RetryPolicy(
+            max_attempts=int(os.getenv("BUSINFO_RETRY_ATTEMPTS", "3")),
+            base_delay=float(os.getenv("BUSINFO_RETRY_BASE_DELAY", "0.2")),
+            max_delay=float(os.getenv("BUSINFO_RETRY_MAX_DELAY", "2.0")),
+            retry_on=(httpx.TransportError, UpstreamError),
+            on_retry=self._on_retry,
+        )
+        self.breakers = {
+            endpoint: CircuitBreaker(
+                endpoint,
+                failure_threshold=int(os.getenv("BUSINFO_BREAKER_FAILURES", "5")),
+                recovery_timeout=float(os.getenv("BUSINFO_BREAKER_RESET", "30")),
+                on_state_change=self._on_breaker_state_change,
+            )
+            for endpoint in (self.STATION_SEARCH, self.STATION_INFO, self.ROUTE_INFO)
+        }
+        self.fallbacks = 0
+        # API 키 사용량 제한 (엔드포인트별 토큰 버킷)
+        self.rate_limiter = create_rate_limiter({
+            "station_search": self.STATION_SEARCH,
+            "station_info": self.STATION_INFO,
+            "route_info": self.ROUTE_INFO,
+        })
+        # XML 파싱 방식: tree (ET.fromstring) | stream (XMLPullParser 청크 파싱)
+        self.parse_mode = os.getenv("BUSINFO_PARSE_MODE", "tree").lower()
+    
+    async def start(self) -> None:
+        """공유 커넥션 풀 생성."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                transport=self._transport,
+            )
+    
+    async def close(self) -> None:
+        """백그라운드 갱신 취소 후 공유 커넥션 풀과 캐시 백엔드 종료."""
+        tasks = list(self._revalidating.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self.cache_backend is not None:
+            await self.cache_backend.close()
+
+    async def purge_cache(self) -> int:
+        """
+        stale_ttl 까지 지난 응답 원문 제거 (cache_purge_interval 마다 최대 1회).
+
+        어떤 엔드포인트에서도 더는 반환하지 않을 응답만 지우므로
+        가장 긴 신선도 TTL + stale_ttl 을 기준으로 한다.
+        """
+        now = time.monotonic()
+        if self.cache_backend is None or (
+            self._last_purge is not None and now - self._last_purge < self.cache_purge_interval
+        ):
+            return 0
+        self._last_purge = now
+        removed = await self.cache_backend.purge(max(self.payload_ttl.values()) + self.stale_ttl)
+        if removed:
+            logger.info(f"GBIS 응답 캐시 정리: {removed}건 제거")
+        return removed
+    
+    async def _get(self, endpoint: str, params: Dict[str, Any]) -> httpx.Response:
+        """공유 커넥션 풀로 GET 요청."""
+        await self.start()
+        in_flight = metrics.GBIS_IN_FLIGHT.labels(endpoint)
+        in_flight.inc()
+        status = "error"
+        start = time.perf_counter()
+        try:
+            response = await self._client.get(f"{self.base_url}/{endpoint}", params=params)
+            status = response.status_code
+            return response
+        finally:
+            in_flight.dec()
+            metrics.GBIS_REQUEST_SECONDS.labels(endpoint, status).observe(
+                time.perf_counter() - start
+            )
+    
+    async def _get_checked(self, endpoint: str, params: Dict[str, Any]) -> httpx.Response:
+        """토큰 획득 후 GET 요청, 재시도 대상 상태 코드(5xx, 429)는 예외로 변환."""
+        await self.rate_limiter.acquire(endpoint)
+        response = await self._get(endpoint, params)
+        if response.status_code >= 500 or response.status_code == 429:
+            raise UpstreamError(endpoint, response.status_code)
+        return response
+    
+    async def _fetch_xml(self, endpoint: str, params: Dict[str, Any]) -> Optional[str]:
+        """
+        응답 XML 원문 조회.
+        
+        캐시 백엔드에 신선한 응답이 있으면 그대로 사용하고, 신선도는 지났지만
+        stale_ttl 이내라면 오래된 응답을 즉시 반환하면서 백그라운드에서
+        갱신한다. 업스트림 장애(재시도 소진, 서킷 열림) 시에는 나이와 관계없이
+        캐시된 응답으로 대체하고, 캐시도 없으면 UpstreamUnavailableError 를
+        발생시킨다. 업스트림이 4xx 를 반환하면 None 을 반환한다.
+        """
+        key = payload_key(endpoint, params)
+        cached = None
+        if self.cache_backend is not None:
+            cached = await self.cache_backend.get(key)
+            if cached is not None:
+                fresh_ttl = self.payload_ttl.get(endpoint, 0)
+                if cached.age < fresh_ttl:
+                    metrics.GBIS_PAYLOAD_CACHE.labels(endpoint, "fresh").inc()
+                    return cached.body
+                if cached.age < fresh_ttl + self.stale_ttl:
+                    metrics.GBIS_PAYLOAD_CACHE.labels(endpoint, "stale").inc()
+                    self._revalidate(endpoint, params, key)
+                    return cached.body
+            metrics.GBIS_PAYLOAD_CACHE.labels(endpoint, "miss").inc()
+        try:
+            return await self._fetch_upstream(endpoint, params, key)
+        except UpstreamUnavailableError as e:
+            if cached is None:
+                raise
+            logger.warning(f"업스트림 장애로 캐시 응답 사용: {key} ({str(e)})")
+            self.fallbacks += 1
+            metrics.GBIS_PAYLOAD_CACHE.labels(endpoint, "fallback").inc()
+            return cached.body
+    
+    async def _fetch_upstream(self, endpoint: str, params: Dict[str, Any],
+                              key: str) -> Optional[str]:
+        """서킷 브레이커와 재시도를 거쳐 업스트림 호출 후 성공 응답을 저장."""
+        breaker = self.breakers[endpoint]
+        if not breaker.allow():
+            metrics.GBIS_CIRCUIT_REJECTED.labels(endpoint).inc()
+            raise CircuitOpenError(f"{endpoint} 서킷 브레이커 열림")
+        try:
+            response = await self.retry_policy.call(
+                lambda: self._get_checked(endpoint, params), name=endpoint
+            )
+        except (asyncio.CancelledError, RateLimitExceeded):
+            breaker.release()
+            raise
+        except Exception as e:
+            breaker.record_failure()
+            raise UpstreamUnavailableError(f"{endpoint} 조회 실패: {str(e)}") from e
+        breaker.record_success()
+        
+        if response.status_code != 200:
+            logger.warning(f"API 응답 오류: {endpoint} {response.status_code}")
+            return None
+        # 정상 처리된 응답만 저장 (결과 없음/키·한도 오류 응답이 캐시로 남지 않게)
+        code = result_code(response.text)
+        if code not in (None, RESULT_OK):
+            logger.warning(f"GBIS 처리 결과 코드 {code}: {key} (캐시하지 않음)")
+        elif self.cache_backend is not None:
+            await self.cache_backend.set(key, response.text)
+        return response.text
+    
+    def _on_breaker_state_change(self, endpoint: str, previous: str, state: str) -> None:
+        """서킷 브레이커 상태 전이 기록."""
+        logger.warning(f"서킷 브레이커 상태 변경: {endpoint} {previous} -> {state}")
+        metrics.GBIS_CIRCUIT_TRANSITIONS.labels(endpoint, previous, state).inc()
+    
+    def _on_retry(self, endpoint: str, outcome: str) -> None:
+        """재시도/재시도 소진 횟수 기록."""
+        metrics.GBIS_RETRIES.labels(endpoint, outcome).inc()
+    
+    def _revalidate(self, endpoint: str, params: Dict[str, Any], key: str) -> None:
+        """오래된 응답을 백그라운드에서 한 번만 갱신."""
+        if key in self._revalidating:
+            return
+        
+        async def refresh():
+            try:
+                await self._fetch_upstream(endpoint, params, key)
+            except Exception as e:
+                logger.warning(f"백그라운드 갱신 실패: {key} {str(e)}")
+        
+        task = asyncio.ensure_future(refresh())
+        self._revalidating[key] = task
+        task.add_done_callback(lambda _: self._revalidating.pop(key, None))
     
     async def get_stops_in_area(self, lat_min: float, lat_max: float, 
-                                lon_min: float, lon_max: float) -> List[Dict[str, Any]]:
+                                lon_min: float, lon_max: float,
+                                rows: Optional[int] = None,
+                                cols: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         특정 지역의 정류소 목록 조회.
         
         경기버스정보 API의 정류소검색 엔드포인트 사용.
+        영역을 최대 검색 반경 원으로 덮는 최소 그리드(또는 rows x cols)로
+        나누어 동시에 조회하고, 결과가 한 페이지를 가득 채운 타일만
+        사분할하여 다시 조회한다. 이미 조회한 타일은 TTL 동안 재사용한다.
         """
         try:
-            stops = []
+            tiles = initial_tiles(lat_min, lat_max, lon_min, lon_max,
+                                  self.search_radius, rows, cols)
+            area = Tile(lat_min, lat_max, lon_min, lon_max)
             
-            # 판교동 지역을 그리드로 나누어 조회
-            lat_step = (lat_max - lat_min) / 2
-            lon_step = (lon_max - lon_min) / 2
+            # 도착 순서대로 중복 제거하며 병합
+            unique_stops: Dict[str, Dict[str, Any]] = {}
             
-            for lat in [lat_min, lat_min + lat_step]:
-                for lon in [lon_min, lon_min + lon_step]:
-                    region_stops = await self._search_stops_by_coordinate(
-                        lat, lon
-                    )
-                    stops.extend(region_stops)
+            def merge(stops: List[Dict[str, Any]]) -> None:
+                for stop in stops:
+                    if area.contains(stop["latitude"], stop["longitude"]):
+                        unique_stops.setdefault(stop["stationId"], stop)
             
-            # 중복 제거
-            unique_stops = {stop["stationId"]: stop for stop in stops}
+            failed = await asyncio.gather(
+                *(self._crawl_tile(tile, merge) for tile in tiles)
+            )
+            if sum(failed) and not unique_stops:
+                raise UpstreamUnavailableError("정류소 검색 업스트림 조회 실패")
             return list(unique_stops.values())
             
+        except UpstreamUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"정류소 조회 오류: {str(e)}")
             return []
     
+    async def _crawl_tile(self, tile: Tile, merge) -> int:
+        """
+        타일 하나를 조회하고, 결과가 포화되면 하위 타일로 분할.
+        
+        조회에 실패한 타일 수를 반환한다.
+        """
+        stops = self.tile_coverage.get(tile)
+        if stops is None:
+            latitude, longitude = tile.center
+            async with self._semaphore:
+                stops = await self._search_stops_by_coordinate(
+                    latitude, longitude, radius=tile.radius_m
+                )
+            if stops is None:
+                return 1
+            saturated = len(stops) >= self.page_size
+            if saturated and tile.depth < self.max_tile_depth:
+                merge(stops)
+                failed = await asyncio.gather(
+                    *(self._crawl_tile(child, merge) for child in tile.split())
+                )
+                return sum(failed)
+            self.tile_coverage.mark(tile, stops)
+        merge(stops)
+        return 0
+    
     async def _search_stops_by_coordinate(self, latitude: float, 
-                                         longitude: float) -> List[Dict[str, Any]]:
+                                         longitude: float,
+                                         radius: Optional[float] = None
+                                         ) -> Optional[List[Dict[str, Any]]]:
         """
         좌표 기반 정류소 검색.
         
         API 엔드포인트: /stationinfo/getStationByPolyline
+        조회에 실패하면 None 을 반환한다.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                params = {
-                    "apiKey": self.api_key,
-                    "lat": latitude,
-                    "lon": longitude,
-                    "radius": 1000  # 반경 1km
-                }
-                
-                response = await client.get(
-                    f"{self.base_url}/stationinfo/getStationByPolyline",
-                    params=params
-                )
+            params = {
+                "apiKey": self.api_key,
+                "lat": latitude,
+                "lon": longitude,
+                "radius": int(math.ceil(radius or self.search_radius))
+            }
+            
+            xml_response = await self._fetch_xml(self.STATION_SEARCH, params)
+            
+            if xml_response is not None:
+                return self._parse_stop_response(xml_response)
+            else:
+                return None
                 
-                if response.status_code == 200:
-                    return self._parse_stop_response(response.text)
-                else:
-                    logger.warning(f"API 응답 오류: {response.status_code}")
-                    return []
-                    
         except Exception as e:
             logger.error(f"좌표 기반 검색 오류: {str(e)}")
-            return []
+            return None
     
     async def get_stop_info(self, station_id: str) -> Dict[str, Any]:
         """
         특정 정류소의 상세 정보 조회.
         
         API 엔드포인트: /stationinfo/getStationWithBusLisInfo
+        결과는 stop_info_cache 에 캐시된다.
         """
+        return await self.stop_info_cache.get_or_load(
+            station_id, lambda: self._fetch_stop_info(station_id)
+        )
+    
+    async def _fetch_stop_info(self, station_id: str) -> Dict[str, Any]:
+        """정류소 상세 정보 업스트림 조회."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                params = {
-                    "apiKey": self.api_key,
-                    "stationId": station_id
-                }
-                
-                response = await client.get(
-                    f"{self.base_url}/stationinfo/getStationWithBusLisInfo",
-                    params=params
-                )
+            params = {
+                "apiKey": self.api_key,
+                "stationId": station_id
+            }
+            
+            xml_response = await self._fetch_xml(self.STATION_INFO, params)
+            
+            if self._is_success(xml_response):
+                return self._parse_stop_info_response(xml_response)
+            else:
+                logger.warning(f"정류소 정보 조회 실패: {station_id}")
+                return {}
                 
-                if response.status_code == 200:
-                    return self._parse_stop_info_response(response.text)
-                else:
-                    logger.warning(f"정류소 정보 조회 실패: {station_id}")
-                    return {}
-                    
+        except UpstreamUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"정류소 정보 조회 오류: {str(e)}")
             return {}
@@ -112,32 +410,67 @@ class RealBusAPIClient:
         특정 노선의 상세 정보 조회.
         
         API 엔드포인트: /routeinfo/getRouteWithStationList
+        결과는 route_info_cache 에 캐시된다.
         """
+        return await self.route_info_cache.get_or_load(
+            route_id, lambda: self._fetch_route_info(route_id)
+        )
+    
+    async def _fetch_route_info(self, route_id: str) -> Dict[str, Any]:
+        """노선 상세 정보 업스트림 조회."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                params = {
-                    "apiKey": self.api_key,
-                    "routeId": route_id
-                }
-                
-                response = await client.get(
-                    f"{self.base_url}/routeinfo/getRouteWithStationList",
-                    params=params
-                )
+            params = {
+                "apiKey": self.api_key,
+                "routeId": route_id
+            }
+            
+            xml_response = await self._fetch_xml(self.ROUTE_INFO, params)
+            
+            if self._is_success(xml_response):
+                return self._parse_route_response(xml_response)
+            else:
+                logger.warning(f"노선 정보 조회 실패: {route_id}")
+                return {}
                 
-                if response.status_code == 200:
-                    return self._parse_route_response(response.text)
-                else:
-                    return {}
-                    
+        except UpstreamUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"노선 정보 조회 오류: {str(e)}")
             return {}
     
+    @staticmethod
+    def _is_success(xml_response: Optional[str]) -> bool:
+        """응답이 있고 resultCode 가 정상(또는 헤더 없음)인지 여부."""
+        return xml_response is not None and result_code(xml_response) in (None, RESULT_OK)
+    
+    def resilience_stats(self) -> Dict[str, Any]:
+        """재시도, 캐시 대체, 서킷 브레이커 상태 통계."""
+        return {
+            "retry": self.retry_policy.stats(),
+            "fallbacks": self.fallbacks,
+            "circuit_breakers": {
+                endpoint: breaker.stats() for endpoint, breaker in self.breakers.items()
+            },
+        }
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """엔드포인트별 캐시 통계."""
+        return {
+            "stop_info": self.stop_info_cache.stats(),
+            "route_info": self.route_info_cache.stats(),
+            "tiles": {"size": len(self.tile_coverage)},
+        }
+    
+    @metrics.timed(metrics.XML_PARSE_SECONDS.labels("station_list"))
     def _parse_stop_response(self, xml_response: str) -> List[Dict[str, Any]]:
         """XML 응답을 파싱하여 정류소 목록 반환."""
         stops = []
         try:
+            if self.parse_mode == "stream":
+                for stop in xml_stream.parse_stop_list(xml_stream.iter_chunks(xml_response)):
+                    stops.append(stop)
+                return stops
+            
             root = ET.fromstring(xml_response)
             
             for item in root.findall(".//busStationList"):
@@ -156,9 +489,14 @@ class RealBusAPIClient:
         
         return stops
     
+    @metrics.timed(metrics.XML_PARSE_SECONDS.labels("station_info"))
     def _parse_stop_info_response(self, xml_response: str) -> Dict[str, Any]:
         """정류소 상세 정보 XML 파싱."""
         try:
+            if self.parse_mode == "stream":
+                station_info = xml_stream.parse_stop_info(xml_stream.iter_chunks(xml_response))
+                return station_info if station_info["stationId"] else {}
+            
             root = ET.fromstring(xml_response)
             
             station_info = {
@@ -178,15 +516,21 @@ class RealBusAPIClient:
                 })
             station_info["routes"] = routes
             
-            return station_info
+            # 정류소 ID 가 없으면 결과 없음 (빈 필드 dict 가 캐시/응답되지 않게)
+            return station_info if station_info["stationId"] else {}
             
         except Exception as e:
             logger.error(f"정류소 정보 파싱 오류: {str(e)}")
             return {}
     
+    @metrics.timed(metrics.XML_PARSE_SECONDS.labels("route"))
     def _parse_route_response(self, xml_response: str) -> Dict[str, Any]:
         """노선 정보 XML 파싱."""
         try:
+            if self.parse_mode == "stream":
+                route_info = xml_stream.parse_route(xml_stream.iter_chunks(xml_response))
+                return route_info if route_info["routeId"] else {}
+            
             root = ET.fromstring(xml_response)
             
             route_info = {
@@ -207,7 +551,8 @@ class RealBusAPIClient:
                 })
             route_info["stations"] = stations
             
-            return route_info
+            # 노선 ID 가 없으면 결과 없음
+            return route_info if route_info["routeId"] else {}
             
         except Exception as e:
             logger.error(f"노선 정보 파싱 오류: {str(e)}")
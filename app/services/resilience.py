@@ -0,0 +1,151 @@
+"""업스트림 호출용 재시도 정책과 서킷 브레이커."""
+
+import asyncio
+import random
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
+
+
+class UpstreamError(Exception):
+    """업스트림이 재시도 가능한 오류 상태(5xx, 429)를 반환함."""
+
+    def __init__(self, endpoint: str, status_code: int):
+        super().__init__(f"{endpoint} 응답 오류: {status_code}")
+        self.endpoint = endpoint
+        self.status_code = status_code
+
+
+class UpstreamUnavailableError(Exception):
+    """재시도 후에도 업스트림 조회에 실패했고 대체할 캐시도 없음."""
+
+
+class CircuitOpenError(UpstreamUnavailableError):
+    """서킷 브레이커가 열려 있어 호출하지 않음."""
+
+
+class RetryPolicy:
+    """
+    지터가 적용된 지수 백오프 재시도 (멱등 요청 전용).
+
+    on_retry 가 주어지면 재시도할 때 (name, "retry"), 재시도를 소진했을 때
+    (name, "exhausted") 로 호출한다. name 은 call() 에 넘긴 호출 이름이다.
+    """
+
+    RETRY = "retry"
+    EXHAUSTED = "exhausted"
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.2,
+                 max_delay: float = 2.0,
+                 retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+                 on_retry: Optional[Callable[[str, str], None]] = None):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = retry_on
+        self.on_retry = on_retry
+        self.retries = 0
+        self.exhausted = 0
+
+    def backoff(self, attempt: int) -> float:
+        """attempt 번째 재시도 전 대기 시간 (full jitter)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    async def call(self, func: Callable[[], Awaitable[Any]], name: str = "") -> Any:
+        """재시도 가능한 예외가 나면 백오프 후 다시 호출."""
+        for attempt in range(self.max_attempts):
+            try:
+                return await func()
+            except self.retry_on:
+                if attempt + 1 >= self.max_attempts:
+                    self.exhausted += 1
+                    self._notify(name, self.EXHAUSTED)
+                    raise
+                self.retries += 1
+                self._notify(name, self.RETRY)
+                await asyncio.sleep(self.backoff(attempt))
+
+    def _notify(self, name: str, outcome: str) -> None:
+        if self.on_retry is not None:
+            self.on_retry(name, outcome)
+
+    def stats(self) -> Dict[str, int]:
+        """재시도 카운터."""
+        return {"retries": self.retries, "exhausted": self.exhausted}
+
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 서킷 브레이커.
+
+    closed → (failure_threshold 회 연속 실패) → open
+    open → (recovery_timeout 경과) → half_open: 시험 호출 한 번 허용
+    half_open → 성공 시 closed, 실패 시 다시 open
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int = 5,
+                 recovery_timeout: float = 30.0,
+                 on_state_change: Optional[Callable[[str, str, str], None]] = None):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.on_state_change = on_state_change
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self.transitions: Counter = Counter()
+        self.rejected = 0
+
+    def _transition(self, state: str) -> None:
+        if state == self.state:
+            return
+        previous, self.state = self.state, state
+        self.transitions[f"{previous}->{state}"] += 1
+        if self.on_state_change is not None:
+            self.on_state_change(self.name, previous, state)
+
+    def allow(self) -> bool:
+        """호출 허용 여부."""
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                self.rejected += 1
+                return False
+            self._transition(self.HALF_OPEN)
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                self.rejected += 1
+                return False
+            self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """호출 성공 기록."""
+        self.failures = 0
+        self._trial_in_flight = False
+        self._transition(self.CLOSED)
+
+    def record_failure(self) -> None:
+        """호출 실패 기록."""
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self._transition(self.OPEN)
+
+    def release(self) -> None:
+        """결과 없이 취소된 호출의 시험 슬롯 반환."""
+        self._trial_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 상태와 상태 전이 카운터."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "rejected": self.rejected,
+            "transitions": dict(self.transitions),
+        }
@@ -0,0 +1,440 @@
+"""이용자 데이터 롤업 테이블 관리.
+
+``ridership_data`` 원시 행(정류소 × 날짜 × 시간)으로부터 일간/주간/시간대
+프로필 집계를 유지한다. 새 원시 행이 들어오면 영향을 받은 (정류소, 날짜)
+버킷만 다시 계산하고, 주간 집계와 시간대 프로필은 그 차이만 반영한다.
+
+``RollupSession`` 으로 ``RidershipData`` 를 추가/수정/삭제하면 커밋 직전에
+자동으로 갱신된다. 일반 ``Session`` 에는 이벤트를 걸지 않으므로 그 밖의 쓰기
+경로는 ``ingest_ridership``/``replace_ridership`` 이나 ``refresh_rollups`` 를
+직접 호출한다.
+"""
+
+from datetime import date as date_type, datetime, timedelta
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, event, func, inspect, insert, select
+from sqlalchemy.orm import Session
+
+from app.database.models import (
+    BusStop,
+    RidershipDaily,
+    RidershipData,
+    RidershipHourlyProfile,
+    RidershipWeekly,
+)
+from app.services.aggregation import load_cube
+
+Bucket = Tuple[str, date_type]
+
+_PENDING_KEY = "ridership_rollup_buckets"
+
+
+def _as_date(value: Any) -> date_type:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date_type):
+        return value
+    return date_type.fromisoformat(str(value))
+
+
+def week_start(value: Any) -> date_type:
+    """날짜가 속한 주의 월요일."""
+    day = _as_date(value)
+    return day - timedelta(days=day.weekday())
+
+
+def _hourly_counts(db: Session, station_id: str, date: date_type) -> Optional[Tuple[int, List[int]]]:
+    """원시 행에서 (일 합계, 24시간 분포) 계산, 데이터가 없으면 None."""
+    rows = db.execute(
+        select(RidershipData.hour, func.sum(RidershipData.passenger_count))
+        .where(RidershipData.station_id == station_id, RidershipData.date == date)
+        .group_by(RidershipData.hour)
+    ).all()
+    if not rows:
+        return None
+    total = 0
+    hourly = [0] * 24
+    for hour, count in rows:
+        count = count or 0
+        total += count
+        if hour is not None and 0 <= hour < 24:
+            hourly[hour] += count
+    return total, hourly
+
+
+def refresh_rollups(db: Session, buckets: Iterable[Tuple[str, Any]]) -> int:
+    """
+    영향을 받은 (정류소, 날짜) 버킷의 롤업 재계산.
+
+    일간 집계는 해당 날짜의 원시 행으로 다시 만들고, 시간대 프로필은
+    이전 일간 분포와의 차이만 더하며, 주간 집계는 해당 주의 일간 집계
+    최대 7행으로 다시 계산한다. 재계산한 버킷 수를 반환한다.
+    """
+    buckets = sorted({(station_id, _as_date(date)) for station_id, date in buckets})
+    if not buckets:
+        return 0
+
+    profiles: Dict[str, Dict[int, RidershipHourlyProfile]] = {}
+    weeks: Set[Bucket] = set()
+
+    for station_id, date in buckets:
+        computed = _hourly_counts(db, station_id, date)
+        daily = db.execute(
+            select(RidershipDaily)
+            .where(RidershipDaily.station_id == station_id, RidershipDaily.date == date)
+        ).scalar_one_or_none()
+        old_hourly = list(daily.hourly_counts) if daily is not None else None
+
+        if computed is None:
+            if daily is not None:
+                db.delete(daily)
+            new_hourly = None
+        else:
+            total, new_hourly = computed
+            peak_count = max(new_hourly)
+            if daily is None:
+                daily = RidershipDaily(station_id=station_id, date=date)
+                db.add(daily)
+            daily.total_count = total
+            daily.hourly_counts = new_hourly
+            daily.peak_count = peak_count
+            daily.peak_hour = new_hourly.index(peak_count) if peak_count else None
+
+        # 시간대 프로필에 차이만 반영
+        if old_hourly != new_hourly:
+            if station_id not in profiles:
+                profiles[station_id] = {
+                    row.hour: row
+                    for row in db.execute(
+                        select(RidershipHourlyProfile)
+                        .where(RidershipHourlyProfile.station_id == station_id)
+                    ).scalars()
+                }
+            station_profile = profiles[station_id]
+            day_delta = (new_hourly is not None) - (old_hourly is not None)
+            for hour in range(24):
+                count_delta = ((new_hourly[hour] if new_hourly else 0)
+                               - (old_hourly[hour] if old_hourly else 0))
+                if not count_delta and not day_delta:
+                    continue
+                profile = station_profile.get(hour)
+                if profile is None:
+                    profile = RidershipHourlyProfile(
+                        station_id=station_id, hour=hour, total_count=0, days=0
+                    )
+                    db.add(profile)
+                    station_profile[hour] = profile
+                profile.total_count += count_delta
+                profile.days += day_delta
+
+        weeks.add((station_id, week_start(date)))
+
+    db.flush()
+
+    for station_id, start in weeks:
+        end = start + timedelta(days=6)
+        total, days = db.execute(
+            select(func.sum(RidershipDaily.total_count), func.count())
+            .where(RidershipDaily.station_id == station_id,
+                   RidershipDaily.date >= start, RidershipDaily.date <= end)
+        ).one()
+        weekly = db.execute(
+            select(RidershipWeekly)
+            .where(RidershipWeekly.station_id == station_id,
+                   RidershipWeekly.week_start == start)
+        ).scalar_one_or_none()
+        if not days:
+            if weekly is not None:
+                db.delete(weekly)
+            continue
+        if weekly is None:
+            weekly = RidershipWeekly(station_id=station_id, week_start=start)
+            db.add(weekly)
+        weekly.total_count = total or 0
+        weekly.days = days
+
+    db.flush()
+    return len(buckets)
+
+
+def ingest_ridership(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    원시 이용자 행 대량 삽입 후 영향받은 버킷만 롤업 갱신.
+
+    rows: station_id, date, hour, passenger_count 키를 가진 dict 목록
+    """
+    if not rows:
+        return 0
+    rows = [{**row, "date": _as_date(row["date"])} for row in rows]
+    db.execute(insert(RidershipData), rows)
+    return refresh_rollups(db, {(row["station_id"], row["date"]) for row in rows})
+
+
+def replace_ridership(db: Session, rows: List[Dict[str, Any]]) -> int:
+    """
+    행이 속한 (정류소, 날짜) 버킷의 원시 행을 새 행으로 교체 후 롤업 갱신.
+
+    같은 기간을 반복 수집해도 원시 행이 중복되지 않는다.
+    """
+    if not rows:
+        return 0
+    rows = [{**row, "date": _as_date(row["date"])} for row in rows]
+    dates_by_station: Dict[str, Set[date_type]] = {}
+    for row in rows:
+        dates_by_station.setdefault(row["station_id"], set()).add(row["date"])
+    for station_id, dates in dates_by_station.items():
+        db.execute(
+            delete(RidershipData)
+            .where(RidershipData.station_id == station_id, RidershipData.date.in_(dates))
+        )
+    return ingest_ridership(db, rows)
+
+
+def rebuild_rollups(db: Session, batch_size: int = 5000) -> int:
+    """
+    원시 데이터 전체로부터 롤업을 한 번의 정렬 스캔으로 재생성.
+
+    마이그레이션이나 복구용이며, 평소에는 refresh_rollups 로 증분 갱신한다.
+    생성한 일간 집계 행 수를 반환한다.
+    """
+    for model in (RidershipDaily, RidershipWeekly, RidershipHourlyProfile):
+        db.execute(model.__table__.delete())
+
+    weekly: Dict[Bucket, List[int]] = {}
+    profile: Dict[Tuple[str, int], List[int]] = {}
+    daily_rows: List[Dict[str, Any]] = []
+    created = 0
+
+    def flush_daily() -> None:
+        if daily_rows:
+            db.execute(insert(RidershipDaily), daily_rows)
+            daily_rows.clear()
+
+    def close_day(station_id: str, day: date_type, total: int, hourly: List[int]) -> None:
+        nonlocal created
+        peak_count = max(hourly)
+        daily_rows.append({
+            "station_id": station_id,
+            "date": day,
+            "total_count": total,
+            "peak_hour": hourly.index(peak_count) if peak_count else None,
+            "peak_count": peak_count,
+            "hourly_counts": hourly,
+            "updated_at": datetime.utcnow(),
+        })
+        created += 1
+        week = weekly.setdefault((station_id, week_start(day)), [0, 0])
+        week[0] += total
+        week[1] += 1
+        for hour in range(24):
+            entry = profile.setdefault((station_id, hour), [0, 0])
+            entry[0] += hourly[hour]
+            entry[1] += 1
+        if len(daily_rows) >= batch_size:
+            flush_daily()
+
+    current: Optional[Bucket] = None
+    total, hourly = 0, [0] * 24
+    for station_id, day, hour, count in db.execute(
+        select(RidershipData.station_id, RidershipData.date, RidershipData.hour,
+               func.sum(RidershipData.passenger_count))
+        .group_by(RidershipData.station_id, RidershipData.date, RidershipData.hour)
+        .order_by(RidershipData.station_id, RidershipData.date)
+    ):
+        day = _as_date(day)
+        if current != (station_id, day):
+            if current is not None:
+                close_day(*current, total, hourly)
+            current, total, hourly = (station_id, day), 0, [0] * 24
+        count = count or 0
+        total += count
+        if hour is not None and 0 <= hour < 24:
+            hourly[hour] += count
+    if current is not None:
+        close_day(*current, total, hourly)
+    flush_daily()
+
+    now = datetime.utcnow()
+    if weekly:
+        db.execute(insert(RidershipWeekly), [
+            {"station_id": station_id, "week_start": start, "total_count": total,
+             "days": days, "updated_at": now}
+            for (station_id, start), (total, days) in weekly.items()
+        ])
+    if profile:
+        db.execute(insert(RidershipHourlyProfile), [
+            {"station_id": station_id, "hour": hour, "total_count": total,
+             "days": days, "updated_at": now}
+            for (station_id, hour), (total, days) in profile.items()
+        ])
+    return created
+
+
+class RollupSession(Session):
+    """커밋 직전에 ORM 으로 바뀐 ``RidershipData`` 의 롤업을 갱신하는 세션.
+
+    비동기 세션은 ``async_sessionmaker(..., sync_session_class=RollupSession)``.
+    """
+
+
+def _ridership_changes(objects: Iterable[Any]) -> List[RidershipData]:
+    return [obj for obj in objects if isinstance(obj, RidershipData)]
+
+
+@event.listens_for(RollupSession, "after_flush")
+def _collect_ridership_buckets(session: Session, flush_context) -> None:
+    """ORM 으로 변경된 원시 행의 버킷 기록 (변경 전 버킷 포함)."""
+    changed = _ridership_changes(chain(session.new, session.dirty, session.deleted))
+    if not changed:
+        return
+    buckets = session.info.setdefault(_PENDING_KEY, set())
+    for obj in changed:
+        buckets.add((obj.station_id, obj.date))
+        state = inspect(obj)
+        old_station = state.attrs.station_id.history.deleted
+        old_date = state.attrs.date.history.deleted
+        if old_station or old_date:
+            buckets.add((
+                old_station[0] if old_station else obj.station_id,
+                old_date[0] if old_date else obj.date,
+            ))
+
+
+@event.listens_for(RollupSession, "before_commit")
+def _refresh_pending_rollups(session: Session) -> None:
+    """커밋 직전에 누적된 버킷의 롤업 갱신."""
+    # 아직 flush 되지 않은 원시 행 변경이 있을 때만 먼저 flush
+    if _ridership_changes(chain(session.new, session.dirty, session.deleted)):
+        session.flush()
+    buckets = session.info.pop(_PENDING_KEY, None)
+    if buckets:
+        refresh_rollups(session, buckets)
+
+
+@event.listens_for(RollupSession, "after_rollback")
+def _discard_pending_rollups(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _stop_names(db: Session, station_ids: Iterable[str]) -> Dict[str, str]:
+    return dict(db.execute(
+        select(BusStop.station_id, BusStop.station_name)
+        .where(BusStop.station_id.in_(list(station_ids)))
+    ).all())
+
+
+def _daily_dict(row: Any) -> Dict[str, Any]:
+    """RidershipDaily 행(또는 같은 컬럼을 가진 Row)을 DailyRidership dict 로 변환."""
+    return {
+        "date": row.date.isoformat(),
+        "stop_id": row.station_id,
+        "passenger_count": row.total_count,
+        "peak_hour": row.peak_hour,
+    }
+
+
+def load_recent_week(db: Session, station_id: str, days: int = 7) -> Optional[Dict[str, Any]]:
+    """정류소의 최근 days 일 일간 집계 (최신순), 없으면 None."""
+    rows = db.execute(
+        select(RidershipDaily)
+        .where(RidershipDaily.station_id == station_id)
+        .order_by(RidershipDaily.date.desc())
+        .limit(days)
+    ).scalars().all()
+    if not rows:
+        return None
+    total = sum(row.total_count for row in rows)
+    return {
+        "stop_id": station_id,
+        "stop_name": _stop_names(db, [station_id]).get(station_id),
+        "week_data": [_daily_dict(row) for row in rows],
+        "total_count": total,
+        "average_daily": total // len(rows),
+    }
+
+
+def station_version(db: Session, station_id: str) -> Optional[Tuple[Any, ...]]:
+    """
+    정류소 일간 집계의 버전 (행 수, 최대 updated_at, 정류소 updated_at).
+
+    load_recent_week 결과가 바뀌면 버전도 바뀐다. 일간 집계가 없으면 None.
+    """
+    count, last_updated = db.execute(
+        select(func.count(), func.max(RidershipDaily.updated_at))
+        .where(RidershipDaily.station_id == station_id)
+    ).one()
+    if not count:
+        return None
+    stop_updated = db.execute(
+        select(BusStop.updated_at).where(BusStop.station_id == station_id)
+    ).scalar()
+    return count, last_updated, stop_updated
+
+
+def latest_week_start(db: Session) -> Optional[date_type]:
+    """주간 집계가 있는 가장 최근 주."""
+    return db.execute(select(func.max(RidershipWeekly.week_start))).scalar()
+
+
+def load_top_weekly(db: Session, limit: int) -> List[Dict[str, Any]]:
+    """가장 최근 주의 주간 이용자 수 상위 정류소."""
+    start = latest_week_start(db)
+    if start is None or limit <= 0:
+        return []
+    # ORM 객체 대신 필요한 컬럼만 조회
+    top = db.execute(
+        select(RidershipWeekly.station_id, RidershipWeekly.total_count, RidershipWeekly.days)
+        .where(RidershipWeekly.week_start == start)
+        .order_by(RidershipWeekly.total_count.desc())
+        .limit(limit)
+    ).all()
+    station_ids = [row.station_id for row in top]
+    end = start + timedelta(days=6)
+    week_data: Dict[str, List[Dict[str, Any]]] = {station_id: [] for station_id in station_ids}
+    for row in db.execute(
+        select(RidershipDaily.station_id, RidershipDaily.date,
+               RidershipDaily.total_count, RidershipDaily.peak_hour)
+        .where(RidershipDaily.station_id.in_(station_ids),
+               RidershipDaily.date >= start, RidershipDaily.date <= end)
+        .order_by(RidershipDaily.date.desc())
+    ):
+        week_data[row.station_id].append(_daily_dict(row))
+    names = _stop_names(db, station_ids)
+    return [
+        {
+            "stop_id": row.station_id,
+            "stop_name": names.get(row.station_id),
+            "week_data": week_data[row.station_id],
+            "total_count": row.total_count,
+            "average_daily": row.total_count // row.days if row.days else 0,
+        }
+        for row in top
+    ]
+
+
+def load_weekly_summary(db: Session) -> Optional[Dict[str, Any]]:
+    """가장 최근 주의 전체 정류소 요약 (일간 롤업 큐브 기준)."""
+    start = latest_week_start(db)
+    if start is None:
+        return None
+    cube = load_cube(db, start, start + timedelta(days=6))
+    return cube.summary(_stop_names(db, cube.station_ids), f"Week of {start.isoformat()}")
+
+
+def load_hourly_profile(db: Session, station_id: str) -> List[Dict[str, Any]]:
+    """정류소의 시간대별 평균 이용자 수."""
+    rows = db.execute(
+        select(RidershipHourlyProfile)
+        .where(RidershipHourlyProfile.station_id == station_id)
+        .order_by(RidershipHourlyProfile.hour)
+    ).scalars()
+    return [
+        {
+            "hour": row.hour,
+            "total_count": row.total_count,
+            "average": round(row.total_count / row.days, 2) if row.days else 0.0,
+        }
+        for row in rows
+    ]
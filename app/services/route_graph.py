@@ -0,0 +1,189 @@
+"""노선/정류소 그래프와 환승 경로 탐색.
+
+정류소 ID 를 정수로 바꾸고 노선마다 경유 정류소 정수 배열을, 정류소마다
+(노선, 위치) 쌍을 평탄하게 이어 붙인 배열을 둔다. 노선 하나가 바뀌면 그
+노선 배열과 경유 정류소들의 배열만 고치므로 전체를 다시 만들지 않는다.
+
+경로 탐색은 RAPTOR 방식의 라운드 탐색이다. k 번째 라운드는 노선 k 개
+(환승 k-1 회)로 도달할 수 있는 정류소별 최소 이동 정류소 수를 구하고,
+목적지의 정류소 수가 이전 라운드보다 줄어든 라운드만 결과로 남겨
+(환승 수, 정류소 수) 기준 파레토 최적 경로를 돌려준다.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+INF = 2 ** 62
+
+# (노선 슬롯, 승차 정류소, 승차 위치, 하차 위치)
+Parent = Tuple[int, int, int, int]
+
+
+class RouteGraph:
+    """노선 그래프. 이벤트 루프 안에서만 수정/조회한다고 가정한다."""
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self) -> None:
+        self._stop_ids: List[str] = []
+        self._stop_names: List[str] = []
+        self._stop_index: Dict[str, int] = {}
+        self._route_ids: List[Optional[str]] = []
+        self._route_names: List[str] = []
+        self._route_index: Dict[str, int] = {}
+        self._route_stops: List[array] = []
+        self._stop_routes: List[array] = []
+        self.version = getattr(self, "version", -1) + 1
+
+    def __contains__(self, station_id: str) -> bool:
+        index = self._stop_index.get(station_id)
+        return index is not None and len(self._stop_routes[index]) > 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "routes": len(self._route_index),
+            "stops": sum(1 for pairs in self._stop_routes if pairs),
+            "edges": sum(max(len(stops) - 1, 0) for stops in self._route_stops),
+            "version": self.version,
+        }
+
+    def _intern_stop(self, station_id: str, station_name: str) -> int:
+        index = self._stop_index.get(station_id)
+        if index is None:
+            index = self._stop_index[station_id] = len(self._stop_ids)
+            self._stop_ids.append(station_id)
+            self._stop_names.append(station_name)
+            self._stop_routes.append(array("q"))
+        elif station_name:
+            self._stop_names[index] = station_name
+        return index
+
+    def _detach(self, slot: int) -> None:
+        for stop in set(self._route_stops[slot]):
+            pairs = self._stop_routes[stop]
+            kept = array("q")
+            for i in range(0, len(pairs), 2):
+                if pairs[i] != slot:
+                    kept.append(pairs[i])
+                    kept.append(pairs[i + 1])
+            self._stop_routes[stop] = kept
+        self._route_stops[slot] = array("q")
+
+    def update_route(self, route_id: str, route_name: str,
+                     stations: Sequence[Tuple[str, str]]) -> None:
+        """노선의 경유 정류소 (station_id, station_name) 순서를 교체."""
+        slot = self._route_index.get(route_id)
+        if slot is None:
+            slot = self._route_index[route_id] = len(self._route_ids)
+            self._route_ids.append(route_id)
+            self._route_names.append(route_name)
+            self._route_stops.append(array("q"))
+        else:
+            self._detach(slot)
+            self._route_names[slot] = route_name
+        stops = array("q", (self._intern_stop(station_id, name) for station_id, name in stations))
+        self._route_stops[slot] = stops
+        for position, stop in enumerate(stops):
+            self._stop_routes[stop].extend((slot, position))
+        self.version += 1
+
+    def remove_route(self, route_id: str) -> None:
+        slot = self._route_index.pop(route_id, None)
+        if slot is not None:
+            self._detach(slot)
+            self._route_ids[slot] = None
+            self.version += 1
+
+    def load(self, routes: Iterable[Tuple[str, str, Sequence[Tuple[str, str]]]]) -> int:
+        """(route_id, route_name, stations) 목록으로 그래프 전체 생성."""
+        self._reset()
+        for route_id, route_name, stations in routes:
+            self.update_route(route_id, route_name, stations)
+        return len(self._route_index)
+
+    def plan(self, origin: str, destination: str, max_transfers: int = 2) -> List[Dict[str, Any]]:
+        """
+        origin → destination 경로 목록 (환승 수 오름차순).
+
+        뒤에 오는 경로일수록 환승은 많지만 이동 정류소 수는 적다.
+        """
+        source = self._stop_index.get(origin)
+        target = self._stop_index.get(destination)
+        if source is None or target is None or source == target:
+            return []
+
+        best = [INF] * len(self._stop_ids)
+        best[source] = 0
+        labels: List[List[int]] = [list(best)]
+        parents: List[Dict[int, Parent]] = [{}]
+        marked = {source}
+        itineraries = []
+
+        for rounds in range(1, max_transfers + 2):
+            previous = labels[-1]
+            current = list(previous)
+            round_parents: Dict[int, Parent] = {}
+
+            # 이번 라운드에 탈 노선과 가장 앞선 승차 위치
+            queue: Dict[int, int] = {}
+            for stop in marked:
+                pairs = self._stop_routes[stop]
+                for i in range(0, len(pairs), 2):
+                    slot, position = pairs[i], pairs[i + 1]
+                    if position < queue.get(slot, INF):
+                        queue[slot] = position
+            marked = set()
+
+            for slot, start in queue.items():
+                stops = self._route_stops[slot]
+                base, board, board_stop = INF, -1, -1
+                for position in range(start, len(stops)):
+                    stop = stops[position]
+                    if board >= 0:
+                        cost = base + position
+                        if cost < best[stop] and cost < best[target]:
+                            best[stop] = current[stop] = cost
+                            round_parents[stop] = (slot, board_stop, board, position)
+                            marked.add(stop)
+                    if previous[stop] < INF and previous[stop] - position < base:
+                        base, board, board_stop = previous[stop] - position, position, stop
+
+            labels.append(current)
+            parents.append(round_parents)
+            if current[target] < previous[target]:
+                itineraries.append(self._itinerary(parents, rounds, source, target))
+            if not marked:
+                break
+        return itineraries
+
+    def _itinerary(self, parents: List[Dict[int, Parent]], rounds: int,
+                   source: int, target: int) -> Dict[str, Any]:
+        legs = []
+        stop = target
+        while stop != source:
+            while stop not in parents[rounds]:
+                rounds -= 1
+            slot, board_stop, board, alight = parents[rounds][stop]
+            legs.append(self._leg(slot, board, alight))
+            stop = board_stop
+            rounds -= 1
+        legs.reverse()
+        return {
+            "transfers": len(legs) - 1,
+            "stops": sum(leg["stop_count"] for leg in legs),
+            "legs": legs,
+        }
+
+    def _leg(self, slot: int, board: int, alight: int) -> Dict[str, Any]:
+        stops = self._route_stops[slot][board:alight + 1]
+        return {
+            "route_id": self._route_ids[slot],
+            "route_name": self._route_names[slot],
+            "board_stop_id": self._stop_ids[stops[0]],
+            "board_stop_name": self._stop_names[stops[0]],
+            "alight_stop_id": self._stop_ids[stops[-1]],
+            "alight_stop_name": self._stop_names[stops[-1]],
+            "stop_count": alight - board,
+            "stations": [self._stop_ids[stop] for stop in stops],
+        }
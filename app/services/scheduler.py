@@ -0,0 +1,300 @@
+"""인프로세스 asyncio 수집 스케줄러.
+
+애플리케이션 lifespan 에서 시작되어 등록된 수집 작업을 주기(± 지터)마다
+실행한다. 여러 워커가 같은 DB 를 쓰더라도 ``ingestion_state`` 행의 임대
+(owner, lease_until)를 조건부 UPDATE 로 잡은 워커 하나만 작업을 실행한다.
+작업은 처리 단위마다 체크포인트를 저장하며(임대 연장 겸), 중단되거나
+실패한 실행은 다음 실행이 체크포인트부터 이어서 진행한다.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.exc import IntegrityError
+
+from app.database.models import IngestionState
+from app.services import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseLostError(RuntimeError):
+    """실행 중 다른 워커가 만료된 임대를 가져감."""
+
+
+class JobContext:
+    """작업 함수에 전달되는 실행 컨텍스트."""
+
+    def __init__(self, scheduler: "IngestionScheduler", name: str,
+                 checkpoint: Optional[Dict[str, Any]]):
+        self.name = name
+        self.checkpoint: Dict[str, Any] = dict(checkpoint or {})
+        self._scheduler = scheduler
+
+    @property
+    def resumed(self) -> bool:
+        """이전 실행의 체크포인트에서 이어서 실행하는지 여부."""
+        return bool(self.checkpoint)
+
+    def session(self):
+        """새 AsyncSession (async with 로 사용)."""
+        return self._scheduler.sessions()
+
+    async def save(self, **checkpoint: Any) -> None:
+        """체크포인트 갱신 후 저장하고 임대 연장 (워커 로컬 작업은 메모리에만 반영)."""
+        self.checkpoint.update(checkpoint)
+        if self.name not in self._scheduler.local:
+            await self._scheduler._save_checkpoint(self.name, self.checkpoint)
+
+
+JobFunc = Callable[[JobContext], Awaitable[int]]
+
+
+class IngestionScheduler:
+    """
+    주기 수집 작업 실행기.
+
+    작업 함수는 JobContext 를 받아 변경된 항목 수를 반환한다.
+    """
+
+    def __init__(self, sessions, interval: Optional[float] = None,
+                 jitter: Optional[float] = None, lease_ttl: Optional[float] = None):
+        self.sessions = sessions
+        self.interval = interval or float(os.getenv("DATA_COLLECTION_INTERVAL", "300"))
+        self.jitter = jitter if jitter is not None else float(os.getenv("SCHEDULER_JITTER", "0.1"))
+        self.lease_ttl = lease_ttl or float(os.getenv("SCHEDULER_LEASE_TTL", "600"))
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.jobs: Dict[str, JobFunc] = {}
+        self.intervals: Dict[str, float] = {}
+        self.local: Dict[str, Dict[str, Any]] = {}
+        self._loops: Dict[str, asyncio.Task] = {}
+        self._running: Dict[str, asyncio.Task] = {}
+        # trigger() 로 띄운 태스크 (run_job 이 _running 에 등록하기 전에도 참조 유지)
+        self._triggered: Set[asyncio.Task] = set()
+        self._next_run: Dict[str, float] = {}
+
+    def register(self, name: str, func: JobFunc, interval: Optional[float] = None,
+                 exclusive: bool = True) -> None:
+        """
+        작업 등록 (INGEST_<NAME>_INTERVAL 환경 변수로 주기 개별 지정 가능).
+
+        exclusive=False 인 작업은 임대 없이 워커마다 실행되며 상태는 메모리에만 남는다.
+        """
+        self.jobs[name] = func
+        override = os.getenv(f"INGEST_{name.upper().replace('-', '_')}_INTERVAL")
+        self.intervals[name] = float(override) if override else (interval or self.interval)
+        if not exclusive:
+            self.local[name] = {"status": "idle", "runs": 0}
+
+    @property
+    def started(self) -> bool:
+        return bool(self._loops)
+
+    async def start(self) -> None:
+        for name in self.jobs:
+            if name not in self._loops:
+                self._loops[name] = asyncio.create_task(self._loop(name))
+
+    async def stop(self) -> None:
+        tasks = [*self._loops.values(), *self._running.values(), *self._triggered]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loops.clear()
+
+    def _delay(self, name: str) -> float:
+        interval = self.intervals[name]
+        return max(interval * (1 + random.uniform(-self.jitter, self.jitter)), 0.0)
+
+    async def _loop(self, name: str) -> None:
+        # 워커들의 첫 실행 시점을 분산
+        delay = random.uniform(0, self.intervals[name] * self.jitter)
+        while True:
+            self._next_run[name] = time.time() + delay
+            await asyncio.sleep(delay)
+            try:
+                await self.run_job(name)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception(f"수집 작업 실행 오류: {name}")
+            delay = self._delay(name)
+
+    def trigger(self, name: str) -> bool:
+        """작업을 백그라운드로 즉시 실행. 이 워커에서 이미 실행 중이면 False."""
+        if name not in self.jobs:
+            raise KeyError(name)
+        if name in self._running:
+            return False
+        task = asyncio.create_task(self.run_job(name))
+        self._triggered.add(task)
+        task.add_done_callback(self._triggered.discard)
+        return True
+
+    async def run_job(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        작업 한 번 실행 후 결과 요약 반환.
+
+        이 워커에서 이미 실행 중이거나 다른 워커가 임대 중이면 None.
+        """
+        if name in self._running:
+            return None
+        self._running[name] = asyncio.current_task()
+        # 작업 중 DB 쿼리 시간을 작업 이름으로 구분
+        token = metrics.current_context.set({"handler": f"job:{name}"})
+        try:
+            if name in self.local:
+                return await self._run_local(name)
+            acquired, checkpoint = await self._acquire(name)
+            if not acquired:
+                return None
+            started = time.monotonic()
+            context = JobContext(self, name, checkpoint)
+            status, error, changed = "success", None, 0
+            try:
+                changed = await self.jobs[name](context)
+            except asyncio.CancelledError:
+                status = "interrupted"
+                raise
+            except LeaseLostError:
+                status = "lease_lost"
+                logger.warning(f"수집 작업 임대를 잃었습니다: {name}")
+            except Exception as e:
+                status, error = "failed", str(e)
+                logger.exception(f"수집 작업 실패: {name}")
+            finally:
+                duration = time.monotonic() - started
+                if status != "lease_lost":
+                    await self._finish(name, status, duration, changed, error,
+                                       None if status == "success" else context.checkpoint)
+            return {
+                "job": name,
+                "status": status,
+                "duration": round(duration, 3),
+                "items_changed": changed,
+                "resumed": bool(checkpoint),
+            }
+        finally:
+            metrics.current_context.reset(token)
+            self._running.pop(name, None)
+
+    async def _run_local(self, name: str) -> Dict[str, Any]:
+        state = self.local[name]
+        started = time.monotonic()
+        state.update(status="running", last_started_at=datetime.utcnow())
+        status, error, changed = "success", None, 0
+        try:
+            changed = await self.jobs[name](JobContext(self, name, None))
+        except asyncio.CancelledError:
+            status = "interrupted"
+            raise
+        except Exception as e:
+            status, error = "failed", str(e)
+            logger.exception(f"수집 작업 실패: {name}")
+        finally:
+            duration = round(time.monotonic() - started, 3)
+            state.update(status=status, last_finished_at=datetime.utcnow(),
+                         last_duration=duration, items_changed=changed or 0,
+                         last_error=error, runs=state["runs"] + 1)
+        return {"job": name, "status": status, "duration": duration,
+                "items_changed": changed, "resumed": False}
+
+    async def _acquire(self, name: str):
+        """임대 획득 시 (True, 체크포인트), 실패 시 (False, None)."""
+        now = datetime.utcnow()
+        async with self.sessions() as db:
+            if await db.get(IngestionState, name) is None:
+                db.add(IngestionState(name=name, status="idle", items_changed=0, runs=0))
+                try:
+                    await db.commit()
+                except IntegrityError:
+                    await db.rollback()
+            result = await db.execute(
+                update(IngestionState)
+                .where(
+                    IngestionState.name == name,
+                    or_(IngestionState.lease_until.is_(None),
+                        IngestionState.lease_until < now,
+                        IngestionState.owner == self.owner),
+                )
+                .values(owner=self.owner, lease_until=now + timedelta(seconds=self.lease_ttl),
+                        status="running", last_started_at=now)
+            )
+            await db.commit()
+            if result.rowcount != 1:
+                return False, None
+            checkpoint = (await db.execute(
+                select(IngestionState.checkpoint).where(IngestionState.name == name)
+            )).scalar()
+            return True, checkpoint
+
+    async def _save_checkpoint(self, name: str, checkpoint: Dict[str, Any]) -> None:
+        now = datetime.utcnow()
+        async with self.sessions() as db:
+            result = await db.execute(
+                update(IngestionState)
+                .where(IngestionState.name == name, IngestionState.owner == self.owner)
+                .values(checkpoint=dict(checkpoint),
+                        lease_until=now + timedelta(seconds=self.lease_ttl))
+            )
+            await db.commit()
+        if result.rowcount != 1:
+            raise LeaseLostError(name)
+
+    async def _finish(self, name: str, status: str, duration: float, changed: int,
+                      error: Optional[str], checkpoint: Optional[Dict[str, Any]]) -> None:
+        async with self.sessions() as db:
+            await db.execute(
+                update(IngestionState)
+                .where(IngestionState.name == name, IngestionState.owner == self.owner)
+                .values(owner=None, lease_until=None, status=status,
+                        last_finished_at=datetime.utcnow(), last_duration=round(duration, 3),
+                        items_changed=changed or 0, last_error=error,
+                        checkpoint=checkpoint or None, runs=IngestionState.runs + 1)
+            )
+            await db.commit()
+
+    async def status(self) -> Dict[str, Any]:
+        """작업별 마지막 실행 결과와 이 워커의 실행 상태."""
+        async with self.sessions() as db:
+            rows = {
+                row.name: row
+                for row in (await db.execute(select(IngestionState))).scalars()
+            }
+        jobs = {}
+        for name in self.jobs:
+            row = rows.get(name)
+            next_run = self._next_run.get(name)
+            next_run_in = (round(max(next_run - time.time(), 0.0), 1)
+                           if next_run and self.started else None)
+            if name in self.local:
+                jobs[name] = {
+                    **self.local[name],
+                    "running_here": name in self._running,
+                    "interval": self.intervals[name],
+                    "next_run_in": next_run_in,
+                }
+                continue
+            jobs[name] = {
+                "status": row.status if row else "idle",
+                "running_here": name in self._running,
+                "owner": row.owner if row else None,
+                "last_started_at": row.last_started_at if row else None,
+                "last_finished_at": row.last_finished_at if row else None,
+                "last_duration": row.last_duration if row else None,
+                "items_changed": row.items_changed if row else 0,
+                "last_error": row.last_error if row else None,
+                "checkpoint": row.checkpoint if row else None,
+                "runs": row.runs if row else 0,
+                "interval": self.intervals[name],
+                "next_run_in": next_run_in,
+            }
+        return {"enabled": self.started, "owner": self.owner, "jobs": jobs}
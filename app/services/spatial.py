@@ -0,0 +1,185 @@
+"""저장된 정류소에 대한 인메모리 공간 인덱스.
+
+정류소 좌표를 고정 크기 격자 셀로 묶고, 셀 순서로 정렬한 연속 배열과
+셀 → 배열 구간 사전을 둔다. 반경/사각형/최근접 질의는 겹치는 셀의
+후보만 모아 NumPy 로 하버사인 거리를 계산하므로 DB 나 GBIS 를 거치지
+않는다. 인덱스 재생성은 새 격자를 만든 뒤 참조만 바꿔 끼운다.
+"""
+
+import math
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.tiling import EARTH_RADIUS_M, METERS_PER_DEGREE_LAT
+
+Cell = Tuple[int, int]
+
+
+def haversine_m_array(lat: float, lon: float,
+                      lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """한 좌표에서 여러 좌표까지의 대원 거리(미터)."""
+    phi1 = math.radians(lat)
+    phi2 = np.radians(lats)
+    d_phi = phi2 - phi1
+    d_lambda = np.radians(lons - lon)
+    a = np.sin(d_phi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.minimum(1.0, np.sqrt(a)))
+
+
+class _Grid:
+    """정류소 목록으로 만든 불변 격자."""
+
+    def __init__(self, stops: List[Dict[str, Any]], cell_m: float):
+        lats = np.array([stop["latitude"] for stop in stops], dtype=np.float64)
+        lons = np.array([stop["longitude"] for stop in stops], dtype=np.float64)
+        reference = float(np.abs(lats).max()) if stops else 0.0
+        self.cell_lat = cell_m / METERS_PER_DEGREE_LAT
+        # 가장 고위도 기준으로 경도 셀 폭을 잡아 셀이 cell_m 보다 좁아지지 않게 함
+        self.cell_lon = self.cell_lat / max(math.cos(math.radians(min(reference, 89.0))), 1e-6)
+        self.cell_m = cell_m
+
+        rows = np.floor(lats / self.cell_lat).astype(np.int64)
+        cols = np.floor(lons / self.cell_lon).astype(np.int64)
+        order = np.lexsort((cols, rows))
+        self.stops = [stops[i] for i in order]
+        self.lats = lats[order]
+        self.lons = lons[order]
+        rows, cols = rows[order], cols[order]
+
+        self.cells: Dict[Cell, Tuple[int, int]] = {}
+        if len(order):
+            boundaries = np.flatnonzero((np.diff(rows) != 0) | (np.diff(cols) != 0)) + 1
+            starts = np.concatenate(([0], boundaries))
+            ends = np.concatenate((boundaries, [len(order)]))
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                self.cells[(int(rows[start]), int(cols[start]))] = (start, end)
+            self.row_range = (int(rows.min()), int(rows.max()))
+            self.col_range = (int(cols.min()), int(cols.max()))
+
+    def __len__(self) -> int:
+        return len(self.stops)
+
+    def cell_of(self, lat: float, lon: float) -> Cell:
+        return math.floor(lat / self.cell_lat), math.floor(lon / self.cell_lon)
+
+    def candidates(self, row_min: int, row_max: int, col_min: int, col_max: int) -> np.ndarray:
+        """셀 범위에 속한 정류소 위치(정렬 배열 인덱스)."""
+        row_min, row_max = max(row_min, self.row_range[0]), min(row_max, self.row_range[1])
+        col_min, col_max = max(col_min, self.col_range[0]), min(col_max, self.col_range[1])
+        if row_min > row_max or col_min > col_max:
+            return np.empty(0, dtype=np.int64)
+        spans = []
+        if (row_max - row_min + 1) * (col_max - col_min + 1) <= len(self.cells):
+            for row in range(row_min, row_max + 1):
+                for col in range(col_min, col_max + 1):
+                    span = self.cells.get((row, col))
+                    if span:
+                        spans.append(span)
+        else:
+            spans = [
+                span for (row, col), span in self.cells.items()
+                if row_min <= row <= row_max and col_min <= col <= col_max
+            ]
+        if not spans:
+            return np.empty(0, dtype=np.int64)
+        return np.concatenate([np.arange(start, end) for start, end in spans])
+
+
+class StopIndex:
+    """
+    정류소 공간 인덱스.
+
+    load() 로 전체 정류소를 다시 적재하며, 진행 중인 질의는 이전 격자를
+    계속 사용한다. 결과 항목은 원본 정류소 dict 에 distance_m 을 더한 것이다.
+    """
+
+    def __init__(self, cell_m: Optional[float] = None):
+        self.cell_m = cell_m or float(os.getenv("SPATIAL_CELL_METERS", "250"))
+        self._grid = _Grid([], self.cell_m)
+
+    def load(self, stops: Iterable[Dict[str, Any]]) -> int:
+        """정류소 목록으로 인덱스를 새로 만들어 교체, 정류소 수 반환."""
+        grid = _Grid(list(stops), self.cell_m)
+        self._grid = grid
+        return len(grid)
+
+    def __len__(self) -> int:
+        return len(self._grid)
+
+    @staticmethod
+    def _results(grid: _Grid, positions: np.ndarray,
+                 distances: np.ndarray) -> List[Dict[str, Any]]:
+        order = np.lexsort((positions, distances))
+        return [
+            {**grid.stops[positions[i]], "distance_m": round(float(distances[i]), 1)}
+            for i in order
+        ]
+
+    def within(self, lat: float, lon: float, radius_m: float,
+               limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """반경 radius_m 이내 정류소 (가까운 순)."""
+        grid = self._grid
+        if not len(grid):
+            return []
+        d_lat = radius_m / METERS_PER_DEGREE_LAT
+        d_lon = d_lat / max(math.cos(math.radians(min(abs(lat) + d_lat, 89.0))), 1e-6)
+        row_min, col_min = grid.cell_of(lat - d_lat, lon - d_lon)
+        row_max, col_max = grid.cell_of(lat + d_lat, lon + d_lon)
+        positions = grid.candidates(row_min, row_max, col_min, col_max)
+        distances = haversine_m_array(lat, lon, grid.lats[positions], grid.lons[positions])
+        mask = distances <= radius_m
+        return self._results(grid, positions[mask], distances[mask])[:limit]
+
+    def bbox(self, lat_min: float, lat_max: float,
+             lon_min: float, lon_max: float) -> List[Dict[str, Any]]:
+        """사각형 영역 안의 정류소 (위도, 경도 순)."""
+        grid = self._grid
+        if not len(grid):
+            return []
+        row_min, col_min = grid.cell_of(lat_min, lon_min)
+        row_max, col_max = grid.cell_of(lat_max, lon_max)
+        positions = np.sort(grid.candidates(row_min, row_max, col_min, col_max))
+        lats, lons = grid.lats[positions], grid.lons[positions]
+        mask = (lats >= lat_min) & (lats <= lat_max) & (lons >= lon_min) & (lons <= lon_max)
+        return [grid.stops[i] for i in positions[mask]]
+
+    def nearest(self, lat: float, lon: float, n: int = 5,
+                max_distance_m: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        가장 가까운 정류소 n 개.
+
+        중심 셀에서 고리 단위로 넓혀 후보를 n 개 이상 모은 뒤, 그중 n 번째
+        거리만큼의 고리까지 한 번 더 모아 바깥 셀의 더 가까운 정류소를 놓치지
+        않는다.
+        """
+        grid = self._grid
+        if not len(grid) or n <= 0:
+            return []
+        row, col = grid.cell_of(lat, lon)
+        # 질의 위도에서 셀 한 칸이 보장하는 최소 거리
+        width = min(grid.cell_m, grid.cell_lon * METERS_PER_DEGREE_LAT
+                    * math.cos(math.radians(min(abs(lat), 89.0))))
+        gap = max(grid.row_range[0] - row, row - grid.row_range[1],
+                  grid.col_range[0] - col, col - grid.col_range[1], 0)
+        max_ring = max(abs(row - grid.row_range[0]), abs(row - grid.row_range[1]),
+                       abs(col - grid.col_range[0]), abs(col - grid.col_range[1]))
+        if max_distance_m is not None:
+            max_ring = min(max_ring, math.ceil(max_distance_m / width))
+
+        ring = min(gap, max_ring)
+        positions = grid.candidates(row - ring, row + ring, col - ring, col + ring)
+        while len(positions) < n and ring < max_ring:
+            ring = min(max(ring * 2, ring + 1), max_ring)
+            positions = grid.candidates(row - ring, row + ring, col - ring, col + ring)
+        distances = haversine_m_array(lat, lon, grid.lats[positions], grid.lons[positions])
+        if len(positions) >= n:
+            needed = min(math.ceil(np.partition(distances, n - 1)[n - 1] / width), max_ring)
+            if needed > ring:
+                positions = grid.candidates(row - needed, row + needed, col - needed, col + needed)
+                distances = haversine_m_array(lat, lon, grid.lats[positions], grid.lons[positions])
+        if max_distance_m is not None:
+            mask = distances <= max_distance_m
+            positions, distances = positions[mask], distances[mask]
+        return self._results(grid, positions, distances)[:n]
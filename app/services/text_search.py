@@ -0,0 +1,207 @@
+"""노선/정류소 이름 검색용 텍스트 인덱스.
+
+이름을 토큰으로 나누고 각 토큰의 모든 접미사를 접두사 트라이에 넣는다.
+질의 토큰 하나는 트라이를 따라 내려간 노드의 서브트리가 곧 일치 문서
+집합이므로 부분 문자열 일치까지 스캔 없이 찾는다. 자동완성은 노드별로
+기억해 둔 상위 문서를 돌려주므로 카탈로그 크기와 무관하게 응답한다.
+
+한글은 초성 형태("판교역" → "ㅍㄱㅇ")도 함께 색인해 "ㅍㄱ" 같은 초성
+질의로도 찾을 수 있다.
+"""
+
+import heapq
+import re
+import unicodedata
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+HANGUL_FIRST, HANGUL_LAST = 0xAC00, 0xD7A3
+SYLLABLES_PER_INITIAL = 21 * 28
+
+# 일치 종류별 점수 (토큰 전체 > 토큰 접두사 > 토큰 내부)
+EXACT, PREFIX, INFIX = 3.0, 2.0, 1.0
+CHOSEONG_FACTOR = 0.5
+
+_TOKEN = re.compile(r"\w+")
+
+Match = Tuple[Hashable, float]
+
+
+def normalize(text: str) -> str:
+    """NFC 정규화 후 소문자화."""
+    return unicodedata.normalize("NFC", text).lower()
+
+
+def tokenize(text: str) -> List[str]:
+    """정규화한 단어 토큰 목록."""
+    return _TOKEN.findall(normalize(text))
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 바꾼 문자열 (그 밖의 문자는 그대로)."""
+    return "".join(
+        CHOSEONG[(ord(ch) - HANGUL_FIRST) // SYLLABLES_PER_INITIAL]
+        if HANGUL_FIRST <= ord(ch) <= HANGUL_LAST else ch
+        for ch in text
+    )
+
+
+class _Node:
+    __slots__ = ("children", "ends", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        # 이 노드에서 끝나는 색인 문자열: 문서 -> (여기서 끝나는 질의 점수, 더 짧은 질의 점수)
+        self.ends: Dict[Hashable, Tuple[float, float]] = {}
+        self.top: Optional[Tuple[Match, ...]] = None
+
+
+class TextIndex:
+    """
+    접미사 트라이 기반 역색인.
+
+    add() 로 문서의 텍스트 필드를 가중치와 함께 넣고, search() 는 질의
+    토큰마다 일치한 문서의 교집합을 점수순으로, suggest() 는 노드별로
+    기억해 둔 상위 문서를 반환한다. 점수 동률은 추가한 순서를 따른다.
+    """
+
+    def __init__(self, max_suggestions: int = 10):
+        self.max_suggestions = max_suggestions
+        self._root = _Node()
+        self._order: Dict[Hashable, int] = {}
+        self._dirty = False
+
+    @classmethod
+    def build(cls, docs: Iterable[Tuple[Hashable, Iterable[Tuple[str, float]]]],
+              max_suggestions: int = 10) -> "TextIndex":
+        """(문서 ID, [(텍스트, 가중치), ...]) 목록으로 인덱스 생성."""
+        index = cls(max_suggestions)
+        for doc_id, fields in docs:
+            for text, weight in fields:
+                index.add(doc_id, text, weight)
+        index.finalize()
+        return index
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    @staticmethod
+    def _terms(text: str) -> Iterator[Tuple[str, float, bool]]:
+        """(색인 문자열, 점수 배율, 접미사 색인 여부)."""
+        tokens = tokenize(text)
+        terms = [(token, True) for token in tokens]
+        if len(tokens) > 1:
+            # 띄어쓰기 없이 입력한 질의도 일치하도록 붙인 형태를 접두사로만 추가
+            terms.append(("".join(tokens), False))
+        for term, suffixes in terms:
+            yield term, 1.0, suffixes
+            initials = to_choseong(term)
+            if initials != term:
+                yield initials, CHOSEONG_FACTOR, suffixes
+
+    def add(self, doc_id: Hashable, text: str, weight: float = 1.0) -> None:
+        """문서 텍스트 필드 색인."""
+        self._order.setdefault(doc_id, len(self._order))
+        for term, factor, suffixes in self._terms(text):
+            for offset in range(len(term) if suffixes else 1):
+                node = self._root
+                for ch in term[offset:]:
+                    child = node.children.get(ch)
+                    if child is None:
+                        child = node.children[ch] = _Node()
+                    node = child
+                if offset == 0:
+                    scores = (weight * factor * EXACT, weight * factor * PREFIX)
+                else:
+                    scores = (weight * factor * INFIX, weight * factor * INFIX)
+                previous = node.ends.get(doc_id)
+                if previous is not None:
+                    scores = (max(scores[0], previous[0]), max(scores[1], previous[1]))
+                node.ends[doc_id] = scores
+        self._dirty = True
+
+    def finalize(self) -> None:
+        """
+        자동완성 캐시 초기화 후 한 글자 질의의 상위 문서를 미리 계산.
+
+        더 긴 질의는 서브트리가 작으므로 처음 조회할 때 계산해 노드에 기억한다.
+        """
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            stack.extend(node.children.values())
+            node.top = None
+        for node in self._root.children.values():
+            self._top(node)
+        self._dirty = False
+
+    @staticmethod
+    def _scores(node: _Node) -> Dict[Hashable, float]:
+        """질의가 node 에서 끝날 때 일치하는 문서별 점수."""
+        scores = {doc_id: here for doc_id, (here, _) in node.ends.items()}
+        stack = list(node.children.values())
+        while stack:
+            descendant = stack.pop()
+            stack.extend(descendant.children.values())
+            for doc_id, (_, passing) in descendant.ends.items():
+                if scores.get(doc_id, 0.0) < passing:
+                    scores[doc_id] = passing
+        return scores
+
+    def _top(self, node: _Node) -> Tuple[Match, ...]:
+        if node.top is None:
+            node.top = tuple(self._ranked(self._scores(node), self.max_suggestions))
+        return node.top
+
+    def _ranked(self, scores: Dict[Hashable, float], limit: Optional[int] = None) -> List[Match]:
+        def key(item: Match) -> Tuple[float, int]:
+            return -item[1], self._order[item[0]]
+
+        if limit is not None:
+            return heapq.nsmallest(limit, scores.items(), key=key)
+        return sorted(scores.items(), key=key)
+
+    def _node(self, token: str) -> Optional[_Node]:
+        node = self._root
+        for ch in token:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Match]:
+        """
+        모든 질의 토큰과 일치하는 문서를 점수순으로 반환.
+
+        토큰이 없는 질의는 전체 문서를 추가 순서대로 반환한다.
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return [(doc_id, 0.0) for doc_id in list(self._order)[:limit]]
+        scores: Optional[Dict[Hashable, float]] = None
+        for token in tokens:
+            node = self._node(token)
+            if node is None:
+                return []
+            matched = self._scores(node)
+            if scores is None:
+                scores = matched
+            else:
+                smaller, larger = sorted((scores, matched), key=len)
+                scores = {
+                    doc_id: score + larger[doc_id]
+                    for doc_id, score in smaller.items() if doc_id in larger
+                }
+            if not scores:
+                return []
+        return self._ranked(scores, limit)
+
+    def suggest(self, query: str, limit: int = 10) -> List[Match]:
+        """자동완성 후보. 토큰 하나짜리 질의는 노드에 기억한 상위 문서 사용."""
+        if self._dirty:
+            self.finalize()
+        tokens = tokenize(query)
+        if len(tokens) == 1 and limit <= self.max_suggestions:
+            node = self._node(tokens[0])
+            return list(self._top(node)[:limit]) if node is not None else []
+        return self.search(query, limit)
@@ -0,0 +1,128 @@
+"""정류소 지역 검색을 위한 적응형 쿼드트리 타일링."""
+
+import math
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+EARTH_RADIUS_M = 6371008.8
+METERS_PER_DEGREE_LAT = 111320.0
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 좌표 사이의 대원 거리(미터)."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (math.sin(d_phi / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2)
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(a)))
+
+
+class Tile(NamedTuple):
+    """위경도 사각형 타일."""
+    lat_min: float
+    lat_max: float
+    lon_min: float
+    lon_max: float
+    depth: int = 0
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        """타일 중심 좌표."""
+        return ((self.lat_min + self.lat_max) / 2, (self.lon_min + self.lon_max) / 2)
+
+    @property
+    def radius_m(self) -> float:
+        """타일 전체를 덮는 외접원의 반경(미터)."""
+        lat, lon = self.center
+        return max(
+            haversine_m(lat, lon, corner_lat, corner_lon)
+            for corner_lat in (self.lat_min, self.lat_max)
+            for corner_lon in (self.lon_min, self.lon_max)
+        )
+
+    @property
+    def key(self) -> Tuple[float, float, float, float]:
+        """커버리지 캐시 키 (부동소수 오차 제거)."""
+        return (round(self.lat_min, 6), round(self.lat_max, 6),
+                round(self.lon_min, 6), round(self.lon_max, 6))
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        """좌표가 타일 안에 있는지 여부."""
+        return (self.lat_min <= latitude <= self.lat_max
+                and self.lon_min <= longitude <= self.lon_max)
+
+    def split(self) -> List["Tile"]:
+        """사분할한 하위 타일 목록."""
+        lat_mid, lon_mid = self.center
+        depth = self.depth + 1
+        return [
+            Tile(self.lat_min, lat_mid, self.lon_min, lon_mid, depth),
+            Tile(self.lat_min, lat_mid, lon_mid, self.lon_max, depth),
+            Tile(lat_mid, self.lat_max, self.lon_min, lon_mid, depth),
+            Tile(lat_mid, self.lat_max, lon_mid, self.lon_max, depth),
+        ]
+
+
+def initial_tiles(lat_min: float, lat_max: float, lon_min: float, lon_max: float,
+                  max_radius_m: float, rows: Optional[int] = None,
+                  cols: Optional[int] = None) -> List[Tile]:
+    """
+    영역을 최대 반경 원으로 덮는 최소 균등 그리드 생성.
+
+    반경 r 원에 외접하는 정사각형 한 변은 r·√2 이므로, 영역의 높이/너비를
+    그 길이로 나눈 올림 값이 필요한 행/열 수가 된다.
+    """
+    if rows is None or cols is None:
+        mid_lat = (lat_min + lat_max) / 2
+        height_m = (lat_max - lat_min) * METERS_PER_DEGREE_LAT
+        width_m = ((lon_max - lon_min) * METERS_PER_DEGREE_LAT
+                   * math.cos(math.radians(mid_lat)))
+        side_m = max_radius_m * math.sqrt(2)
+        rows = rows or max(1, math.ceil(height_m / side_m))
+        cols = cols or max(1, math.ceil(width_m / side_m))
+
+    lat_step = (lat_max - lat_min) / rows
+    lon_step = (lon_max - lon_min) / cols
+    return [
+        Tile(lat_min + lat_step * i, lat_min + lat_step * (i + 1),
+             lon_min + lon_step * j, lon_min + lon_step * (j + 1))
+        for i in range(rows)
+        for j in range(cols)
+    ]
+
+
+class TileCoverage:
+    """이미 조회가 끝난 타일과 그 결과를 TTL 동안 기억."""
+
+    def __init__(self, ttl: float = 3600.0, max_tiles: int = 4096):
+        self.ttl = ttl
+        self.max_tiles = max_tiles
+        self._tiles: Dict[Tuple[float, float, float, float],
+                          Tuple[float, List[Dict[str, Any]]]] = {}
+
+    def get(self, tile: Tile) -> Optional[List[Dict[str, Any]]]:
+        """유효한 커버리지 결과 반환, 없으면 None."""
+        entry = self._tiles.get(tile.key)
+        if entry is None:
+            return None
+        expires_at, stops = entry
+        if expires_at < time.monotonic():
+            del self._tiles[tile.key]
+            return None
+        return stops
+
+    def mark(self, tile: Tile, stops: List[Dict[str, Any]]) -> None:
+        """타일 조회 완료 기록."""
+        if len(self._tiles) >= self.max_tiles:
+            # 가장 오래 전에 기록된 타일부터 제거
+            self._tiles.pop(next(iter(self._tiles)))
+        self._tiles[tile.key] = (time.monotonic() + self.ttl, stops)
+
+    def clear(self) -> None:
+        """커버리지 기록 초기화."""
+        self._tiles.clear()
+
+    def __len__(self) -> int:
+        return len(self._tiles)
@@ -0,0 +1,135 @@
+"""GBIS XML 응답 스트리밍 파서.
+
+``ET.fromstring`` 으로 전체 트리를 만드는 대신 ``XMLPullParser`` 에
+응답 본문을 청크 단위로 넣고, 레코드 요소가 닫히는 즉시 dict 로 변환한
+뒤 요소를 트리에서 제거한다. 결과 dict 형식은 ``RealBusAPIClient`` 의
+트리 기반 파서와 같다.
+"""
+
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+Chunk = Union[str, bytes]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def iter_chunks(body: Chunk, size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Chunk]:
+    """응답 본문을 고정 크기 청크로 분할."""
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+def iter_events(chunks: Iterable[Chunk], record_tag: str,
+                header_tags: Tuple[str, ...] = ()) -> Iterator[Tuple[str, Any]]:
+    """
+    레코드와 헤더 값을 문서 순서대로 생성.
+
+    - ("record", {자식 태그: 텍스트}) : record_tag 요소가 닫힐 때
+    - ("header", (태그, 텍스트))      : 레코드 밖의 header_tags 요소가 닫힐 때
+
+    처리된 요소는 부모에서 제거되므로 메모리 사용량은 레코드 하나 크기로 유지된다.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack: List[ET.Element] = []
+    in_record = 0
+
+    def drain() -> Iterator[Tuple[str, Any]]:
+        nonlocal in_record
+        for event, elem in parser.read_events():
+            if event == "start":
+                stack.append(elem)
+                if elem.tag == record_tag:
+                    in_record += 1
+                continue
+
+            stack.pop()
+            if elem.tag == record_tag:
+                in_record -= 1
+                yield "record", {child.tag: child.text or "" for child in elem}
+            elif in_record:
+                # 레코드 내부 요소는 레코드가 닫힐 때 함께 처리
+                continue
+            elif elem.tag in header_tags:
+                yield "header", (elem.tag, elem.text or "")
+
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from drain()
+    parser.close()
+    yield from drain()
+
+
+def parse_stop_list(chunks: Iterable[Chunk]) -> Iterator[Dict[str, Any]]:
+    """정류소 검색 응답에서 정류소 dict 를 순차 생성."""
+    for _, item in iter_events(chunks, "busStationList"):
+        stop = {
+            "stationId": item.get("stationId", ""),
+            "stationName": item.get("stationName", ""),
+            "latitude": float(item.get("latitude", 0)),
+            "longitude": float(item.get("longitude", 0)),
+            "busRouteCount": int(item.get("busRouteCount", 0))
+        }
+        if stop["stationId"]:
+            yield stop
+
+
+def _collect(chunks: Iterable[Chunk], record_tag: str,
+             header_tags: Tuple[str, ...]) -> Tuple[Dict[str, str], List[Dict[str, str]]]:
+    """헤더(첫 등장 값)와 레코드 목록 수집."""
+    headers: Dict[str, str] = {}
+    records: List[Dict[str, str]] = []
+    for kind, value in iter_events(chunks, record_tag, header_tags):
+        if kind == "record":
+            records.append(value)
+        else:
+            headers.setdefault(*value)
+    return headers, records
+
+
+def parse_stop_info(chunks: Iterable[Chunk]) -> Dict[str, Any]:
+    """정류소 상세 응답 파싱."""
+    headers, routes = _collect(
+        chunks, "busRouteList", ("stationId", "stationName", "latitude", "longitude")
+    )
+    return {
+        "stationId": headers.get("stationId", ""),
+        "stationName": headers.get("stationName", ""),
+        "latitude": float(headers.get("latitude", 0)),
+        "longitude": float(headers.get("longitude", 0)),
+        "routes": [
+            {
+                "routeId": route.get("routeId", ""),
+                "routeName": route.get("routeName", ""),
+                "routeType": route.get("routeTypeCd", ""),
+            }
+            for route in routes
+        ],
+    }
+
+
+def parse_route(chunks: Iterable[Chunk]) -> Dict[str, Any]:
+    """노선 상세 응답 파싱."""
+    headers, stations = _collect(
+        chunks, "stationList",
+        ("routeId", "routeName", "routeTypeCd", "startStationName", "endStationName"),
+    )
+    return {
+        "routeId": headers.get("routeId", ""),
+        "routeName": headers.get("routeName", ""),
+        "routeTypeCd": headers.get("routeTypeCd", ""),
+        "startStationName": headers.get("startStationName", ""),
+        "endStationName": headers.get("endStationName", ""),
+        "stations": [
+            {
+                "stationId": station.get("stationId", ""),
+                "stationName": station.get("stationName", ""),
+                "sequence": int(station.get("sequence", 0)),
+            }
+            for station in stations
+        ],
+    }
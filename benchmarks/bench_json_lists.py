@@ -0,0 +1,93 @@
+"""목록 응답 직렬화 벤치마크: 모델 생성 + FastAPI 인코더 vs 빠른 JSON 경로.
+
+DB 조회 결과를 흉내 낸 튜플/dict 목록을 만들고, 항목당 직렬화 비용을
+비교한다. 기본 경로는 엔드포인트가 하던 대로 행마다 Pydantic 모델을 만든 뒤
+FastAPI 의 serialize_response 와 JSONResponse 렌더링을 거친다.
+
+    python -m benchmarks.bench_json_lists --items 10000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Callable, Dict, List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.api import fast_json
+from app.models.ridership import DailyRidership, StopInfo, WeeklyRidership
+
+
+def stop_rows(items: int) -> List[tuple]:
+    return [
+        (str(228000000 + i), f"정류소{i}", 37.3 + i * 1e-6, 127.0 + i * 1e-6)
+        for i in range(items)
+    ]
+
+
+def weekly_rows(items: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "stop_id": str(228000000 + i),
+            "stop_name": f"정류소{i}",
+            "week_data": [
+                {"date": f"2024-01-{15 + d}", "stop_id": str(228000000 + i),
+                 "passenger_count": 100 + d, "peak_hour": 8}
+                for d in range(7)
+            ],
+            "total_count": 721,
+            "average_daily": 103,
+        }
+        for i in range(items)
+    ]
+
+
+def fastapi_render(model: type, content: Any) -> bytes:
+    field = create_model_field(name="Response", type_=List[model], mode="serialization")
+    value = asyncio.run(serialize_response(field=field, response_content=content))
+    return JSONResponse(value).body
+
+
+def measure(func: Callable[[], bytes], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    stops = stop_rows(args.items)
+    weekly = weekly_rows(args.items // 10)
+    cases = {
+        "stops/default": (len(stops), lambda: fastapi_render(StopInfo, [
+            StopInfo(stop_id=a, stop_name=b, latitude=c, longitude=d) for a, b, c, d in stops
+        ])),
+        "stops/fast": (len(stops), lambda: fast_json.dumps([
+            {"stop_id": a, "stop_name": b, "latitude": c, "longitude": d} for a, b, c, d in stops
+        ])),
+        "top-stops/default": (len(weekly), lambda: fastapi_render(WeeklyRidership, [
+            WeeklyRidership(**{**row, "week_data": [DailyRidership(**d) for d in row["week_data"]]})
+            for row in weekly
+        ])),
+        "top-stops/fast": (len(weekly), lambda: fast_json.dumps(weekly)),
+    }
+
+    encoder = "orjson" if fast_json.orjson is not None else "pydantic-core"
+    print(f"fast encoder: {encoder}")
+    print(f"{'case':<20}{'items':>8}{'total ms':>12}{'us/item':>10}")
+    for name, (count, func) in cases.items():
+        seconds = measure(func, args.repeat)
+        print(f"{name:<20}{count:>8}{seconds * 1000:>12.2f}{seconds / count * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
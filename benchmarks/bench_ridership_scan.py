@@ -0,0 +1,127 @@
+"""ridership_data 조회 벤치마크: 기존 단일 컬럼 인덱스 vs 복합 인덱스.
+
+정류소 × 일 × 시간 단위의 합성 데이터를 SQLite 파일 두 개에 적재하고
+(기존 스키마 / 현재 스키마) 대표 조회 패턴의 처리 시간과 실행 계획을 비교한다.
+기본값은 약 1천만 행 (1000 정류소 × 417일 × 24시간).
+
+    python -m benchmarks.bench_ridership_scan --stations 1000 --days 417
+"""
+
+import argparse
+import sqlite3
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Tuple
+
+from sqlalchemy import create_engine
+
+from app.database.models import RidershipData
+
+LEGACY_DDL = (
+    "CREATE TABLE ridership_data (id INTEGER PRIMARY KEY, station_id VARCHAR NOT NULL,"
+    " date VARCHAR NOT NULL, hour INTEGER, passenger_count INTEGER, created_at DATETIME)",
+    "CREATE INDEX ix_ridership_data_station_id ON ridership_data (station_id)",
+    "CREATE INDEX ix_ridership_data_date ON ridership_data (date)",
+)
+
+QUERIES = {
+    "station_range": (
+        "SELECT date, hour, passenger_count FROM ridership_data "
+        "WHERE station_id = ? AND date BETWEEN ? AND ?"
+    ),
+    "hour_across_week": (
+        "SELECT station_id, passenger_count FROM ridership_data "
+        "WHERE date BETWEEN ? AND ? AND hour = ?"
+    ),
+}
+
+FIRST_DAY = date(2024, 1, 1)
+
+
+def iter_rows(stations: int, days: int) -> Iterator[Tuple]:
+    """(station_id, date, hour, passenger_count) 합성 행."""
+    for day in range(days):
+        day_str = (FIRST_DAY + timedelta(days=day)).isoformat()
+        for station in range(stations):
+            station_id = str(228000000 + station)
+            for hour in range(24):
+                yield station_id, day_str, hour, (station * 7 + day * 3 + hour * 11) % 97
+
+
+def build(path: Path, create_schema: Callable[[Path], None], stations: int, days: int) -> float:
+    """스키마 생성 후 데이터 적재 (인덱스 유지 상태), 적재 시간 반환."""
+    create_schema(path)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=OFF")
+    conn.execute("PRAGMA synchronous=OFF")
+    start = time.perf_counter()
+    conn.executemany(
+        "INSERT INTO ridership_data (station_id, date, hour, passenger_count) VALUES (?, ?, ?, ?)",
+        iter_rows(stations, days),
+    )
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+    return time.perf_counter() - start
+
+
+def legacy_schema(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    for statement in LEGACY_DDL:
+        conn.execute(statement)
+    conn.close()
+
+
+def current_schema(path: Path) -> None:
+    engine = create_engine(f"sqlite:///{path}")
+    # 외래 키 대상 테이블 없이 ridership_data 만 생성
+    RidershipData.__table__.create(engine, checkfirst=True)
+    engine.dispose()
+
+
+def measure(path: Path, params: Dict[str, Tuple], repeat: int) -> Dict[str, Tuple[float, int, str]]:
+    """질의별 (최소 처리 시간, 결과 행 수, 실행 계획)."""
+    conn = sqlite3.connect(path)
+    results = {}
+    for name, sql in QUERIES.items():
+        plan = " / ".join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params[name]))
+        best, count = float("inf"), 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            count = len(conn.execute(sql, params[name]).fetchall())
+            best = min(best, time.perf_counter() - start)
+        results[name] = (best, count, plan)
+    conn.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stations", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=417)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--dir", help="DB 파일 위치 (기본값: 임시 디렉터리)")
+    args = parser.parse_args()
+
+    last_day = FIRST_DAY + timedelta(days=args.days - 1)
+    week_start = last_day - timedelta(days=6)
+    params = {
+        "station_range": (str(228000000 + args.stations // 2),
+                          (last_day - timedelta(days=29)).isoformat(), last_day.isoformat()),
+        "hour_across_week": (week_start.isoformat(), last_day.isoformat(), 8),
+    }
+    print(f"rows: {args.stations * args.days * 24:,}")
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as workdir:
+        for label, schema in (("legacy", legacy_schema), ("composite", current_schema)):
+            path = Path(workdir) / f"{label}.db"
+            load = build(path, schema, args.stations, args.days)
+            print(f"\n[{label}] load {load:.1f}s, size {path.stat().st_size / 2**20:.0f} MB")
+            for name, (seconds, count, plan) in measure(path, params, args.repeat).items():
+                print(f"  {name:<18}{seconds * 1000:>10.2f} ms{count:>8} rows  {plan}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,526 @@
+"""재현 가능한 API 벤치마크: 엔드포인트 부하 + 파서/upsert 마이크로벤치마크.
+
+앱을 프로세스 안에서(ASGI 전송) 실행하고, GBIS 는 녹화된 XML 을 주입한
+지연 시간으로 돌려주는 로컬 가짜 서버(benchmarks/fake_gbis.py)로 대체한다.
+--simulator 를 주면 대신 시드 기반 가상 도시 시뮬레이터
+(benchmarks/gbis_simulator.py)를 띄워 오류/느린 응답 주입과 지역 수집
+(get_stops_in_area 타일 크롤링)까지 측정한다.
+DB 는 임시 SQLite 파일에 합성 정류소/이용자 데이터를 적재해 사용한다.
+
+- 엔드포인트: /api/real/* 와 /api/statistics/* 를 동시성 단계별로 호출해
+  처리량(req/s)과 p50/p95/p99 지연 시간, 오류 수, 업스트림 호출 수 측정
+- 마이크로: _parse_* (tree/stream, 녹화 응답과 대용량 합성 응답),
+  bulk_upsert_stops (신규/무변경/변경), upsert_route
+
+결과는 JSON 으로 저장하며, --baseline 으로 이전 결과를 주면 허용 오차를
+넘는 회귀를 출력하고 종료 코드 1 로 끝난다. BUSINFO_PARSE_MODE,
+FAST_JSON_RESPONSES 등 앱 설정은 환경 변수로 그대로 바꿔 비교할 수 있다.
+
+    python -m benchmarks.bench_suite --concurrency 1,8,32 --requests 300 \\
+        --latency-ms 20 --jitter-ms 5 --output bench.json
+    python -m benchmarks.bench_suite --baseline bench-0.1.0.json --tolerance 0.15
+    python -m benchmarks.bench_suite --simulator --sim-stations 30000 --error-rate 0.01
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from benchmarks.bench_xml_parse import build_route, build_station_list
+from benchmarks.fake_gbis import FIXTURES, FakeGBIS
+from benchmarks.gbis_simulator import (
+    ROUTE_ID_BASE,
+    STATION_ID_BASE,
+    FaultProfile,
+    GBISSimulator,
+    build_city,
+)
+
+# (이름, i 번째 요청 경로 생성 함수)
+Scenario = Tuple[str, Callable[[int], str]]
+
+LAST_DAY = date(2024, 1, 21)
+
+
+def configure_env(base_url: str, workdir: str) -> None:
+    """
+    앱 모듈을 import 하기 전에 벤치마크 환경 설정.
+
+    업스트림 주소와 DB 는 항상 덮어쓰고, 나머지는 사용자가 지정한 값을 존중한다.
+    """
+    os.environ["BUSINFO_GBIS_BASE_URL"] = base_url
+    os.environ["DB_URL"] = f"sqlite:///{Path(workdir) / 'bench.db'}"
+    defaults = {
+        "BUSINFO_API_KEY": "bench",
+        "BUSINFO_CACHE_BACKEND": "memory",
+        # 키 사용량 제한이 측정을 지배하지 않도록 사실상 해제
+        "BUSINFO_RATE_PER_SECOND": "1000000",
+        "BUSINFO_RATE_BURST": "1000000",
+        "SCHEDULER_ENABLED": "false",
+        "PROFILE_ENABLED": "false",
+    }
+    for key, value in defaults.items():
+        os.environ.setdefault(key, value)
+
+
+def station_id(i: int) -> str:
+    return str(228100000 + i)
+
+
+def seed_database(stations: int) -> None:
+    """합성 정류소와 최근 1주일 시간대별 이용자 데이터 적재."""
+    from app.database.config import SessionLocal
+    from app.database.upsert import bulk_upsert_stops
+    from app.services import rollups
+
+    stops = [
+        {
+            "stationId": station_id(i),
+            "stationName": f"벤치정류소{i}",
+            "latitude": 37.38 + (i % 50) * 0.0006,
+            "longitude": 127.09 + (i // 50) * 0.0006,
+            "busRouteCount": i % 20,
+        }
+        for i in range(stations)
+    ]
+    rows = [
+        {
+            "station_id": station_id(i),
+            "date": LAST_DAY - timedelta(days=d),
+            "hour": hour,
+            "passenger_count": (i * 7 + d * 13 + hour * 29) % 200,
+        }
+        for i in range(stations)
+        for d in range(7)
+        for hour in range(5, 24)
+    ]
+    with SessionLocal() as db:
+        bulk_upsert_stops(db, stops)
+        rollups.ingest_ridership(db, rows)
+        db.commit()
+
+
+def scenarios(stations: int, id_pool: int, upstream_stations: int = 0,
+              upstream_routes: int = 0) -> List[Scenario]:
+    """
+    측정 대상 엔드포인트.
+
+    상세 조회는 id_pool 이 0 이면 매 요청 새 ID(항상 캐시 미스),
+    아니면 id_pool 개의 ID 를 순환해 캐시 적중을 포함한다.
+    시뮬레이터를 쓸 때는 도시에 있는 ID 범위 안에서 순환한다.
+    """
+    def pooled(i: int, size: int) -> int:
+        i = i % id_pool if id_pool else i
+        return i % size if size else i
+
+    def nearest(i: int) -> str:
+        lat = 37.38 + (i % 97) * 0.0003
+        lon = 127.09 + (i % 89) * 0.0003
+        return f"/api/real/stops/nearest?lat={lat:.5f}&lon={lon:.5f}&limit=10"
+
+    return [
+        ("GET /api/real/stops", lambda i: "/api/real/stops"),
+        ("GET /api/real/stops/nearest", nearest),
+        ("GET /api/real/stops/{id}/info",
+         lambda i: f"/api/real/stops/{STATION_ID_BASE + pooled(i, upstream_stations)}/info"),
+        ("GET /api/real/routes/{id}/info",
+         lambda i: f"/api/real/routes/{ROUTE_ID_BASE + pooled(i, upstream_routes)}/info"),
+        ("GET /api/statistics/weekly/{id}",
+         lambda i: f"/api/statistics/weekly/{station_id(i % stations)}"),
+        ("GET /api/statistics/top-stops", lambda i: "/api/statistics/top-stops?limit=20"),
+        ("GET /api/statistics/summary", lambda i: "/api/statistics/summary"),
+        ("GET /api/statistics/hourly/{id}",
+         lambda i: f"/api/statistics/hourly/{station_id(i % stations)}"),
+    ]
+
+
+def percentile(values: List[float], q: float) -> float:
+    """정렬된 목록의 nearest-rank 백분위수."""
+    if not values:
+        return 0.0
+    rank = max(1, min(len(values), math.ceil(q / 100 * len(values))))
+    return values[rank - 1]
+
+
+class RequestCounter:
+    """요청 번호 발급 (시나리오마다 이어서 증가해 상세 조회 ID 가 겹치지 않게 함)."""
+
+    def __init__(self):
+        self.value = 0
+
+    def next(self) -> int:
+        self.value += 1
+        return self.value
+
+
+async def load(client: httpx.AsyncClient, path_for: Callable[[int], str],
+               counter: RequestCounter, concurrency: int, requests: int) -> Dict[str, Any]:
+    """concurrency 개 작업자가 requests 개 요청을 나눠 보내고 지연 시간 집계."""
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            path = path_for(counter.next())
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": sum(n for status, n in statuses.items() if status >= 400),
+        "statuses": {str(status): n for status, n in sorted(statuses.items())},
+        "seconds": round(elapsed, 4),
+        "rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3),
+    }
+
+
+async def run_endpoints(args: argparse.Namespace,
+                        upstream: Any) -> Dict[str, List[Dict[str, Any]]]:
+    """lifespan 을 실행한 앱에 시나리오 × 동시성 단계별 부하 (시뮬레이터면 지역 수집 포함)."""
+    from app.main import app
+
+    results = []
+    crawl: List[Dict[str, Any]] = []
+    counter = RequestCounter()
+    sizes = (0, 0)
+    if isinstance(upstream, GBISSimulator):
+        sizes = (len(upstream.city.stations), len(upstream.city.routes))
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench",
+                                     timeout=60) as client:
+            for name, path_for in scenarios(args.stations, args.id_pool, *sizes):
+                if args.only and args.only not in name:
+                    continue
+                for concurrency in args.concurrency:
+                    # 워밍업 (커넥션 풀, 인덱스, 첫 컴파일 비용 제외)
+                    await load(client, path_for, counter, concurrency, concurrency)
+                    calls_before = sum(upstream.calls.values())
+                    result = await load(client, path_for, counter, concurrency, args.requests)
+                    result = {
+                        "name": name,
+                        "concurrency": concurrency,
+                        **result,
+                        "upstream_calls": sum(upstream.calls.values()) - calls_before,
+                    }
+                    results.append(result)
+                    print(f"{name:<36}{concurrency:>5}{result['rps']:>10.1f}"
+                          f"{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}"
+                          f"{result['p99_ms']:>10.2f}{result['errors']:>7}"
+                          f"{result['upstream_calls']:>9}")
+        if isinstance(upstream, GBISSimulator):
+            crawl = await run_crawl(args, upstream)
+    return {"endpoints": results, "crawl": crawl}
+
+
+async def run_crawl(args: argparse.Namespace, upstream: GBISSimulator) -> List[Dict[str, Any]]:
+    """
+    도시 중심 crawl_km 정사각형 지역 수집 (cold: 타일/응답 캐시 없음, warm: 재수집).
+
+    포화 타일 분할, 동시 조회 제한, 커넥션 풀이 대규모 지역에서 어떻게
+    동작하는지 본다.
+    """
+    from app.api import real_statistics
+
+    client = real_statistics.api_client
+    lat, lon = upstream.city.center
+    half_lat = args.crawl_km * 500 / 111_320
+    half_lon = half_lat / math.cos(math.radians(lat))
+    box = (lat - half_lat, lat + half_lat, lon - half_lon, lon + half_lon)
+
+    results = []
+    print(f"\n{'crawl':<12}{'seconds':>10}{'stops':>8}{'upstream':>10}{'injected':>10}")
+    for name in ("cold", "warm"):
+        calls_before = sum(upstream.calls.values())
+        injected_before = sum(upstream.injected.values())
+        start = time.perf_counter()
+        try:
+            stops = await client.get_stops_in_area(*box)
+            error = None
+        except Exception as e:
+            stops, error = [], f"{type(e).__name__}: {e}"
+        result = {
+            "name": f"crawl/{name}",
+            "area_km": args.crawl_km,
+            "seconds": round(time.perf_counter() - start, 4),
+            "stops": len(stops),
+            "upstream_calls": sum(upstream.calls.values()) - calls_before,
+            "injected_faults": sum(upstream.injected.values()) - injected_before,
+            "error": error,
+        }
+        results.append(result)
+        print(f"{result['name']:<12}{result['seconds']:>10.2f}{result['stops']:>8}"
+              f"{result['upstream_calls']:>10}{result['injected_faults']:>10}")
+    return results
+
+
+def best_per_op(func: Callable[[], Any], iterations: int, repeat: int) -> float:
+    """repeat 회 중 가장 빠른 회차의 1회당 마이크로초."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / iterations * 1e6
+
+
+def run_micro(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """_parse_* 와 DB upsert 경로 마이크로벤치마크."""
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.database.models import Base
+    from app.database.upsert import bulk_upsert_stops, upsert_route
+    from app.services.real_api_client import RealBusAPIClient
+
+    results = []
+
+    def record(name: str, us_per_op: float, iterations: int, items: int = 1) -> None:
+        results.append({
+            "name": name,
+            "iterations": iterations,
+            "items": items,
+            "us_per_op": round(us_per_op, 3),
+            "us_per_item": round(us_per_op / items, 4),
+        })
+        print(f"{name:<44}{items:>8}{us_per_op:>14.1f}{us_per_op / items:>12.3f}")
+
+    recorded = {
+        name: (FIXTURES / f"{name}.xml").read_text(encoding="utf-8")
+        for name in ("station_list", "station_info", "route")
+    }
+    payloads = [
+        ("station_list", "_parse_stop_response", recorded["station_list"], 1000),
+        ("station_info", "_parse_stop_info_response", recorded["station_info"], 1000),
+        ("route", "_parse_route_response", recorded["route"], 1000),
+        (f"station_list_{args.records}", "_parse_stop_response",
+         build_station_list(args.records), 1),
+        (f"route_{args.records}", "_parse_route_response", build_route(args.records), 1),
+    ]
+    for mode in ("tree", "stream"):
+        client = RealBusAPIClient()
+        client.parse_mode = mode
+        for name, method, body, iterations in payloads:
+            parse = getattr(client, method)
+            parsed = parse(body)
+            items = len(parsed if isinstance(parsed, list) else parsed.get("stations")
+                        or parsed.get("routes") or [None])
+            record(f"parse/{name}/{mode}",
+                   best_per_op(lambda: parse(body), iterations, args.repeat), iterations, items)
+
+    def stops(n: int, suffix: str = "") -> List[Dict[str, Any]]:
+        return [
+            {"stationId": station_id(i), "stationName": f"정류소{i}{suffix}",
+             "latitude": 37.3 + i * 1e-6, "longitude": 127.0 + i * 1e-6,
+             "busRouteCount": i % 30}
+            for i in range(n)
+        ]
+
+    route = {
+        "routeId": "234100000", "routeName": "9007", "routeTypeCd": "11",
+        "startStationName": "판교역", "endStationName": "서울역",
+        "stations": [
+            {"stationId": station_id(i), "stationName": f"정류소{i}", "sequence": i + 1}
+            for i in range(60)
+        ],
+    }
+
+    def timed_once(func: Callable[[], Any]) -> float:
+        start = time.perf_counter()
+        func()
+        return (time.perf_counter() - start) * 1e6
+
+    n = args.upsert_rows
+    best: Dict[str, float] = {}
+    for _ in range(args.repeat):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(bind=engine)
+        with sessionmaker(bind=engine)() as db:
+            for name, func in (
+                ("upsert/stops/insert", lambda: bulk_upsert_stops(db, stops(n))),
+                ("upsert/stops/unchanged", lambda: bulk_upsert_stops(db, stops(n))),
+                ("upsert/stops/update", lambda: bulk_upsert_stops(db, stops(n, " (이전)"))),
+                ("upsert/route/insert", lambda: upsert_route(db, route)),
+                ("upsert/route/unchanged", lambda: upsert_route(db, route)),
+            ):
+                elapsed = timed_once(lambda: (func(), db.commit()))
+                best[name] = min(best.get(name, float("inf")), elapsed)
+        engine.dispose()
+    for name, us in best.items():
+        items = n if name.startswith("upsert/stops") else len(route["stations"])
+        record(name, us, 1, items)
+    return results
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            check=True, cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any],
+            tolerance: float) -> List[str]:
+    """
+    기준 결과 대비 회귀 목록.
+
+    엔드포인트는 p95 증가 또는 처리량 감소, 마이크로는 1회당 시간 증가를
+    tolerance 비율 초과 시 회귀로 본다. 양쪽에 모두 있는 항목만 비교한다.
+    """
+    regressions = []
+    base_endpoints = {(r["name"], r["concurrency"]): r for r in baseline.get("endpoints", [])}
+    for result in results["endpoints"]:
+        base = base_endpoints.get((result["name"], result["concurrency"]))
+        if base is None:
+            continue
+        label = f"{result['name']} @{result['concurrency']}"
+        if result["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{label}: p95 {base['p95_ms']:.2f} -> {result['p95_ms']:.2f} ms")
+        if result["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(f"{label}: rps {base['rps']:.1f} -> {result['rps']:.1f}")
+    base_micro = {r["name"]: r for r in baseline.get("micro", [])}
+    for result in results["micro"]:
+        base = base_micro.get(result["name"])
+        if base is not None and result["us_per_op"] > base["us_per_op"] * (1 + tolerance):
+            regressions.append(
+                f"{result['name']}: {base['us_per_op']:.1f} -> {result['us_per_op']:.1f} us/op"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", default="1,8,32",
+                        type=lambda v: [int(c) for c in v.split(",") if c])
+    parser.add_argument("--requests", type=int, default=200, help="동시성 단계별 측정 요청 수")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="가짜 GBIS 평균 지연")
+    parser.add_argument("--jitter-ms", type=float, default=5.0, help="가짜 GBIS 지연 표준편차")
+    parser.add_argument("--stations", type=int, default=300, help="DB 에 적재할 합성 정류소 수")
+    parser.add_argument("--id-pool", type=int, default=0,
+                        help="상세 조회 ID 순환 개수 (0 이면 매 요청 새 ID)")
+    parser.add_argument("--only", default="", help="이름에 이 문자열이 있는 엔드포인트만 측정")
+    parser.add_argument("--records", type=int, default=5000, help="대용량 합성 XML 레코드 수")
+    parser.add_argument("--upsert-rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--simulator", action="store_true",
+                        help="녹화 응답 대신 가상 도시 GBIS 시뮬레이터 사용")
+    parser.add_argument("--sim-stations", type=int, default=30000)
+    parser.add_argument("--sim-routes", type=int, default=3000)
+    parser.add_argument("--latency", default="",
+                        help="시뮬레이터 지연 분포 (예: lognormal:40,0.5)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="시뮬레이터 오류 주입 비율")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="시뮬레이터 느린 응답 비율")
+    parser.add_argument("--slow-ms", type=float, default=3000.0)
+    parser.add_argument("--crawl-km", type=float, default=10.0, help="지역 수집 측정 영역 한 변")
+    parser.add_argument("--skip-endpoints", action="store_true")
+    parser.add_argument("--skip-micro", action="store_true")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="회귀 허용 비율")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": {
+            key: value for key, value in vars(args).items()
+            if key not in ("output", "baseline")
+        },
+        "endpoints": [],
+        "crawl": [],
+        "micro": [],
+    }
+
+    if args.simulator:
+        start = time.perf_counter()
+        city = build_city(args.sim_stations, args.sim_routes, args.seed)
+        print(f"가상 도시: 정류소 {len(city.stations)}개, 노선 {len(city.routes)}개 "
+              f"({time.perf_counter() - start:.1f}초)")
+        faults = FaultProfile(
+            latency=args.latency or f"normal:{args.latency_ms},{args.jitter_ms}",
+            error_rate=args.error_rate,
+            slow_rate=args.slow_rate,
+            slow_ms=args.slow_ms,
+        )
+        fake: Any = GBISSimulator(city, faults, seed=args.seed)
+    else:
+        fake = FakeGBIS(args.latency_ms, args.jitter_ms, args.seed)
+
+    with tempfile.TemporaryDirectory() as workdir, fake.serve() as upstream:
+        configure_env(upstream.base_url, workdir)
+        # 앱 모듈은 환경 설정 이후에 import (모듈 수준 싱글톤이 import 시 설정을 읽음)
+        import app.main  # noqa: F401  (테이블 생성)
+        logging.getLogger().setLevel(logging.WARNING)
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+        results["config"]["env"] = {
+            key: os.environ[key] for key in sorted(os.environ)
+            if key.startswith(("BUSINFO_", "FAST_JSON", "CATALOG_")) and key != "BUSINFO_API_KEY"
+        }
+
+        if not args.skip_endpoints:
+            seed_database(args.stations)
+            print(f"{'endpoint':<36}{'conc':>5}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}"
+                  f"{'p99 ms':>10}{'errors':>7}{'upstream':>9}")
+            results.update(asyncio.run(run_endpoints(args, upstream)))
+            print()
+        if not args.skip_micro:
+            print(f"{'micro':<44}{'items':>8}{'us/op':>14}{'us/item':>12}")
+            results["micro"] = run_micro(args)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n회귀 {len(regressions)}건 (허용 {args.tolerance:.0%}, "
+                  f"기준 {baseline['meta'].get('git_revision')}):")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\n회귀 없음 (허용 {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
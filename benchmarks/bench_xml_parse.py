@@ -0,0 +1,88 @@
+"""GBIS XML 파서 벤치마크: 트리 기반 vs 스트리밍.
+
+대용량 노선/정류소 응답을 합성해 두 파싱 방식의 처리 시간과
+tracemalloc 기준 최대 메모리 사용량을 비교한다.
+
+    python -m benchmarks.bench_xml_parse --records 50000
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from app.services.real_api_client import RealBusAPIClient
+
+
+def build_station_list(records: int) -> str:
+    """정류소 검색 응답 합성."""
+    items = "".join(
+        "<busStationList>"
+        f"<stationId>{228000000 + i}</stationId>"
+        f"<stationName>정류소{i}</stationName>"
+        f"<latitude>{37.3 + i * 1e-6:.6f}</latitude>"
+        f"<longitude>{127.0 + i * 1e-6:.6f}</longitude>"
+        f"<busRouteCount>{i % 30}</busRouteCount>"
+        "</busStationList>"
+        for i in range(records)
+    )
+    return f"<response><msgHeader><resultCode>0</resultCode></msgHeader><msgBody>{items}</msgBody></response>"
+
+
+def build_route(records: int) -> str:
+    """노선 상세 응답 합성."""
+    items = "".join(
+        "<stationList>"
+        f"<stationId>{228000000 + i}</stationId>"
+        f"<stationName>정류소{i}</stationName>"
+        f"<sequence>{i + 1}</sequence>"
+        "</stationList>"
+        for i in range(records)
+    )
+    return (
+        "<response><msgBody><busRouteInfoItem><routeId>234000001</routeId>"
+        "<routeName>9007</routeName><routeTypeCd>11</routeTypeCd>"
+        "<startStationName>판교역</startStationName><endStationName>서울역</endStationName>"
+        f"</busRouteInfoItem>{items}</msgBody></response>"
+    )
+
+
+def measure(parse: Callable[[str], Any], body: str, repeat: int) -> Dict[str, float]:
+    """최소 처리 시간과 최대 추가 메모리 측정."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(body)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    parse(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": best, "peak_mb": peak / (1024 * 1024)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tree = RealBusAPIClient()
+    stream = RealBusAPIClient()
+    stream.parse_mode = "stream"
+
+    payloads = {
+        "station_list": (build_station_list(args.records), "_parse_stop_response"),
+        "route": (build_route(args.records), "_parse_route_response"),
+    }
+    print(f"{'payload':<14}{'mode':<8}{'time (ms)':>12}{'peak (MB)':>12}")
+    for name, (body, method) in payloads.items():
+        for mode, client in (("tree", tree), ("stream", stream)):
+            result = measure(getattr(client, method), body, args.repeat)
+            print(f"{name:<14}{mode:<8}{result['seconds'] * 1000:>12.1f}"
+                  f"{result['peak_mb']:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
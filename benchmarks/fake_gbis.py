@@ -0,0 +1,97 @@
+"""벤치마크용 가짜 GBIS 서버: 녹화된 XML 응답을 지연 시간을 주입해 반환.
+
+benchmarks/fixtures 의 응답을 엔드포인트별로 돌려준다. 요청 파라미터는
+보지 않으므로 어떤 정류소/노선 ID 로 조회해도 같은 응답이 온다.
+서버는 127.0.0.1 의 빈 포트에서 백그라운드 스레드로 실행되고,
+RealBusAPIClient 는 BUSINFO_GBIS_BASE_URL 로 이 서버를 가리킨다.
+"""
+
+import asyncio
+import random
+import socket
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+ENDPOINTS = {
+    "stationinfo/getStationByPolyline": "station_list.xml",
+    "stationinfo/getStationWithBusLisInfo": "station_info.xml",
+    "routeinfo/getRouteWithStationList": "route.xml",
+}
+
+
+def load_fixtures() -> Dict[str, bytes]:
+    """엔드포인트 경로 → 응답 원문."""
+    return {endpoint: (FIXTURES / name).read_bytes() for endpoint, name in ENDPOINTS.items()}
+
+
+class FakeGBIS:
+    """고정 응답 + 정규분포 지연 (latency_ms ± jitter_ms)."""
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, seed: int = 0):
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.random = random.Random(seed)
+        self.payloads = load_fixtures()
+        self.calls: Counter = Counter()
+        self.app = Starlette(routes=[
+            Route(f"/ws/rest/{endpoint}", self._handler(endpoint)) for endpoint in self.payloads
+        ])
+        self.base_url = ""
+
+    def _handler(self, endpoint: str):
+        body = self.payloads[endpoint]
+
+        async def handle(request: Request) -> Response:
+            self.calls[endpoint] += 1
+            delay = self.random.gauss(self.latency, self.jitter) if self.jitter else self.latency
+            if delay > 0:
+                await asyncio.sleep(delay)
+            return Response(body, media_type="application/xml;charset=UTF-8")
+
+        return handle
+
+    @contextmanager
+    def serve(self) -> Iterator["FakeGBIS"]:
+        """백그라운드 스레드에서 서버 실행, 종료 시 정지."""
+        with serve_in_thread(self.app) as base_url:
+            self.base_url = base_url
+            yield self
+
+
+@contextmanager
+def serve_in_thread(app: Any) -> Iterator[str]:
+    """ASGI 앱을 127.0.0.1 의 빈 포트에서 uvicorn 스레드로 실행하고 GBIS 기본 URL 반환."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    host, port = sock.getsockname()
+    server = uvicorn.Server(uvicorn.Config(
+        app, log_level="warning", access_log=False, lifespan="off", timeout_keep_alive=60,
+    ))
+    thread = threading.Thread(
+        target=server.run, kwargs={"sockets": [sock]}, name="fake-gbis", daemon=True
+    )
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            raise RuntimeError("가짜 GBIS 서버를 시작하지 못했습니다")
+        time.sleep(0.01)
+    try:
+        yield f"http://{host}:{port}/ws/rest"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+        sock.close()
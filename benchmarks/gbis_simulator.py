@@ -0,0 +1,552 @@
+"""로컬 GBIS 시뮬레이터: 시드로 생성한 가상 도시 + 지연/오류 주입.
+
+경기버스정보 REST 엔드포인트 세 개를 흉내 낸다.
+
+- stationinfo/getStationByPolyline: lat, lon, radius(m) 안의 정류소 (가까운 순, page_size 개까지)
+- stationinfo/getStationWithBusLisInfo: stationId 정류소와 경유 노선 목록
+- routeinfo/getRouteWithStationList: routeId 노선과 경유 정류소 순서
+
+도시는 시드가 같으면 항상 같다. 정류소는 동(洞) 중심 주변에 모인 군집과
+균일 배경으로 배치하고, 노선은 인접 정류소를 진행 방향을 유지하며 이어 붙여
+만든다. 정류소 ID 는 STATION_ID_BASE 부터, 노선 ID 는 ROUTE_ID_BASE 부터
+차례로 부여한다. 없는 ID 는 GBIS 처럼 HTTP 200 + resultCode 4 로 응답한다.
+
+지연 시간 분포(const/uniform/normal/lognormal/pareto), 오류 비율과 상태 코드,
+느린 응답(slow_rate 비율로 slow_ms 추가)을 주입할 수 있고, 실행 중에도
+/__sim/faults 로 바꿀 수 있다. 호출/주입 통계는 /__sim/stats 에서 본다.
+
+    python -m benchmarks.gbis_simulator --stations 30000 --routes 3000 --seed 7 \\
+        --latency lognormal:40,0.5 --error-rate 0.01 --slow-rate 0.005 --slow-ms 3000
+    BUSINFO_GBIS_BASE_URL=http://127.0.0.1:8090/ws/rest uvicorn app.main:app
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from benchmarks.fake_gbis import serve_in_thread
+
+STATION_ID_BASE = 228000000
+ROUTE_ID_BASE = 234000000
+
+# 설정용 짧은 이름 → 엔드포인트 경로 (BUSINFO_RATE_LIMITS 와 같은 이름)
+ENDPOINTS = {
+    "station_search": "stationinfo/getStationByPolyline",
+    "station_info": "stationinfo/getStationWithBusLisInfo",
+    "route_info": "routeinfo/getRouteWithStationList",
+}
+
+DISTRICTS = (
+    "판교", "백현", "삼평", "운중", "정자", "수내", "서현", "야탑", "이매", "금곡",
+    "구미", "동원", "궁내", "대장", "석운", "시흥", "고등", "신촌", "오야", "단대",
+    "태평", "수진", "신흥", "상대원", "은행", "중앙", "복정", "창곡", "위례", "도촌",
+)
+LANDMARKS = (
+    "역", "사거리", "삼거리", "초등학교", "중학교", "고등학교", "주민센터", "우체국",
+    "아파트", "마을", "공원", "시장", "입구", "병원", "도서관", "체육공원", "파출소",
+    "상가", "터미널", "차고지", "IC", "교회", "보건소", "소방서",
+)
+# (routeTypeCd, 가중치, 정류소 수 범위, 정류소 간 최대 간격(m))
+ROUTE_TYPES = (
+    ("13", 50, (30, 80), 700),   # 일반형시내버스
+    ("30", 25, (10, 30), 450),   # 마을버스
+    ("11", 15, (20, 60), 1500),  # 직행좌석형시내버스
+    ("12", 7, (25, 60), 1000),   # 좌석형시내버스
+    ("14", 3, (10, 30), 3000),   # 광역급행형시내버스
+)
+
+RESULT_MESSAGES = {
+    0: "정상적으로 처리되었습니다.",
+    2: "필수 요청 변수가 없거나 요청 변수 이름이 잘못되었습니다.",
+    4: "결과가 존재하지 않습니다.",
+}
+
+METERS_PER_DEGREE = 111_320.0
+
+
+class Station:
+    __slots__ = ("index", "station_id", "name", "lat", "lon", "routes")
+
+    def __init__(self, index: int, name: str, lat: float, lon: float):
+        self.index = index
+        self.station_id = str(STATION_ID_BASE + index)
+        self.name = name
+        self.lat = lat
+        self.lon = lon
+        self.routes: List[int] = []
+
+
+class BusRoute:
+    __slots__ = ("index", "route_id", "name", "type_cd", "stations")
+
+    def __init__(self, index: int, name: str, type_cd: str, stations: List[int]):
+        self.index = index
+        self.route_id = str(ROUTE_ID_BASE + index)
+        self.name = name
+        self.type_cd = type_cd
+        self.stations = stations
+
+
+class City:
+    """정류소/노선과 격자 공간 인덱스."""
+
+    def __init__(self, center: Tuple[float, float], cell_m: float = 500.0):
+        self.center = center
+        self.stations: List[Station] = []
+        self.routes: List[BusRoute] = []
+        self.cell_lat = cell_m / METERS_PER_DEGREE
+        self.cell_lon = cell_m / (METERS_PER_DEGREE * math.cos(math.radians(center[0])))
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return int(lat // self.cell_lat), int(lon // self.cell_lon)
+
+    def add_station(self, name: str, lat: float, lon: float) -> Station:
+        station = Station(len(self.stations), name, lat, lon)
+        self.stations.append(station)
+        self._grid.setdefault(self._cell(lat, lon), []).append(station.index)
+        return station
+
+    def near(self, lat: float, lon: float, radius_m: float,
+             limit: Optional[int] = None, ordered: bool = True) -> List[Tuple[float, Station]]:
+        """
+        반경 안의 (거리, 정류소) 목록, 가까운 순 (ordered=False 면 정렬 생략).
+
+        거리는 등장방형 근사 (수십 km 이내에서 충분히 정확).
+        """
+        row, col = self._cell(lat, lon)
+        span_lat = int(math.ceil(radius_m / METERS_PER_DEGREE / self.cell_lat))
+        span_lon = int(math.ceil(
+            radius_m / (METERS_PER_DEGREE * math.cos(math.radians(lat))) / self.cell_lon
+        ))
+        found = []
+        scale_lon = METERS_PER_DEGREE * math.cos(math.radians(lat))
+        limit_sq = radius_m * radius_m
+        stations = self.stations
+        for r in range(row - span_lat, row + span_lat + 1):
+            for c in range(col - span_lon, col + span_lon + 1):
+                for index in self._grid.get((r, c), ()):
+                    station = stations[index]
+                    dy = (station.lat - lat) * METERS_PER_DEGREE
+                    dx = (station.lon - lon) * scale_lon
+                    distance_sq = dx * dx + dy * dy
+                    if distance_sq <= limit_sq:
+                        found.append((math.sqrt(distance_sq), station))
+        if ordered:
+            found.sort(key=lambda item: (item[0], item[1].index))
+        return found[:limit] if limit is not None else found
+
+    def station(self, station_id: str) -> Optional[Station]:
+        index = _index(station_id, STATION_ID_BASE, len(self.stations))
+        return None if index is None else self.stations[index]
+
+    def route(self, route_id: str) -> Optional[BusRoute]:
+        index = _index(route_id, ROUTE_ID_BASE, len(self.routes))
+        return None if index is None else self.routes[index]
+
+
+def _index(value: str, base: int, size: int) -> Optional[int]:
+    try:
+        index = int(value) - base
+    except (TypeError, ValueError):
+        return None
+    return index if 0 <= index < size else None
+
+
+def build_city(stations: int = 30000, routes: int = 3000, seed: int = 0,
+               center: Tuple[float, float] = (37.3947, 127.1112)) -> City:
+    """
+    시드로 가상 도시 생성.
+
+    정류소 약 300m 간격 밀도가 되도록 한 변 sqrt(stations) * 0.3 km 정사각형에
+    배치한다. 70% 는 동 중심 주변 정규분포 군집, 30% 는 균일 배경이다.
+    """
+    rng = random.Random(seed)
+    city = City(center)
+    half_km = max(1.0, math.sqrt(stations) * 0.3) / 2
+    half_lat = half_km * 1000 / METERS_PER_DEGREE
+    half_lon = half_km * 1000 / (METERS_PER_DEGREE * math.cos(math.radians(center[0])))
+    lat0, lon0 = center
+
+    districts = []
+    for i in range(max(4, stations // 300)):
+        word = DISTRICTS[i % len(DISTRICTS)]
+        name = word if i < len(DISTRICTS) else f"{word}{i // len(DISTRICTS) + 1}"
+        districts.append((
+            name,
+            rng.uniform(lat0 - half_lat, lat0 + half_lat),
+            rng.uniform(lon0 - half_lon, lon0 + half_lon),
+            rng.uniform(0.8, 2.0) * 1000 / METERS_PER_DEGREE,
+        ))
+
+    for _ in range(stations):
+        name, d_lat, d_lon, sigma = rng.choice(districts)
+        if rng.random() < 0.7:
+            lat = rng.gauss(d_lat, sigma)
+            lon = rng.gauss(d_lon, sigma * half_lon / half_lat)
+        else:
+            lat = rng.uniform(lat0 - half_lat, lat0 + half_lat)
+            lon = rng.uniform(lon0 - half_lon, lon0 + half_lon)
+        lat = min(max(lat, lat0 - half_lat), lat0 + half_lat)
+        lon = min(max(lon, lon0 - half_lon), lon0 + half_lon)
+        city.add_station(f"{name}{rng.choice(LANDMARKS)}", round(lat, 6), round(lon, 6))
+
+    types = list(ROUTE_TYPES)
+    weights = [t[1] for t in ROUTE_TYPES]
+    names_used: set = set()
+    for index in range(routes):
+        type_cd, _, (low, high), gap_m = rng.choices(types, weights)[0]
+        path = _walk(city, rng, rng.randint(low, high), gap_m)
+        name = _route_name(rng, type_cd, names_used)
+        route = BusRoute(index, name, type_cd, path)
+        city.routes.append(route)
+        for station_index in path:
+            city.stations[station_index].routes.append(index)
+    return city
+
+
+def _walk(city: City, rng: random.Random, length: int, gap_m: float) -> List[int]:
+    """임의 정류소에서 출발해 진행 방향을 유지하며 인접 정류소를 이어 붙인 경로."""
+    current = rng.choice(city.stations)
+    heading = rng.uniform(0, 2 * math.pi)
+    path = [current.index]
+    visited = {current.index}
+    while len(path) < length:
+        best, best_score = None, -math.inf
+        # 가까운 반경에서 먼저 찾고, 진행 방향 쪽 후보가 없을 때만 최대 간격까지 넓힘
+        for radius in (gap_m * 0.4, gap_m):
+            for distance, station in city.near(current.lat, current.lon, radius, ordered=False):
+                if station.index in visited or distance < 1:
+                    continue
+                bearing = math.atan2(station.lat - current.lat, station.lon - current.lon)
+                # 진행 방향과 비슷하고 너무 멀지 않은 정류소 선호
+                score = math.cos(bearing - heading) - distance / gap_m * 0.5 + rng.random() * 0.3
+                if score > best_score:
+                    best, best_score = station, score
+            if best_score > 0:
+                break
+        if best is None:
+            break
+        heading = math.atan2(best.lat - current.lat, best.lon - current.lon)
+        heading += rng.gauss(0, 0.25)
+        path.append(best.index)
+        visited.add(best.index)
+        current = best
+    return path
+
+
+def _route_name(rng: random.Random, type_cd: str, used: set) -> str:
+    for _ in range(100):
+        if type_cd == "30":
+            name = f"{rng.choice(DISTRICTS)}{rng.randint(1, 9)}"
+        elif type_cd == "11":
+            name = f"{rng.choice('1389')}{rng.randint(0, 999):03d}"
+        elif type_cd == "14":
+            name = f"M{rng.randint(4100, 4199)}"
+        elif type_cd == "12":
+            name = str(rng.randint(1000, 1999))
+        else:
+            name = str(rng.randint(1, 999))
+            if rng.random() < 0.15:
+                name += f"-{rng.randint(1, 9)}"
+        if name not in used:
+            break
+    used.add(name)
+    return name
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """
+    지연 시간 분포 문자열 → 초 단위 표본 함수 (인자는 밀리초).
+
+    const:20 | uniform:10,50 | normal:20,5 | lognormal:40,0.5 (중앙값, 시그마)
+    | pareto:10,2.5 (최솟값, 형상 모수)
+    """
+    kind, _, raw = spec.partition(":")
+    values = [float(v) for v in raw.split(",") if v] if raw else []
+    kind = kind.strip().lower()
+    if kind in ("", "none", "0"):
+        return lambda rng: 0.0
+    if kind == "const" and len(values) == 1:
+        return lambda rng: values[0] / 1000
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if kind == "normal" and len(values) == 2:
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1])) / 1000
+    if kind == "lognormal" and len(values) == 2 and values[0] > 0:
+        mu = math.log(values[0])
+        return lambda rng: rng.lognormvariate(mu, values[1]) / 1000
+    if kind == "pareto" and len(values) == 2:
+        return lambda rng: values[0] * rng.paretovariate(values[1]) / 1000
+    raise ValueError(f"지연 시간 분포 형식 오류: {spec}")
+
+
+class FaultProfile:
+    """지연/오류/느린 응답 주입 설정 (엔드포인트별 지연 분포 재정의 가능)."""
+
+    def __init__(self, latency: str = "const:0", error_rate: float = 0.0,
+                 error_statuses: Sequence[int] = (500, 503), slow_rate: float = 0.0,
+                 slow_ms: float = 5000.0, endpoint_latency: Optional[Dict[str, str]] = None):
+        self.update({
+            "latency": latency,
+            "error_rate": error_rate,
+            "error_statuses": list(error_statuses),
+            "slow_rate": slow_rate,
+            "slow_ms": slow_ms,
+            "endpoint_latency": endpoint_latency or {},
+        })
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """일부 값만 바꾼다. 형식이 잘못되면 ValueError (기존 값 유지)."""
+        latency = values.get("latency", getattr(self, "latency", "const:0"))
+        endpoint_latency = dict(values.get("endpoint_latency",
+                                           getattr(self, "endpoint_latency", {})))
+        unknown = set(endpoint_latency) - set(ENDPOINTS)
+        if unknown:
+            raise ValueError(f"알 수 없는 엔드포인트: {', '.join(sorted(unknown))}")
+        samplers = {name: parse_latency(spec) for name, spec in endpoint_latency.items()}
+        default = parse_latency(latency)
+        statuses = [int(s) for s in values.get("error_statuses",
+                                               getattr(self, "error_statuses", [500]))]
+        if not statuses:
+            raise ValueError("error_statuses 가 비어 있습니다")
+
+        self.latency = latency
+        self.endpoint_latency = endpoint_latency
+        self.error_rate = float(values.get("error_rate", getattr(self, "error_rate", 0.0)))
+        self.error_statuses = statuses
+        self.slow_rate = float(values.get("slow_rate", getattr(self, "slow_rate", 0.0)))
+        self.slow_ms = float(values.get("slow_ms", getattr(self, "slow_ms", 5000.0)))
+        self._default = default
+        self._samplers = samplers
+
+    def delay(self, name: str, rng: random.Random) -> Tuple[float, bool]:
+        """(지연 초, 느린 응답 여부)."""
+        delay = self._samplers.get(name, self._default)(rng)
+        slow = self.slow_rate > 0 and rng.random() < self.slow_rate
+        if slow:
+            delay += self.slow_ms / 1000
+        return delay, slow
+
+    def error(self, rng: random.Random) -> Optional[int]:
+        if self.error_rate > 0 and rng.random() < self.error_rate:
+            return rng.choice(self.error_statuses)
+        return None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "latency": self.latency,
+            "endpoint_latency": self.endpoint_latency,
+            "error_rate": self.error_rate,
+            "error_statuses": self.error_statuses,
+            "slow_rate": self.slow_rate,
+            "slow_ms": self.slow_ms,
+        }
+
+
+def _document(code: int, body: str = "") -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        "<response><comMsgHeader/><msgHeader>"
+        f"<queryTime>{time.strftime('%Y-%m-%d %H:%M:%S')}</queryTime>"
+        f"<resultCode>{code}</resultCode>"
+        f"<resultMessage>{RESULT_MESSAGES[code]}</resultMessage>"
+        f"</msgHeader>{f'<msgBody>{body}</msgBody>' if body else ''}</response>"
+    )
+
+
+class GBISSimulator:
+    """가상 도시를 GBIS REST 형식으로 제공하는 ASGI 앱."""
+
+    def __init__(self, city: City, faults: Optional[FaultProfile] = None,
+                 page_size: int = 100, seed: int = 0):
+        self.city = city
+        self.faults = faults or FaultProfile()
+        self.page_size = page_size
+        self.random = random.Random(seed)
+        self.calls: Counter = Counter()
+        self.injected: Counter = Counter()
+        self.base_url = ""
+        handlers = {
+            "station_search": self._station_search,
+            "station_info": self._station_info,
+            "route_info": self._route_info,
+        }
+        self.app = Starlette(routes=[
+            *(Route(f"/ws/rest/{ENDPOINTS[name]}", self._endpoint(name, handler))
+              for name, handler in handlers.items()),
+            Route("/__sim/stats", self._stats),
+            Route("/__sim/faults", self._faults, methods=["GET", "PUT"]),
+        ])
+
+    def _endpoint(self, name: str, handler: Callable[[Dict[str, str]], str]):
+        endpoint = ENDPOINTS[name]
+
+        async def handle(request: Request) -> Response:
+            self.calls[endpoint] += 1
+            delay, slow = self.faults.delay(name, self.random)
+            status = self.faults.error(self.random)
+            if slow:
+                self.injected["slow"] += 1
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if status is not None:
+                self.injected[f"status_{status}"] += 1
+                return Response(f"simulated upstream error {status}", status_code=status,
+                                media_type="text/plain")
+            return Response(handler(dict(request.query_params)),
+                            media_type="application/xml;charset=UTF-8")
+
+        return handle
+
+    def _station_search(self, params: Dict[str, str]) -> str:
+        try:
+            lat, lon = float(params["lat"]), float(params["lon"])
+            radius = float(params.get("radius", 1000))
+        except (KeyError, ValueError):
+            return _document(2)
+        found = self.city.near(lat, lon, radius, self.page_size)
+        if not found:
+            return _document(4)
+        return _document(0, "".join(
+            "<busStationList>"
+            "<centerYn>N</centerYn><districtCd>2</districtCd><regionName>성남</regionName>"
+            f"<mobileNo> {s.station_id[-5:]}</mobileNo>"
+            f"<stationId>{s.station_id}</stationId><stationName>{escape(s.name)}</stationName>"
+            f"<x>{s.lon}</x><y>{s.lat}</y><latitude>{s.lat}</latitude><longitude>{s.lon}</longitude>"
+            f"<busRouteCount>{len(s.routes)}</busRouteCount><distance>{int(d)}</distance>"
+            "</busStationList>"
+            for d, s in found
+        ))
+
+    def _station_info(self, params: Dict[str, str]) -> str:
+        if "stationId" not in params:
+            return _document(2)
+        station = self.city.station(params["stationId"])
+        if station is None:
+            return _document(4)
+        routes = [self.city.routes[i] for i in station.routes]
+        return _document(0, (
+            "<busStationInfo><centerYn>N</centerYn><districtCd>2</districtCd>"
+            f"<regionName>성남</regionName><stationId>{station.station_id}</stationId>"
+            f"<stationName>{escape(station.name)}</stationName>"
+            f"<latitude>{station.lat}</latitude><longitude>{station.lon}</longitude>"
+            "</busStationInfo>"
+        ) + "".join(
+            "<busRouteList><districtCd>2</districtCd><regionName>성남</regionName>"
+            f"<routeId>{r.route_id}</routeId><routeName>{escape(r.name)}</routeName>"
+            f"<routeTypeCd>{r.type_cd}</routeTypeCd>"
+            f"<staOrder>{r.stations.index(station.index) + 1}</staOrder></busRouteList>"
+            for r in routes
+        ))
+
+    def _route_info(self, params: Dict[str, str]) -> str:
+        if "routeId" not in params:
+            return _document(2)
+        route = self.city.route(params["routeId"])
+        if route is None:
+            return _document(4)
+        stations = [self.city.stations[i] for i in route.stations]
+        first, last = stations[0], stations[-1]
+        return _document(0, (
+            "<busRouteInfoItem><districtCd>2</districtCd>"
+            f"<routeId>{route.route_id}</routeId><routeName>{escape(route.name)}</routeName>"
+            f"<routeTypeCd>{route.type_cd}</routeTypeCd>"
+            f"<startStationId>{first.station_id}</startStationId>"
+            f"<startStationName>{escape(first.name)}</startStationName>"
+            f"<endStationId>{last.station_id}</endStationId>"
+            f"<endStationName>{escape(last.name)}</endStationName>"
+            "</busRouteInfoItem>"
+        ) + "".join(
+            f"<stationList><stationId>{s.station_id}</stationId>"
+            f"<stationName>{escape(s.name)}</stationName>"
+            f"<stationSeq>{seq}</stationSeq><sequence>{seq}</sequence>"
+            f"<x>{s.lon}</x><y>{s.lat}</y><turnYn>N</turnYn></stationList>"
+            for seq, s in enumerate(stations, 1)
+        ))
+
+    async def _stats(self, request: Request) -> JSONResponse:
+        return JSONResponse({
+            "stations": len(self.city.stations),
+            "routes": len(self.city.routes),
+            "calls": dict(self.calls),
+            "injected": dict(self.injected),
+            "faults": self.faults.as_dict(),
+        })
+
+    async def _faults(self, request: Request) -> JSONResponse:
+        if request.method == "PUT":
+            try:
+                self.faults.update(await request.json())
+            except ValueError as e:
+                return JSONResponse({"detail": str(e)}, status_code=422)
+        return JSONResponse(self.faults.as_dict())
+
+    @contextmanager
+    def serve(self) -> Iterator["GBISSimulator"]:
+        """백그라운드 스레드에서 서버 실행, 종료 시 정지 (벤치마크용)."""
+        with serve_in_thread(self.app) as base_url:
+            self.base_url = base_url
+            yield self
+
+
+def _endpoint_latency(value: str) -> Tuple[str, str]:
+    name, sep, spec = value.partition("=")
+    if not sep or name not in ENDPOINTS:
+        raise argparse.ArgumentTypeError(f"형식: {'|'.join(ENDPOINTS)}=분포 ({value})")
+    parse_latency(spec)
+    return name, spec
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--stations", type=int, default=30000)
+    parser.add_argument("--routes", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--page-size", type=int, default=100,
+                        help="정류소 검색 한 번에 반환할 최대 개수")
+    parser.add_argument("--latency", default="const:0", help="예: lognormal:40,0.5")
+    parser.add_argument("--endpoint-latency", type=_endpoint_latency, action="append",
+                        default=[], help="엔드포인트별 분포, 예: station_search=pareto:30,2")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", default="500,503",
+                        help="오류 주입 시 고를 상태 코드 목록")
+    parser.add_argument("--slow-rate", type=float, default=0.0)
+    parser.add_argument("--slow-ms", type=float, default=5000.0)
+    args = parser.parse_args()
+
+    faults = FaultProfile(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_statuses=[int(s) for s in args.error_status.split(",") if s],
+        slow_rate=args.slow_rate,
+        slow_ms=args.slow_ms,
+        endpoint_latency=dict(args.endpoint_latency),
+    )
+    start = time.perf_counter()
+    city = build_city(args.stations, args.routes, args.seed)
+    served = sum(1 for s in city.stations if s.routes)
+    print(f"도시 생성: 정류소 {len(city.stations)}개 (노선 경유 {served}개), "
+          f"노선 {len(city.routes)}개, {time.perf_counter() - start:.1f}초")
+    print(f"BUSINFO_GBIS_BASE_URL=http://{args.host}:{args.port}/ws/rest")
+    simulator = GBISSimulator(city, faults, page_size=args.page_size, seed=args.seed)
+    uvicorn.run(simulator.app, host=args.host, port=args.port, log_level="warning",
+                access_log=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Shared test fixtures."""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.database.config import get_async_db
+from app.database.models import Base
+from app.main import app
+
+
+@pytest.fixture
+def async_db():
+    """In-memory async database wired into the app's get_async_db dependency.
+
+    Yields the session factory so tests can seed data directly.
+    """
+    engine = create_async_engine(
+        "sqlite+aiosqlite://", poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    async def create_tables():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_db():
+        async with sessions() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_db
+    yield sessions
+    app.dependency_overrides.pop(get_async_db, None)
@@ -0,0 +1,70 @@
+"""Tests for the columnar ridership aggregation."""
+
+from datetime import date
+
+import numpy as np
+
+from app.services.aggregation import RidershipCube
+
+
+def hourly(**counts):
+    """24-hour distribution from h<hour>=count keywords."""
+    hours = [0] * 24
+    for key, count in counts.items():
+        hours[int(key[1:])] = count
+    return hours
+
+
+def make_cube():
+    rows = [
+        ("a", date(2024, 1, 15), hourly(h8=30, h18=20)),
+        ("a", date(2024, 1, 16), hourly(h9=10)),
+        ("b", date(2024, 1, 15), hourly(h7=5, h8=5, h18=90)),
+        ("c", date(2024, 1, 21), hourly(h12=40)),
+        ("a", date(2024, 1, 22), hourly(h8=999)),  # 기간 밖
+    ]
+    return RidershipCube.from_hourly(rows, date(2024, 1, 15), 7, ["a", "b", "c", "d"])
+
+
+def test_totals_averages_and_peaks():
+    """Test sums, per-day means and peak-hour argmax over the cube."""
+    cube = make_cube()
+    assert cube.counts.shape == (4, 7, 24)
+    assert cube.station_totals.tolist() == [60, 100, 40, 0]
+    assert cube.daily_average().tolist() == [30, 100, 40, 0]
+    assert cube.peak_hours()[0, :2].tolist() == [8, 9]
+    assert cube.peak_hours()[3, 0] == -1
+    assert np.allclose(cube.hourly_mean()[0, 8], 15.0)
+
+
+def test_top_k_and_percentiles():
+    """Test ranking and daily-total percentiles ignore missing days."""
+    cube = make_cube()
+    assert cube.top_k(2) == [1, 0]
+    assert cube.top_k(10) == [1, 0, 2, 3]
+    assert cube.percentiles((0, 50, 100)) == {"p0": 10.0, "p50": 45.0, "p100": 100.0}
+
+
+def test_weekly_ridership_model():
+    """Test the cube feeds WeeklyRidership with newest days first."""
+    weekly = make_cube().weekly_ridership(0, "판교역")
+    assert (weekly.total_count, weekly.average_daily, weekly.stop_name) == (60, 30, "판교역")
+    assert [(d.date, d.passenger_count, d.peak_hour) for d in weekly.week_data] == [
+        ("2024-01-16", 10, 9), ("2024-01-15", 50, 8)
+    ]
+
+
+def test_from_daily_keeps_totals_and_peak_hours():
+    """Test daily-total responses round-trip through the cube."""
+    cube = RidershipCube.from_daily({
+        "1": {"week_data": [
+            {"date": "2024-01-15", "passenger_count": 120, "peak_hour": 8},
+            {"date": "2024-01-14", "passenger_count": 80, "peak_hour": 7},
+        ]},
+    }, ["1", "2"])
+    summary = cube.summary({"1": "판교역"}, "Last 7 days")
+    assert summary["total_stops"] == 2
+    assert summary["total_weekly_ridership"] == 200
+    assert summary["top_stop"] == {"name": "판교역", "weekly_count": 200}
+    assert summary["average_per_stop"] == 100
+    assert [d.peak_hour for d in cube.week_data(0)] == [8, 7]
@@ -0,0 +1,76 @@
+"""Tests for the upstream response cache."""
+
+import asyncio
+
+from app.services.cache import TTLCache
+
+
+def test_lru_eviction():
+    """Test least recently used entries are evicted first."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiry():
+    """Test entries expire after their TTL."""
+    cache = TTLCache(maxsize=2, ttl=-1)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_concurrent_misses_share_one_load():
+    """Test a thundering herd costs a single loader call."""
+    cache = TTLCache(maxsize=8, ttl=60)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": 1}
+
+    async def run():
+        return await asyncio.gather(
+            *(cache.get_or_load("key", loader) for _ in range(10))
+        )
+
+    results = asyncio.run(run())
+    assert calls == 1
+    assert all(result == {"value": 1} for result in results)
+    assert cache.stats()["coalesced"] == 9
+    asyncio.run(cache.get_or_load("key", loader))
+    assert cache.stats()["hits"] == 1
+
+
+def test_empty_results_are_not_cached():
+    """Test failed lookups are retried on the next request."""
+    cache = TTLCache(maxsize=8, ttl=60)
+
+    async def loader():
+        return {}
+
+    asyncio.run(cache.get_or_load("key", loader))
+    asyncio.run(cache.get_or_load("key", loader))
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["size"] == 0
+
+
+def test_cacheable_filters_loaded_values():
+    """Test values rejected by cacheable are returned but not stored."""
+    cache = TTLCache(maxsize=8, ttl=60, cacheable=lambda value: bool(value.get("id")))
+
+    async def run():
+        blank = await cache.get_or_load("a", lambda: asyncio.sleep(0, {"id": ""}))
+        found = await cache.get_or_load("b", lambda: asyncio.sleep(0, {"id": "b"}))
+        return blank, found
+
+    assert asyncio.run(run()) == ({"id": ""}, {"id": "b"})
+    assert cache.get("a") is None
+    assert cache.get("b") == {"id": "b"}
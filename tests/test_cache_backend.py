@@ -0,0 +1,205 @@
+"""Tests for upstream payload cache backends."""
+
+import asyncio
+import time
+
+import httpx
+
+from app.services.cache_backend import (
+    MemoryCacheBackend,
+    SQLiteCacheBackend,
+    payload_key,
+)
+from app.services.real_api_client import RealBusAPIClient
+from tests.test_real_api_client import STATION_INFO_XML, gbis_handler
+
+
+def test_payload_key_ignores_api_key_and_param_order():
+    """Test cache keys are stable across param order and API keys."""
+    first = payload_key("a/b", {"apiKey": "x", "lat": 1, "lon": 2})
+    second = payload_key("a/b", {"lon": 2, "lat": 1, "apiKey": "y"})
+    assert first == second == "a/b?lat=1&lon=2"
+
+
+def test_sqlite_backend_is_shared_between_instances(tmp_path):
+    """Test two workers opening the same file see each other's writes."""
+    path = str(tmp_path / "cache.db")
+    writer = SQLiteCacheBackend(path)
+    reader = SQLiteCacheBackend(path)
+
+    async def run():
+        await writer.set("key", "<xml/>", fetched_at=100.0)
+        return await reader.get("key")
+
+    payload = asyncio.run(run())
+    assert payload.body == "<xml/>"
+    assert payload.fetched_at == 100.0
+
+
+def test_sqlite_backend_keeps_newest_payload(tmp_path):
+    """Test an older write does not overwrite a newer one."""
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.db"))
+
+    async def run():
+        await backend.set("key", "new", fetched_at=200.0)
+        await backend.set("key", "old", fetched_at=100.0)
+        return await backend.get("key")
+
+    assert asyncio.run(run()).body == "new"
+
+
+def test_memory_backend_bounded():
+    """Test the memory backend evicts beyond max_entries."""
+    backend = MemoryCacheBackend(max_entries=1)
+
+    async def run():
+        await backend.set("a", "1")
+        await backend.set("b", "2")
+        return await backend.get("a"), await backend.get("b")
+
+    evicted, kept = asyncio.run(run())
+    assert evicted is None
+    assert kept.body == "2"
+
+
+def test_cold_start_reads_from_persistent_backend(tmp_path):
+    """Test a fresh client serves from disk without touching the upstream."""
+    path = str(tmp_path / "cache.db")
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return gbis_handler(request)
+
+    async def run():
+        warm = RealBusAPIClient(transport=httpx.MockTransport(handler),
+                                cache_backend=SQLiteCacheBackend(path))
+        await warm.get_stop_info("228000001")
+        cold = RealBusAPIClient(transport=httpx.MockTransport(handler),
+                                cache_backend=SQLiteCacheBackend(path))
+        return await cold.get_stop_info("228000001")
+
+    info = asyncio.run(run())
+    assert len(calls) == 1
+    assert info["stationName"] == "판교역"
+
+
+def test_stale_payload_served_while_revalidating():
+    """Test a stale entry is returned immediately and refreshed in background."""
+    backend = MemoryCacheBackend()
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return gbis_handler(request)
+
+    client = RealBusAPIClient(transport=httpx.MockTransport(handler),
+                              cache_backend=backend)
+    key = payload_key(client.STATION_INFO, {"stationId": "228000001"})
+    stale_body = STATION_INFO_XML.replace("판교역", "판교역(구)")
+    stale_at = time.time() - client.payload_ttl[client.STATION_INFO] - 10
+
+    async def run():
+        await backend.set(key, stale_body, fetched_at=stale_at)
+        info = await client.get_stop_info("228000001")
+        await asyncio.gather(*client._revalidating.values())
+        return info, await backend.get(key)
+
+    info, refreshed = asyncio.run(run())
+    assert info["stationName"] == "판교역(구)"
+    assert len(calls) == 1
+    assert refreshed.body == STATION_INFO_XML
+
+
+def test_error_result_codes_are_not_cached():
+    """Test GBIS error/no-result payloads are returned but never stored."""
+    backend = MemoryCacheBackend()
+    calls = []
+    not_found = (
+        "<response><msgHeader><resultCode>4</resultCode>"
+        "<resultMessage>결과가 존재하지 않습니다.</resultMessage></msgHeader></response>"
+    )
+
+    def handler(request):
+        calls.append(request.url)
+        if request.url.params["stationId"] == "999":
+            return httpx.Response(200, text=not_found)
+        return httpx.Response(200, text=STATION_INFO_XML.replace(
+            "<msgBody>", "<msgHeader><resultCode>0</resultCode></msgHeader><msgBody>"
+        ))
+
+    client = RealBusAPIClient(transport=httpx.MockTransport(handler), cache_backend=backend)
+
+    async def run():
+        await client._fetch_xml(client.STATION_INFO, {"stationId": "999"})
+        await client._fetch_xml(client.STATION_INFO, {"stationId": "999"})
+        await client._fetch_xml(client.STATION_INFO, {"stationId": "228000001"})
+        return (
+            await backend.get(payload_key(client.STATION_INFO, {"stationId": "999"})),
+            await backend.get(payload_key(client.STATION_INFO, {"stationId": "228000001"})),
+        )
+
+    missing, stored = asyncio.run(run())
+    assert missing is None
+    assert stored is not None
+    assert len(calls) == 3
+
+
+def test_sqlite_purge_drops_expired_and_excess_rows(tmp_path):
+    """Test purge removes expired payloads and trims to max_entries, oldest first."""
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.db"), max_entries=2)
+    now = time.time()
+
+    async def run():
+        await backend.set("expired", "0", fetched_at=now - 1000)
+        for index in range(3):
+            await backend.set(f"key{index}", str(index), fetched_at=now - 10 + index)
+        removed = await backend.purge(older_than=100)
+        return removed, [await backend.get(f"key{index}") for index in range(3)]
+
+    removed, payloads = asyncio.run(run())
+    assert removed == 2
+    assert payloads[0] is None
+    assert [p.body for p in payloads[1:]] == ["1", "2"]
+
+
+def test_client_close_awaits_revalidation_and_closes_backend():
+    """Test close waits for cancelled refreshes and closes the cache backend."""
+    closed = []
+
+    class Backend(MemoryCacheBackend):
+        async def close(self):
+            closed.append(True)
+
+    client = RealBusAPIClient(transport=httpx.MockTransport(gbis_handler),
+                              cache_backend=Backend())
+
+    async def run():
+        task = asyncio.create_task(asyncio.sleep(60))
+        client._revalidating["key"] = task
+        await client.close()
+        return task
+
+    task = asyncio.run(run())
+    assert task.cancelled()
+    assert closed == [True]
+
+
+def test_purge_cache_is_throttled():
+    """Test the client purges at most once per interval using fresh + stale TTL."""
+    backend = MemoryCacheBackend()
+    client = RealBusAPIClient(transport=httpx.MockTransport(gbis_handler),
+                              cache_backend=backend)
+    horizon = max(client.payload_ttl.values()) + client.stale_ttl
+
+    async def run():
+        await backend.set("old", "1", fetched_at=time.time() - horizon - 10)
+        await backend.set("recent", "2")
+        first = await client.purge_cache()
+        await backend.set("old", "1", fetched_at=time.time() - horizon - 10)
+        second = await client.purge_cache()
+        return first, second, await backend.get("recent")
+
+    first, second, recent = asyncio.run(run())
+    assert (first, second) == (1, 0)
+    assert recent is not None
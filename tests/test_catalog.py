@@ -0,0 +1,81 @@
+"""Tests for the indexed route/stop catalog."""
+
+import json
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import Base, BusRoute, BusStop, RouteStation
+from app.services import catalog as catalog_module
+from app.services.catalog import SAMPLE_ROUTES, SAMPLE_STOPS, Catalog
+
+
+def test_indexes_and_filters():
+    """Test id lookups, normalized origin/destination and stop-name indexes."""
+    snapshot = Catalog(SAMPLE_ROUTES, SAMPLE_STOPS).snapshot
+    assert snapshot.routes_by_id[2]["route_number"] == "202"
+    assert snapshot.stops_by_id[4]["name"] == "Airport"
+
+    assert [r["id"] for r in snapshot.find_routes()] == [1, 2]
+    assert [r["id"] for r in snapshot.find_routes(origin="downtown")] == [1]
+    assert [r["id"] for r in snapshot.find_routes("DOWNTOWN", "airport")] == [1]
+    assert snapshot.find_routes("Downtown", "Mall") == ()
+    assert [r["id"] for r in snapshot.routes_through("main street")] == [1]
+
+
+def test_load_swaps_snapshot_atomically(tmp_path):
+    """Test reloading builds a new snapshot and leaves the old one intact."""
+    catalog = Catalog(SAMPLE_ROUTES, SAMPLE_STOPS)
+    before = catalog.snapshot
+
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps({
+        "routes": [{"id": 7, "route_number": "7", "origin": "A", "destination": "B",
+                    "stops": ["A", "B"]}],
+        "stops": [{"id": 9, "name": "A", "location": "x"}],
+    }))
+    after = catalog.load_file(str(path))
+
+    assert catalog.snapshot is after
+    assert after.version != before.version
+    assert list(after.routes_by_id) == [7]
+    assert list(before.routes_by_id) == [1, 2]
+    assert [doc for doc, _ in after.route_search_index.search("b")] == [7]
+
+
+def test_bad_catalog_file_falls_back_to_empty(tmp_path, monkeypatch):
+    """Test a missing or malformed catalog file logs and starts empty instead of raising."""
+    monkeypatch.setattr(catalog_module, "CATALOG_SOURCE", "file")
+    malformed = tmp_path / "bad.json"
+    malformed.write_text("{not json")
+    wrong_shape = tmp_path / "list.json"
+    wrong_shape.write_text("[]")
+
+    for path in (tmp_path / "missing.json", malformed, wrong_shape):
+        monkeypatch.setattr(catalog_module, "CATALOG_PATH", str(path))
+        snapshot = catalog_module.initial_catalog().snapshot
+        assert not snapshot.routes and not snapshot.stops
+
+
+def test_load_db():
+    """Test the catalog can be built from stored routes and stops."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    db.add_all([
+        BusStop(station_id="s1", station_name="판교역", latitude=37.3947, longitude=127.1112),
+        BusStop(station_id="s2", station_name="서현역", latitude=37.385, longitude=127.123),
+        BusRoute(route_id="r1", route_name="9007", route_type="11",
+                 start_station="판교역", end_station="서현역"),
+        RouteStation(route_id="r1", sequence=2, station_id="s2", station_name="서현역"),
+        RouteStation(route_id="r1", sequence=1, station_id="s1", station_name="판교역"),
+    ])
+    db.commit()
+
+    snapshot = Catalog().load_db(db)
+    route = snapshot.routes_by_id[1]
+    assert route["route_number"] == "9007"
+    assert route["stops"] == ["판교역", "서현역"]
+    assert [r["id"] for r in snapshot.find_routes(origin="판교역")] == [1]
+    assert snapshot.stops_by_id[2]["location"] == "37.385000, 127.123000"
+    db.close()
@@ -0,0 +1,115 @@
+"""Tests for the local GBIS simulator."""
+
+import asyncio
+import random
+
+import httpx
+import pytest
+
+from app.services.real_api_client import RealBusAPIClient
+from app.services.resilience import UpstreamUnavailableError
+from benchmarks.gbis_simulator import FaultProfile, GBISSimulator, build_city, parse_latency
+
+
+@pytest.fixture(scope="module")
+def city():
+    """Small seeded city shared by the tests."""
+    return build_city(stations=800, routes=80, seed=3)
+
+
+def make_client(simulator):
+    """Build a GBIS client wired to the simulator app in-process."""
+    return RealBusAPIClient(transport=httpx.ASGITransport(app=simulator.app))
+
+
+def test_city_is_deterministic(city):
+    """Test the same seed builds the same stations and routes."""
+    again = build_city(stations=800, routes=80, seed=3)
+    assert [(s.name, s.lat, s.lon) for s in again.stations] == \
+        [(s.name, s.lat, s.lon) for s in city.stations]
+    assert [(r.name, r.stations) for r in again.routes] == \
+        [(r.name, r.stations) for r in city.routes]
+    assert build_city(stations=800, routes=80, seed=4).stations[0].lat != city.stations[0].lat
+
+
+def test_client_parses_station_and_route(city):
+    """Test station and route responses agree with each other through the client."""
+    client = make_client(GBISSimulator(city))
+    route = city.routes[0]
+    station = city.stations[route.stations[1]]
+
+    async def run():
+        info = await client.get_stop_info(station.station_id)
+        detail = await client.get_route_info(route.route_id)
+        await client.close()
+        return info, detail
+
+    info, detail = asyncio.run(run())
+    assert info["stationName"] == station.name
+    assert route.route_id in [r["routeId"] for r in info["routes"]]
+    assert [s["stationId"] for s in detail["stations"]] == \
+        [city.stations[i].station_id for i in route.stations]
+    assert detail["stations"][1]["sequence"] == 2
+
+
+def test_area_crawl_splits_saturated_tiles(city):
+    """Test a small page size forces tile splits yet finds every station in the area."""
+    client = make_client(GBISSimulator(city, page_size=20))
+    client.page_size = 20
+    lat, lon = city.center
+    box = (lat - 0.006, lat + 0.006, lon - 0.008, lon + 0.008)
+
+    stops = asyncio.run(client.get_stops_in_area(*box))
+    expected = {
+        s.station_id for s in city.stations
+        if box[0] <= s.lat <= box[1] and box[2] <= s.lon <= box[3]
+    }
+    assert len(expected) > 20
+    assert {s["stationId"] for s in stops} == expected
+
+
+def test_injected_errors_exhaust_retries(city, monkeypatch):
+    """Test injected 503s surface as upstream unavailability and are counted."""
+    monkeypatch.setenv("BUSINFO_RETRY_BASE_DELAY", "0")
+    simulator = GBISSimulator(city, FaultProfile(error_rate=1.0, error_statuses=[503]))
+    client = make_client(simulator)
+
+    with pytest.raises(UpstreamUnavailableError):
+        asyncio.run(client.get_stop_info(city.stations[0].station_id))
+    assert simulator.injected["status_503"] == client.retry_policy.max_attempts
+
+
+def test_fault_endpoint_updates_profile(city):
+    """Test faults can be changed at runtime and invalid specs are rejected."""
+    simulator = GBISSimulator(city)
+
+    async def run():
+        transport = httpx.ASGITransport(app=simulator.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://sim") as http:
+            ok = await http.put("/__sim/faults", json={
+                "latency": "lognormal:40,0.5",
+                "endpoint_latency": {"station_search": "pareto:30,2"},
+                "slow_rate": 0.1,
+            })
+            bad = await http.put("/__sim/faults", json={"latency": "gamma:1"})
+            missing = await http.get("/ws/rest/routeinfo/getRouteWithStationList",
+                                     params={"routeId": "1"})
+            stats = await http.get("/__sim/stats")
+            return ok, bad, missing, stats
+
+    ok, bad, missing, stats = asyncio.run(run())
+    assert ok.json()["endpoint_latency"] == {"station_search": "pareto:30,2"}
+    assert bad.status_code == 422
+    assert simulator.faults.latency == "lognormal:40,0.5"
+    assert "<resultCode>4</resultCode>" in missing.text
+    assert stats.json()["calls"] == {"routeinfo/getRouteWithStationList": 1}
+
+
+def test_parse_latency_distributions():
+    """Test latency specs sample in milliseconds and reject unknown shapes."""
+    rng = random.Random(0)
+    assert parse_latency("const:20")(rng) == 0.02
+    assert 0.01 <= parse_latency("uniform:10,50")(rng) <= 0.05
+    assert parse_latency("pareto:10,2")(rng) >= 0.01
+    with pytest.raises(ValueError):
+        parse_latency("normal:20")
@@ -13,7 +13,7 @@ def test_root():
     assert response.status_code == 200
     data = response.json()
     assert "message" in data
-    assert data["message"] == "Welcome to Bus Searcher API"
+    assert data["message"] == "Welcome to Bus Searcher API - Pangyo-dong Statistics"
     assert "version" in data
     assert "endpoints" in data
 
@@ -130,3 +130,38 @@ def test_search_routes_by_route_number():
     data = response.json()
     assert data["count"] > 0
     assert any(route["route_number"] == "101" for route in data["results"])
+
+
+def test_search_substring_and_ranking():
+    """Test search keeps substring matching and ranks route numbers first."""
+    data = client.get("/search?query=air").json()
+    assert [route["route_number"] for route in data["results"]] == ["101"]
+    assert client.get("/search?query=nowhere").json()["count"] == 0
+
+
+def test_search_suggest():
+    """Test autocomplete over routes and stops."""
+    response = client.get("/search/suggest?query=ma&limit=3")
+    assert response.status_code == 200
+    labels = [item["label"] for item in response.json()["suggestions"]]
+    assert "Main Street" in labels
+
+
+def test_list_endpoints_support_etags():
+    """Test /routes and /stops return 304 for a matching If-None-Match."""
+    response = client.get("/routes")
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"].startswith("public")
+
+    assert client.get("/routes", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/routes", headers={"If-None-Match": f'"other", W/{etag}'}).status_code == 304
+    assert client.get("/routes?origin=Downtown", headers={"If-None-Match": etag}).status_code == 200
+    assert client.get("/stops", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_stop_routes():
+    """Test routes passing through a stop come from the stop-name index."""
+    response = client.get("/stops/2/routes")
+    assert response.status_code == 200
+    assert [route["route_number"] for route in response.json()] == ["101"]
+    assert client.get("/stops/999/routes").status_code == 404
@@ -0,0 +1,73 @@
+"""Tests for the in-process metrics registry and /metrics endpoint."""
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import real_statistics
+from app.main import app
+from app.services.metrics import Registry, _Metric
+from app.services.real_api_client import RealBusAPIClient
+from tests.test_real_api_client import gbis_handler
+
+
+def test_registry_renders_prometheus_text():
+    """Test counters, gauges and cumulative histogram buckets."""
+    registry = Registry()
+    requests = registry.counter("requests", "Requests", ["path"])
+    in_flight = registry.gauge("in_flight", "In flight")
+    latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+
+    requests.labels('/a"b').inc()
+    requests.labels('/a"b').inc(2)
+    in_flight.inc()
+    in_flight.inc()
+    in_flight.dec()
+    for value in (0.05, 0.5, 0.5, 3.0):
+        latency.observe(value)
+    registry.add_collector(lambda: [("hits", "counter", "Hits", [({"cache": "x"}, 4)])])
+
+    lines = registry.render().splitlines()
+    assert "# TYPE requests counter" in lines
+    assert 'requests_total{path="/a\\"b"} 3' in lines
+    assert "in_flight 1" in lines
+    assert 'latency_seconds_bucket{le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{le="1"} 3' in lines
+    assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+    assert "latency_seconds_sum 4.05" in lines
+    assert "latency_seconds_count 4" in lines
+    assert 'hits_total{cache="x"} 4' in lines
+
+
+def test_metrics_endpoint_reports_stages(async_db, monkeypatch):
+    """Test request, upstream, XML parse and DB timings are exposed per label."""
+    monkeypatch.setattr(
+        real_statistics, "api_client",
+        RealBusAPIClient(transport=httpx.MockTransport(gbis_handler)),
+    )
+    client = TestClient(app)
+    assert client.get("/routes/1").status_code == 200
+    assert client.get("/api/real/stops/228000001/info").status_code == 200
+    client.get("/api/real/stops")
+
+    response = client.get("/metrics")
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert 'http_request_duration_seconds_count{method="GET",route="/routes/{route_id}",status="200"}' in text
+    assert 'gbis_request_duration_seconds_count{endpoint="stationinfo/getStationWithBusLisInfo",status="200"}' in text
+    assert 'gbis_xml_parse_duration_seconds_count{kind="station_info"}' in text
+    assert 'db_query_duration_seconds_count{handler="/api/real/stops"}' in text
+    assert 'gbis_cache_hit_ratio{cache="stop_info"}' in text
+    assert "http_requests_in_flight 1" in text
+
+
+def test_metric_without_hooks_fails_on_creation():
+    """Test a metric type missing its hooks fails when built, not at scrape time."""
+    class Incomplete(_Metric):
+        kind = "gauge"
+
+        def _new_child(self):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete("incomplete", "missing samples()")
@@ -0,0 +1,73 @@
+"""Tests for the ridership_data schema migration."""
+
+from datetime import date
+
+from sqlalchemy import Date, create_engine, inspect, text
+from sqlalchemy.orm import Session
+
+from app.database import migrations
+from app.database.models import Base, RidershipDaily, RidershipData, RidershipWeekly
+from app.services import rollups
+
+LEGACY_SCHEMA = [
+    "CREATE TABLE ridership_data (id INTEGER PRIMARY KEY, station_id VARCHAR,"
+    " date VARCHAR NOT NULL, hour INTEGER, passenger_count INTEGER, created_at DATETIME)",
+    "CREATE INDEX ix_ridership_data_id ON ridership_data (id)",
+    "CREATE INDEX ix_ridership_data_station_id ON ridership_data (station_id)",
+    "CREATE INDEX ix_ridership_data_date ON ridership_data (date)",
+    "INSERT INTO ridership_data (station_id, date, hour, passenger_count) VALUES"
+    " ('1', '2024-01-15', 8, 30), ('1', '2024-01-15', 9, 10), ('2', '2024-01-16', 8, 5)",
+]
+
+
+def test_upgrade_legacy_sqlite_schema(tmp_path):
+    """Test string dates and single-column indexes are migrated in place."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.execute(text(statement))
+    Base.metadata.create_all(bind=engine)
+
+    assert migrations.upgrade(engine) == ["ridership_data"]
+    insp = inspect(engine)
+    date_column = next(c for c in insp.get_columns("ridership_data") if c["name"] == "date")
+    assert isinstance(date_column["type"], Date)
+    assert {i["name"] for i in insp.get_indexes("ridership_data")} == {
+        "ix_ridership_data_id", "ix_ridership_station_date_hour", "ix_ridership_hour_date"
+    }
+
+    with Session(engine) as db:
+        assert db.query(RidershipData).count() == 3
+        daily = db.query(RidershipDaily).filter_by(station_id="1").one()
+        assert (daily.date, daily.total_count, daily.peak_hour) == (date(2024, 1, 15), 40, 8)
+        assert db.query(RidershipWeekly).count() == 2
+
+    assert migrations.upgrade(engine) == []
+
+
+def test_rebuild_matches_incremental(tmp_path):
+    """Test the bulk rebuild produces the same rollups as incremental refresh."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    rows = [
+        {"station_id": str(sid), "date": f"2024-01-{day}", "hour": hour,
+         "passenger_count": sid * day + hour}
+        for sid in range(3) for day in range(10, 20) for hour in (7, 8, 18)
+    ]
+
+    def snapshot(db):
+        return sorted(
+            (r.station_id, r.date, r.total_count, r.peak_hour, tuple(r.hourly_counts))
+            for r in db.query(RidershipDaily)
+        ), sorted(
+            (r.station_id, r.week_start, r.total_count, r.days)
+            for r in db.query(RidershipWeekly)
+        )
+
+    with Session(engine) as db:
+        rollups.ingest_ridership(db, rows)
+        db.commit()
+        incremental = snapshot(db)
+        assert rollups.rebuild_rollups(db) == 30
+        db.commit()
+        assert snapshot(db) == incremental
@@ -0,0 +1,109 @@
+"""Tests for the sampling profiler middleware."""
+
+import asyncio
+import json
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import profiling
+from app.api.profiling import ProfilingMiddleware
+from app.services.profiler import SamplingProfiler
+
+
+def build_app(tmp_path, **options):
+    app = FastAPI()
+
+    def busy(seconds):
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            pass
+
+    @app.get("/blocking")
+    async def blocking():
+        time.sleep(0.03)
+        return {}
+
+    @app.get("/work/{item}")
+    async def work(item: int):
+        busy(0.03)
+        await asyncio.sleep(0.03)
+        return {"item": item}
+
+    app.add_middleware(ProfilingMiddleware, directory=str(tmp_path), interval_ms=1, **options)
+    return TestClient(app)
+
+
+def test_token_header_triggers_collapsed_profile(tmp_path):
+    """Test only requests carrying the token are profiled, tagged with route."""
+    client = build_app(tmp_path, sample_rate=0, token="secret", fmt="collapsed")
+    assert client.get("/work/1").status_code == 200
+    assert client.get("/work/1", headers={"X-Profile": "wrong"}).status_code == 200
+    assert list(tmp_path.iterdir()) == []
+
+    assert client.get("/work/1", headers={"X-Profile": "secret"}).json() == {"item": 1}
+    [path] = list(tmp_path.iterdir())
+    assert "_GET_work_item_" in path.name and path.suffix == ".collapsed"
+
+    lines = path.read_text().splitlines()
+    assert all(line.startswith("GET /work/{item} (") for line in lines)
+    kinds = {line.split(";")[1] for line in lines}
+    assert "[await]" in kinds
+    assert kinds & {"[cpu]", "[blocked]"}
+    assert any("busy" in line for line in lines)
+
+
+def test_sampled_speedscope_profile(tmp_path):
+    """Test sample-rate profiling writes a speedscope document."""
+    client = build_app(tmp_path, sample_rate=1.0, token="", fmt="speedscope")
+    client.get("/work/2")
+    [path] = list(tmp_path.iterdir())
+    document = json.loads(path.read_text())
+    profile = document["profiles"][0]
+    assert profile["type"] == "sampled"
+    assert profile["name"].startswith("GET /work/{item}")
+    assert len(profile["samples"]) == len(profile["weights"]) > 0
+    assert profile["endValue"] >= 60
+
+
+def test_blocking_call_is_not_counted_as_cpu(tmp_path):
+    """Test a sync sleep on the event loop is reported as [blocked]."""
+    client = build_app(tmp_path, sample_rate=1.0, token="", fmt="collapsed")
+    client.get("/blocking")
+    [path] = list(tmp_path.iterdir())
+    weights = {}
+    for line in path.read_text().splitlines():
+        stack, weight = line.rsplit(" ", 1)
+        kind = stack.split(";")[1]
+        weights[kind] = weights.get(kind, 0) + int(weight)
+    assert weights["[blocked]"] > weights.get("[cpu]", 0)
+
+
+def test_failed_profile_write_does_not_fail_request(tmp_path, monkeypatch, caplog):
+    """Test any error while saving a profile is logged and the response still succeeds."""
+    def broken(*args, **kwargs):
+        raise RuntimeError("dictionary changed size during iteration")
+
+    monkeypatch.setattr(profiling, "write_profile", broken)
+    client = build_app(tmp_path, sample_rate=1.0, token="", fmt="collapsed")
+    assert client.get("/work/3").json() == {"item": 3}
+    assert "dictionary changed size" in caplog.text
+
+
+def test_samples_are_frozen_after_end():
+    """Test the sampler never touches a session's samples once end() returns."""
+    profiler = SamplingProfiler(0.0005)
+
+    async def run():
+        session = profiler.begin(asyncio.current_task().get_coro())
+        end = time.perf_counter() + 0.02
+        while time.perf_counter() < end:
+            await asyncio.sleep(0)
+        profiler.end(session)
+        frozen = dict(session.samples)
+        await asyncio.sleep(0.02)
+        return frozen, dict(session.samples)
+
+    frozen, later = asyncio.run(run())
+    assert frozen and frozen == later
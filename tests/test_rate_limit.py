@@ -0,0 +1,99 @@
+"""Tests for the GBIS token-bucket rate limiter."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.rate_limit import (
+    MemoryBucketStore,
+    RateLimiter,
+    RateLimitExceeded,
+    SQLiteBucketStore,
+    parse_budgets,
+)
+from app.services.real_api_client import RealBusAPIClient
+from tests.test_real_api_client import gbis_handler
+
+
+def test_parse_budgets():
+    """Test per-endpoint budget parsing."""
+    assert parse_budgets("a=5:10, b=2") == {"a": (5.0, 10.0), "b": (2.0, 2.0)}
+
+
+def test_burst_then_shed():
+    """Test the burst is served and excess requests are shed."""
+    limiter = RateLimiter({"ep": (0.1, 2)}, max_wait=0.05)
+
+    async def run():
+        await limiter.acquire("ep")
+        await limiter.acquire("ep")
+        with pytest.raises(RateLimitExceeded):
+            await limiter.acquire("ep")
+
+    asyncio.run(run())
+    assert limiter.stats()["shed"] == 1
+
+
+def test_short_queue_when_tokens_refill():
+    """Test callers wait briefly for a refill instead of failing."""
+    limiter = RateLimiter({"ep": (50, 1)}, max_wait=1.0)
+
+    async def run():
+        await limiter.acquire("ep")
+        await limiter.acquire("ep")
+
+    asyncio.run(run())
+    assert limiter.stats()["waited"] == 1
+
+
+def test_daily_quota():
+    """Test the shared daily quota is enforced and reported."""
+    limiter = RateLimiter({"ep": (100, 100)}, store=MemoryBucketStore(), daily_quota=2)
+
+    async def run():
+        await limiter.acquire("ep")
+        await limiter.acquire("ep")
+        with pytest.raises(RateLimitExceeded):
+            await limiter.acquire("ep")
+
+    asyncio.run(run())
+    assert limiter.stats()["quota"]["remaining"] == 0
+
+
+def test_sqlite_store_shared_between_workers(tmp_path):
+    """Test two limiters on one file draw from the same bucket."""
+    path = str(tmp_path / "limits.db")
+    first = RateLimiter({"ep": (0.01, 2)}, store=SQLiteBucketStore(path), max_wait=0)
+    second = RateLimiter({"ep": (0.01, 2)}, store=SQLiteBucketStore(path), max_wait=0)
+
+    async def run():
+        await first.acquire("ep")
+        await second.acquire("ep")
+        with pytest.raises(RateLimitExceeded):
+            await first.acquire("ep")
+
+    asyncio.run(run())
+    assert second.stats()["endpoints"]["ep"]["used_today"] == 2
+
+
+def test_client_sheds_without_calling_upstream():
+    """Test shed requests never reach the upstream or trip the breaker."""
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return gbis_handler(request)
+
+    client = RealBusAPIClient(transport=httpx.MockTransport(handler))
+    client.cache_backend = None
+    client.rate_limiter = RateLimiter({client.ROUTE_INFO: (0.01, 1)}, max_wait=0)
+
+    async def run():
+        await client.get_route_info("1")
+        with pytest.raises(RateLimitExceeded):
+            await client.get_route_info("2")
+
+    asyncio.run(run())
+    assert len(calls) == 1
+    assert client.breakers[client.ROUTE_INFO].state == "closed"
@@ -0,0 +1,286 @@
+"""Tests for the GBIS API client."""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import real_statistics
+from app.main import app
+from app.services.real_api_client import RealBusAPIClient
+from app.services.resilience import UpstreamUnavailableError
+
+STATION_LIST_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <msgBody>
+    <busStationList>
+      <stationId>228000001</stationId>
+      <stationName>판교역</stationName>
+      <latitude>37.3947</latitude>
+      <longitude>127.1112</longitude>
+      <busRouteCount>12</busRouteCount>
+    </busStationList>
+    <busStationList>
+      <stationId>228000002</stationId>
+      <stationName>판교테크노밸리</stationName>
+      <latitude>37.4010</latitude>
+      <longitude>127.1090</longitude>
+      <busRouteCount>5</busRouteCount>
+    </busStationList>
+  </msgBody>
+</response>"""
+
+STATION_INFO_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <msgBody>
+    <busStationInfo>
+      <stationId>228000001</stationId>
+      <stationName>판교역</stationName>
+      <latitude>37.3947</latitude>
+      <longitude>127.1112</longitude>
+    </busStationInfo>
+    <busRouteList>
+      <routeId>234000001</routeId>
+      <routeName>9007</routeName>
+      <routeTypeCd>11</routeTypeCd>
+    </busRouteList>
+  </msgBody>
+</response>"""
+
+ROUTE_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <msgBody>
+    <busRouteInfoItem>
+      <routeId>234000001</routeId>
+      <routeName>9007</routeName>
+      <routeTypeCd>11</routeTypeCd>
+      <startStationName>판교역</startStationName>
+      <endStationName>서울역</endStationName>
+    </busRouteInfoItem>
+    <stationList>
+      <stationId>228000001</stationId>
+      <stationName>판교역</stationName>
+      <sequence>1</sequence>
+    </stationList>
+    <stationList>
+      <stationId>228000002</stationId>
+      <stationName>판교테크노밸리</stationName>
+      <sequence>2</sequence>
+    </stationList>
+  </msgBody>
+</response>"""
+
+
+def make_client(handler):
+    """Build a client whose pool is backed by a mock transport."""
+    return RealBusAPIClient(transport=httpx.MockTransport(handler))
+
+
+def gbis_handler(request: httpx.Request) -> httpx.Response:
+    """Serve canned GBIS payloads by endpoint path."""
+    if request.url.path.endswith("getStationByPolyline"):
+        return httpx.Response(200, text=STATION_LIST_XML)
+    if request.url.path.endswith("getStationWithBusLisInfo"):
+        return httpx.Response(200, text=STATION_INFO_XML)
+    if request.url.path.endswith("getRouteWithStationList"):
+        return httpx.Response(200, text=ROUTE_XML)
+    return httpx.Response(404)
+
+
+def test_client_reuses_pool_across_calls():
+    """Test that all endpoints share one pooled AsyncClient."""
+    client = make_client(gbis_handler)
+
+    async def run():
+        await client.start()
+        pool = client._client
+        await client.get_stop_info("228000001")
+        await client.get_route_info("234000001")
+        assert client._client is pool
+        await client.close()
+        assert client._client is None
+
+    asyncio.run(run())
+
+
+def test_client_starts_pool_lazily():
+    """Test that a call before start() opens the pool on demand."""
+    client = make_client(gbis_handler)
+
+    async def run():
+        info = await client.get_stop_info("228000001")
+        assert client._client is not None
+        await client.close()
+        return info
+
+    info = asyncio.run(run())
+    assert info["stationName"] == "판교역"
+    assert info["routes"][0]["routeName"] == "9007"
+
+
+def test_base_url_from_env(monkeypatch):
+    """Test BUSINFO_GBIS_BASE_URL redirects requests to another GBIS host."""
+    monkeypatch.setenv("BUSINFO_GBIS_BASE_URL", "http://127.0.0.1:8099/ws/rest/")
+    seen = []
+
+    def handler(request):
+        seen.append(str(request.url))
+        return gbis_handler(request)
+
+    info = asyncio.run(make_client(handler).get_stop_info("228000001"))
+    assert info["stationName"] == "판교역"
+    assert seen[0].startswith(
+        "http://127.0.0.1:8099/ws/rest/stationinfo/getStationWithBusLisInfo?"
+    )
+
+
+def test_get_route_info_parses_stations():
+    """Test route info parsing."""
+    client = make_client(gbis_handler)
+    route = asyncio.run(client.get_route_info("234000001"))
+    assert route["routeName"] == "9007"
+    assert [s["sequence"] for s in route["stations"]] == [1, 2]
+
+
+def test_get_stops_in_area_deduplicates():
+    """Test area search merges grid results by stationId."""
+    client = make_client(gbis_handler)
+    stops = asyncio.run(client.get_stops_in_area(37.3940, 37.4050, 127.1050, 127.1200))
+    assert sorted(s["stationId"] for s in stops) == ["228000001", "228000002"]
+
+
+def test_get_stops_in_area_fetches_cells_concurrently():
+    """Test grid cells are requested concurrently up to the semaphore cap."""
+    in_flight = 0
+    peak = 0
+    calls = []
+
+    class SlowTransport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            calls.append(request.url.params["lat"])
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, text=STATION_LIST_XML)
+
+    client = RealBusAPIClient(transport=SlowTransport())
+    client.max_concurrency = 3
+    client._semaphore = asyncio.Semaphore(3)
+    stops = asyncio.run(
+        client.get_stops_in_area(37.39, 37.41, 127.10, 127.12, rows=3, cols=4)
+    )
+    assert len(calls) == 12
+    assert peak == 3
+    assert len(stops) == 2
+
+
+def test_saturated_tile_is_subdivided():
+    """Test a tile returning a full page is split into four children."""
+    calls = []
+
+    def handler(request):
+        calls.append(int(request.url.params["radius"]))
+        return httpx.Response(200, text=STATION_LIST_XML)
+
+    client = make_client(handler)
+    client.page_size = 2
+    client.max_tile_depth = 1
+    asyncio.run(client.get_stops_in_area(37.3940, 37.4050, 127.1050, 127.1200))
+    # 1개 루트 타일 + 4개 하위 타일
+    assert len(calls) == 5
+    assert max(calls[1:]) < calls[0]
+
+
+def test_covered_tiles_are_not_refetched():
+    """Test a second area search reuses remembered tile coverage."""
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(200, text=STATION_LIST_XML)
+
+    client = make_client(handler)
+
+    async def run():
+        first = await client.get_stops_in_area(37.3940, 37.4050, 127.1050, 127.1200)
+        second = await client.get_stops_in_area(37.3940, 37.4050, 127.1050, 127.1200)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert len(calls) == 1
+    assert len(first) == len(second) == 2
+
+
+def test_failed_tiles_are_not_remembered():
+    """Test upstream failures do not mark a tile as covered."""
+    client = make_client(lambda request: httpx.Response(500))
+    client.retry_policy.base_delay = 0
+    with pytest.raises(UpstreamUnavailableError):
+        asyncio.run(client.get_stops_in_area(37.3940, 37.4050, 127.1050, 127.1200))
+    assert len(client.tile_coverage) == 0
+
+
+def test_stop_info_is_cached():
+    """Test repeated stop lookups hit the cache instead of the upstream."""
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return gbis_handler(request)
+
+    client = make_client(handler)
+
+    async def run():
+        await client.get_stop_info("228000001")
+        await client.get_stop_info("228000001")
+
+    asyncio.run(run())
+    assert len(calls) == 1
+    assert client.cache_stats()["stop_info"]["hits"] == 1
+
+
+NO_RESULT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<response>
+  <msgHeader>
+    <resultCode>4</resultCode>
+    <resultMessage>결과가 존재하지 않습니다.</resultMessage>
+  </msgHeader>
+</response>"""
+
+
+@pytest.mark.parametrize("parse_mode", ["tree", "stream"])
+def test_no_result_payload_is_not_cached_or_served(parse_mode, monkeypatch):
+    """Test a resultCode 4 lookup is empty, uncached and answered with 404."""
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(200, text=NO_RESULT_XML)
+
+    client = make_client(handler)
+    client.parse_mode = parse_mode
+
+    async def run():
+        return await client.get_stop_info("999"), await client.get_route_info("999")
+
+    assert asyncio.run(run()) == ({}, {})
+    stats = client.cache_stats()
+    assert stats["stop_info"]["size"] == stats["route_info"]["size"] == 0
+
+    monkeypatch.setattr(real_statistics, "api_client", client)
+    http = TestClient(app)
+    assert http.get("/api/real/stops/999/info").status_code == 404
+    assert http.get("/api/real/routes/999/info").status_code == 404
+    assert len(calls) == 4
+
+
+def test_payload_without_id_is_not_cached():
+    """Test a success payload missing its id element parses as no result."""
+    client = make_client(lambda request: httpx.Response(
+        200, text=ROUTE_XML.replace("<routeId>234000001</routeId>", "")
+    ))
+    assert asyncio.run(client.get_route_info("234000001")) == {}
+    assert client.cache_stats()["route_info"]["size"] == 0
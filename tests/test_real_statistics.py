@@ -0,0 +1,197 @@
+"""Tests for the real-statistics router."""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.api import fast_json, ingestion, real_statistics
+from app.database.models import BusRoute, BusStop
+from app.database.config import to_async_url, to_sync_url
+from app.main import app
+from app.services.real_api_client import RealBusAPIClient
+from app.services.route_graph import RouteGraph
+from app.services.spatial import StopIndex
+from tests.test_real_api_client import gbis_handler
+
+
+@pytest.fixture
+def client(async_db, monkeypatch):
+    """Test client backed by an in-memory async database and mock GBIS."""
+    monkeypatch.setattr(
+        real_statistics, "api_client",
+        RealBusAPIClient(transport=httpx.MockTransport(gbis_handler)),
+    )
+    monkeypatch.setattr(ingestion.scheduler, "sessions", async_db)
+    return TestClient(app)
+
+
+def run_job(name):
+    return asyncio.run(ingestion.scheduler.run_job(name))
+
+
+def test_url_driver_mapping():
+    """Test DB_URL is mapped to matching sync and async drivers."""
+    assert to_async_url("sqlite:///./a.db") == "sqlite+aiosqlite:///./a.db"
+    assert to_async_url("postgresql://u@h/db") == "postgresql+asyncpg://u@h/db"
+    assert to_sync_url("postgresql+asyncpg://u@h/db") == "postgresql://u@h/db"
+
+
+def test_fetch_then_list_stops(client):
+    """Test the stops job upserts stops that the read-only endpoints list."""
+    assert client.get("/api/real/fetch-stops").status_code == 404
+
+    assert run_job("stops")["items_changed"] == 2
+    assert run_job("stops")["items_changed"] == 0
+
+    response = client.get("/api/real/fetch-stops")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_stops"] == 2
+    assert data["ingestion"]["status"] == "success"
+
+    response = client.get("/api/real/stops")
+    assert response.status_code == 200
+    assert {s["stop_id"] for s in response.json()} == {"228000001", "228000002"}
+
+
+def test_saved_stops_etag(client):
+    """Test /api/real/stops revalidates against the stored stop version."""
+    run_job("stops")
+    etag = client.get("/api/real/stops").headers["etag"]
+    assert client.get("/api/real/stops", headers={"If-None-Match": etag}).status_code == 304
+
+    async def rename():
+        async with ingestion.scheduler.sessions() as db:
+            stop = (await db.execute(
+                select(BusStop).where(BusStop.station_id == "228000001")
+            )).scalar_one()
+            stop.station_name = "판교역 1번출구"
+            await db.commit()
+
+    asyncio.run(rename())
+    response = client.get("/api/real/stops", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()[0]["stop_name"] == "판교역 1번출구"
+
+
+def test_list_stops_empty(client):
+    """Test an empty database reports 404."""
+    assert client.get("/api/real/stops").status_code == 404
+
+
+def test_spatial_queries_after_fetch(client, monkeypatch):
+    """Test the stops job refreshes the spatial index behind the query endpoints."""
+    monkeypatch.setattr(real_statistics, "stop_index", StopIndex())
+    assert client.get("/api/real/stops/nearest?lat=37.3947&lon=127.1112").status_code == 404
+
+    run_job("stops")
+    nearest = client.get("/api/real/stops/nearest?lat=37.3947&lon=127.1112&limit=1").json()
+    assert nearest[0]["stop_id"] == "228000001"
+    assert nearest[0]["distance_m"] == 0.0
+
+    within = client.get("/api/real/stops/within?lat=37.3947&lon=127.1112&radius_m=1000").json()
+    assert [s["stop_id"] for s in within] == ["228000001", "228000002"]
+
+    bbox = client.get(
+        "/api/real/stops/bbox?lat_min=37.40&lat_max=37.41&lon_min=127.10&lon_max=127.11"
+    ).json()
+    assert [s["stop_id"] for s in bbox] == ["228000002"]
+
+
+def test_route_info_feeds_trip_planner(client, monkeypatch):
+    """Test the routes job discovers routes from stored stops and feeds trips."""
+    monkeypatch.setattr(real_statistics, "route_graph", RouteGraph())
+    assert client.get("/api/real/trips?origin=228000001&destination=228000002").status_code == 404
+
+    run_job("stops")
+    summary = run_job("routes")
+    assert summary["status"] == "success"
+    assert summary["items_changed"] == 1
+    assert run_job("routes")["items_changed"] == 0
+    data = client.get("/api/real/trips?origin=228000001&destination=228000002").json()
+    assert data["count"] == 1
+    assert data["itineraries"][0]["legs"][0]["route_name"] == "9007"
+
+
+def test_route_discovery_checkpoints_are_deduplicated(client, monkeypatch):
+    """Test phase-1 checkpoints hold unique route ids and are written every N stops."""
+    monkeypatch.setattr(ingestion, "ROUTE_DISCOVERY_CHECKPOINT_STOPS", 1)
+    saved = []
+    original = ingestion.scheduler._save_checkpoint
+
+    async def spy(name, checkpoint):
+        saved.append(dict(checkpoint))
+        await original(name, checkpoint)
+
+    monkeypatch.setattr(ingestion.scheduler, "_save_checkpoint", spy)
+    run_job("stops")
+    saved.clear()
+    run_job("routes")
+
+    # 두 정류소 모두 같은 노선을 지나므로 discovered 는 한 번만 기록
+    assert [c["discovered"] for c in saved[:2]] == [["234000001"], ["234000001"]]
+    assert "discovered" not in saved[2]
+    assert saved[2]["route_ids"] == ["234000001"]
+
+    monkeypatch.setattr(ingestion, "ROUTE_DISCOVERY_CHECKPOINT_STOPS", 100)
+    saved.clear()
+    run_job("routes")
+    assert "discovered" not in saved[0]
+
+
+def test_blank_route_info_is_not_stored(client, async_db, monkeypatch):
+    """Test a blank route lookup never creates a route row or graph entry."""
+    graph = RouteGraph()
+    monkeypatch.setattr(real_statistics, "route_graph", graph)
+
+    async def blank_route(route_id):
+        return {"routeId": "", "routeName": "", "stations": []}
+
+    monkeypatch.setattr(real_statistics.api_client, "get_route_info", blank_route)
+    run_job("stops")
+    assert run_job("routes")["items_changed"] == 0
+
+    async def stored_routes():
+        async with async_db() as db:
+            return (await db.execute(select(BusRoute.route_id))).scalars().all()
+
+    assert asyncio.run(stored_routes()) == []
+    assert graph.stats()["routes"] == 0
+
+
+def test_unknown_ingest_jobs_are_skipped(caplog):
+    """Test a typo in INGEST_JOBS is logged instead of breaking the import."""
+    assert ingestion._enabled_jobs("stops, route,,ridership") == ["stops", "ridership"]
+    assert "route" in caplog.text
+    assert "stops, routes, ridership" in caplog.text
+
+
+def test_ingestion_endpoints(client):
+    """Test the ingestion status and manual trigger endpoints."""
+    assert client.post("/api/real/ingestion/unknown/run").status_code == 404
+
+    run_job("stops")
+    status = client.get("/api/real/ingestion/status").json()
+    assert status["jobs"]["stops"]["status"] == "success"
+    assert status["jobs"]["routes"]["status"] == "idle"
+    assert status["stored"]["stops"] == 2
+
+
+def test_fast_json_matches_default_encoding(client, monkeypatch):
+    """Test the fast JSON mode emits the same documents and headers."""
+    run_job("stops")
+    paths = ["/api/real/stops", "/api/real/fetch-stops"]
+    default = [client.get(path) for path in paths]
+
+    monkeypatch.setattr(fast_json, "FAST_JSON_RESPONSES", True)
+    fast = [client.get(path) for path in paths]
+    for slow_response, fast_response in zip(default, fast):
+        assert fast_response.headers["content-type"] == "application/json"
+        assert fast_response.json() == slow_response.json()
+    assert fast[0].headers["etag"] == default[0].headers["etag"]
+
+    schema = client.get("/openapi.json").json()["paths"]["/api/real/stops"]["get"]
+    assert "StopInfo" in str(schema["responses"]["200"])
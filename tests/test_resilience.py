@@ -0,0 +1,142 @@
+"""Tests for upstream retry and circuit breaking."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import real_statistics
+from app.main import app
+from app.services import metrics
+from app.services.cache_backend import MemoryCacheBackend, payload_key
+from app.services.real_api_client import RealBusAPIClient
+from app.services.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    UpstreamUnavailableError,
+)
+from tests.test_real_api_client import STATION_INFO_XML, gbis_handler
+
+
+def make_client(handler, **kwargs):
+    """Build a client with instant retries."""
+    client = RealBusAPIClient(transport=httpx.MockTransport(handler), **kwargs)
+    client.retry_policy.base_delay = 0
+    return client
+
+
+def test_breaker_opens_and_recovers():
+    """Test closed -> open -> half_open -> closed transitions."""
+    changes = []
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=0.01,
+                             on_state_change=lambda *change: changes.append(change[1:]))
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    time.sleep(0.02)
+    assert breaker.allow()
+    assert not breaker.allow()  # 시험 호출은 하나만
+    breaker.record_success()
+    assert changes == [("closed", "open"), ("open", "half_open"), ("half_open", "closed")]
+    assert breaker.stats()["transitions"]["closed->open"] == 1
+
+
+def test_transient_errors_are_retried():
+    """Test 5xx responses are retried before succeeding."""
+    responses = iter([httpx.Response(503), httpx.Response(500)])
+
+    def handler(request):
+        return next(responses, None) or gbis_handler(request)
+
+    client = make_client(handler)
+    info = asyncio.run(client.get_stop_info("228000001"))
+    assert info["stationName"] == "판교역"
+    assert client.resilience_stats()["retry"]["retries"] == 2
+
+
+def test_exhausted_retries_raise_unavailable():
+    """Test a dead upstream surfaces as unavailable, not empty data."""
+    client = make_client(lambda request: httpx.Response(502))
+    with pytest.raises(UpstreamUnavailableError):
+        asyncio.run(client.get_route_info("234000001"))
+
+
+def test_open_breaker_fails_fast():
+    """Test requests are not sent while the breaker is open."""
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(500)
+
+    client = make_client(handler)
+    client.retry_policy.max_attempts = 1
+    client.breakers[client.ROUTE_INFO].failure_threshold = 1
+
+    async def run():
+        with pytest.raises(UpstreamUnavailableError):
+            await client.get_route_info("234000001")
+        with pytest.raises(CircuitOpenError):
+            await client.get_route_info("234000001")
+
+    asyncio.run(run())
+    assert len(calls) == 1
+
+
+def test_open_breaker_falls_back_to_cached_payload():
+    """Test expired cached data is served when the upstream is down."""
+    backend = MemoryCacheBackend()
+    client = make_client(lambda request: httpx.Response(500), cache_backend=backend)
+    client.stale_ttl = 0
+    key = payload_key(client.STATION_INFO, {"stationId": "228000001"})
+
+    async def run():
+        await backend.set(key, STATION_INFO_XML, fetched_at=time.time() - 10 ** 7)
+        return await client.get_stop_info("228000001")
+
+    assert asyncio.run(run())["stationName"] == "판교역"
+    assert client.resilience_stats()["fallbacks"] == 1
+
+
+def test_unavailable_upstream_returns_503(monkeypatch):
+    """Test the router reports upstream outages as 503."""
+    client = make_client(lambda request: httpx.Response(503))
+    client.retry_policy.max_attempts = 1
+    monkeypatch.setattr(real_statistics, "api_client", client)
+    response = TestClient(app).get("/api/real/routes/234000001/info")
+    assert response.status_code == 503
+
+
+def test_retries_and_transitions_are_exported_to_metrics(monkeypatch):
+    """Test retry, breaker transition and rejection counters reach /metrics."""
+    client = make_client(lambda request: httpx.Response(502))
+    client.retry_policy.max_attempts = 2
+    client.breakers[client.ROUTE_INFO].failure_threshold = 1
+    endpoint = client.ROUTE_INFO
+    counters = [
+        metrics.GBIS_RETRIES.labels(endpoint, "retry"),
+        metrics.GBIS_RETRIES.labels(endpoint, "exhausted"),
+        metrics.GBIS_CIRCUIT_TRANSITIONS.labels(endpoint, "closed", "open"),
+        metrics.GBIS_CIRCUIT_REJECTED.labels(endpoint),
+    ]
+    before = [counter.value for counter in counters]
+
+    async def run():
+        with pytest.raises(UpstreamUnavailableError):
+            await client.get_route_info("234000001")
+        with pytest.raises(CircuitOpenError):
+            await client.get_route_info("234000002")
+
+    asyncio.run(run())
+    assert [c.value - b for c, b in zip(counters, before)] == [1, 1, 1, 1]
+
+    monkeypatch.setattr(real_statistics, "api_client", client)
+    text = TestClient(app).get("/metrics").text
+    assert f'gbis_retries_total{{endpoint="{endpoint}",outcome="exhausted"}}' in text
+    assert (f'gbis_circuit_transitions_total{{endpoint="{endpoint}",'
+            f'from_state="closed",to_state="open"}}') in text
+    assert f'gbis_circuit_rejected_total{{endpoint="{endpoint}"}}' in text
@@ -0,0 +1,175 @@
+"""Tests for ridership rollup tables."""
+
+import asyncio
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api import fast_json
+from app.database.models import (
+    Base,
+    BusStop,
+    RidershipDaily,
+    RidershipData,
+    RidershipHourlyProfile,
+    RidershipWeekly,
+)
+from app.main import app
+from app.services import rollups
+
+
+@pytest.fixture
+def db():
+    """In-memory SQLite session."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine, class_=rollups.RollupSession)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def rollup_db(async_db):
+    """Async session factory on the app's test database that maintains rollups."""
+    return async_sessionmaker(async_db.kw["bind"], sync_session_class=rollups.RollupSession,
+                              expire_on_commit=False)
+
+
+def profile(db, station_id):
+    """Hour -> (total, days) for a station."""
+    return {
+        row.hour: (row.total_count, row.days)
+        for row in db.query(RidershipHourlyProfile).filter_by(station_id=station_id)
+    }
+
+
+def test_week_start_is_monday():
+    """Test weeks are keyed by their Monday."""
+    assert rollups.week_start("2024-01-17") == date(2024, 1, 15)
+    assert rollups.week_start(date(2024, 1, 15)) == date(2024, 1, 15)
+
+
+def test_orm_commit_maintains_rollups(db):
+    """Test adding raw rows through the ORM refreshes all rollups on commit."""
+    db.add_all([
+        RidershipData(station_id="1", date="2024-01-15", hour=8, passenger_count=30),
+        RidershipData(station_id="1", date="2024-01-15", hour=18, passenger_count=20),
+        RidershipData(station_id="1", date="2024-01-16", hour=8, passenger_count=10),
+    ])
+    db.commit()
+
+    daily = db.query(RidershipDaily).filter_by(date=date(2024, 1, 15)).one()
+    assert (daily.total_count, daily.peak_hour, daily.peak_count) == (50, 8, 30)
+    weekly = db.query(RidershipWeekly).one()
+    assert (weekly.week_start, weekly.total_count, weekly.days) == (date(2024, 1, 15), 60, 2)
+    assert profile(db, "1")[8] == (40, 2)
+    assert profile(db, "1")[18] == (20, 2)
+
+
+def test_incremental_update_and_delete(db):
+    """Test later rows and deletions only adjust affected buckets."""
+    row = RidershipData(station_id="1", date="2024-01-15", hour=8, passenger_count=30)
+    db.add(row)
+    db.commit()
+    db.add(RidershipData(station_id="1", date="2024-01-15", hour=9, passenger_count=50))
+    db.commit()
+    daily = db.query(RidershipDaily).one()
+    assert (daily.total_count, daily.peak_hour) == (80, 9)
+    assert profile(db, "1")[8] == (30, 1)
+
+    db.query(RidershipData).delete()
+    # Core 일괄 삭제는 ORM 이벤트를 거치지 않으므로 직접 갱신
+    rollups.refresh_rollups(db, [("1", "2024-01-15")])
+    db.commit()
+    assert db.query(RidershipDaily).count() == 0
+    assert db.query(RidershipWeekly).count() == 0
+    assert profile(db, "1")[8] == (0, 0)
+
+
+def test_plain_sessions_have_no_rollup_hooks(db):
+    """Test the rollup hooks are scoped to RollupSession, not every Session."""
+    plain = Session(bind=db.get_bind())
+    plain.add(RidershipData(station_id="1", date="2024-01-15", hour=8, passenger_count=30))
+    plain.commit()
+    assert plain.query(RidershipDaily).count() == 0
+    plain.close()
+
+
+def test_bulk_ingest(db):
+    """Test the Core bulk path refreshes rollups for inserted buckets."""
+    rows = [
+        {"station_id": sid, "date": "2024-01-15", "hour": hour, "passenger_count": count}
+        for sid, count in (("1", 10), ("2", 20))
+        for hour in range(24)
+    ]
+    assert rollups.ingest_ridership(db, rows) == 2
+    db.commit()
+    top = rollups.load_top_weekly(db, 1)
+    assert top[0]["stop_id"] == "2"
+    assert top[0]["total_count"] == 480
+
+
+def test_endpoints_read_rollups(rollup_db, monkeypatch):
+    """Test weekly, top-stops and summary are served from rollup tables."""
+    async def seed():
+        async with rollup_db() as session:
+            session.add(BusStop(station_id="1", station_name="판교역",
+                                latitude=37.39, longitude=127.11))
+            session.add_all([
+                RidershipData(station_id=sid, date=f"2024-01-{day}", hour=8,
+                              passenger_count=count)
+                for sid, count in (("1", 100), ("2", 50))
+                for day in (15, 16)
+            ])
+            await session.commit()
+
+    asyncio.run(seed())
+    client = TestClient(app)
+
+    weekly = client.get("/api/statistics/weekly/1").json()
+    assert weekly["stop_name"] == "판교역"
+    assert weekly["total_count"] == 200
+    assert [d["date"] for d in weekly["week_data"]] == ["2024-01-16", "2024-01-15"]
+
+    top = client.get("/api/statistics/top-stops?limit=1").json()
+    assert [s["stop_id"] for s in top] == ["1"]
+    monkeypatch.setattr(fast_json, "FAST_JSON_RESPONSES", True)
+    assert client.get("/api/statistics/top-stops?limit=1").json() == top
+    monkeypatch.setattr(fast_json, "FAST_JSON_RESPONSES", False)
+
+    summary = client.get("/api/statistics/summary").json()
+    assert summary["total_weekly_ridership"] == 300
+    assert summary["top_stop"] == {"name": "판교역", "weekly_count": 200}
+
+    hourly = client.get("/api/statistics/hourly/1").json()
+    assert hourly["hours"][8] == {"hour": 8, "total_count": 200, "average": 100.0}
+
+
+def test_weekly_etag_tracks_rollups(rollup_db):
+    """Test weekly statistics answer 304 until the station's rollups change."""
+    async def add_day(day, count):
+        async with rollup_db() as session:
+            session.add(RidershipData(station_id="1", date=f"2024-01-{day}", hour=8,
+                                      passenger_count=count))
+            await session.commit()
+
+    asyncio.run(add_day(15, 100))
+    client = TestClient(app)
+
+    response = client.get("/api/statistics/weekly/1")
+    etag = response.headers["etag"]
+    assert "must-revalidate" in response.headers["cache-control"]
+
+    response = client.get("/api/statistics/weekly/1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    asyncio.run(add_day(16, 50))
+    response = client.get("/api/statistics/weekly/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["total_count"] == 150
@@ -0,0 +1,55 @@
+"""Tests for the route graph trip planner."""
+
+from app.services.route_graph import RouteGraph
+
+
+def stations(*ids):
+    return [(station_id, station_id.lower()) for station_id in ids]
+
+
+def make_graph():
+    graph = RouteGraph()
+    graph.load([
+        ("R1", "1", stations("A", "B", "C", "D", "E", "F")),
+        ("R2", "2", stations("A", "X", "F")),
+        ("R3", "3", stations("B", "Y")),
+        ("R4", "4", stations("Y", "F")),
+    ])
+    return graph
+
+
+def summary(itineraries):
+    return [
+        (it["transfers"], it["stops"], [leg["route_id"] for leg in it["legs"]])
+        for it in itineraries
+    ]
+
+
+def test_direct_route_preferred():
+    """Test the fewest-transfer itinerary comes first and is not dominated."""
+    assert summary(make_graph().plan("A", "F")) == [(0, 2, ["R2"])]
+
+
+def test_pareto_itineraries_and_transfer_limit():
+    """Test extra transfers are only offered when they save stops."""
+    graph = make_graph()
+    graph.remove_route("R2")
+    assert summary(graph.plan("A", "F")) == [
+        (0, 5, ["R1"]), (2, 3, ["R1", "R3", "R4"])
+    ]
+    assert summary(graph.plan("A", "F", max_transfers=1)) == [(0, 5, ["R1"])]
+    legs = graph.plan("A", "Y")[0]["legs"]
+    assert [(leg["board_stop_id"], leg["alight_stop_id"]) for leg in legs] == [
+        ("A", "B"), ("B", "Y")
+    ]
+
+
+def test_incremental_route_update():
+    """Test updating one route rewires only its stops."""
+    graph = make_graph()
+    graph.update_route("R3", "3", stations("C", "Y"))
+    assert summary(graph.plan("B", "Y")) == [(1, 2, ["R1", "R3"])]
+    assert "Y" in graph
+    graph.update_route("R4", "4", stations("Z", "F"))
+    assert graph.plan("Y", "F") == []
+    assert graph.stats()["routes"] == 4
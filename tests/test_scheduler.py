@@ -0,0 +1,101 @@
+"""Tests for the background ingestion scheduler."""
+
+import asyncio
+
+from app.services.scheduler import IngestionScheduler
+
+
+def test_lease_is_single_flight_across_workers(async_db):
+    """Test only one of two schedulers sharing a database runs a job at a time."""
+    first = IngestionScheduler(async_db, interval=60)
+    second = IngestionScheduler(async_db, interval=60)
+    calls = []
+
+    async def job(ctx):
+        calls.append(ctx.name)
+        assert await second.run_job("stops") is None
+        return 3
+
+    first.register("stops", job)
+    second.register("stops", job)
+
+    summary = asyncio.run(first.run_job("stops"))
+    assert summary["status"] == "success"
+    assert summary["items_changed"] == 3
+    assert calls == ["stops"]
+
+    # 임대가 해제된 뒤에는 다른 워커도 실행 가능
+    assert asyncio.run(second.run_job("stops"))["status"] == "success"
+
+
+def test_failed_run_resumes_from_checkpoint(async_db):
+    """Test a failed run keeps its checkpoint and the next run continues from it."""
+    scheduler = IngestionScheduler(async_db, interval=60)
+    processed = []
+    fail_at = {"value": 2}
+
+    async def job(ctx):
+        for item in range(ctx.checkpoint.get("position", 0), 4):
+            if item == fail_at["value"]:
+                raise RuntimeError("upstream down")
+            processed.append(item)
+            await ctx.save(position=item + 1)
+        return len(processed)
+
+    scheduler.register("stops", job)
+    assert asyncio.run(scheduler.run_job("stops"))["status"] == "failed"
+    status = asyncio.run(scheduler.status())["jobs"]["stops"]
+    assert status["checkpoint"] == {"position": 2}
+    assert status["last_error"] == "upstream down"
+
+    fail_at["value"] = None
+    summary = asyncio.run(scheduler.run_job("stops"))
+    assert summary["resumed"] is True
+    assert processed == [0, 1, 2, 3]
+    assert asyncio.run(scheduler.status())["jobs"]["stops"]["checkpoint"] is None
+
+
+def test_local_jobs_and_status(async_db, monkeypatch):
+    """Test non-exclusive jobs run per worker and interval overrides apply."""
+    monkeypatch.setenv("INGEST_SYNC_INDEXES_INTERVAL", "5")
+    scheduler = IngestionScheduler(async_db, interval=60)
+
+    async def job(ctx):
+        return 1
+
+    scheduler.register("stops", job)
+    scheduler.register("sync-indexes", job, interval=30, exclusive=False)
+    assert asyncio.run(scheduler.run_job("sync-indexes"))["status"] == "success"
+
+    status = asyncio.run(scheduler.status())
+    assert status["enabled"] is False
+    assert status["jobs"]["stops"]["status"] == "idle"
+    assert status["jobs"]["sync-indexes"]["runs"] == 1
+    assert status["jobs"]["sync-indexes"]["interval"] == 5.0
+
+
+def test_triggered_run_is_tracked_and_cancelled_by_stop(async_db):
+    """Test trigger keeps a reference to its task so stop() can cancel it."""
+    scheduler = IngestionScheduler(async_db, interval=60)
+    started = []
+
+    async def job(ctx):
+        started.append(ctx.name)
+        await asyncio.sleep(60)
+        return 1
+
+    scheduler.register("stops", job)
+
+    async def run():
+        assert scheduler.trigger("stops") is True
+        (task,) = scheduler._triggered
+        while not started:
+            await asyncio.sleep(0.01)
+        assert scheduler.trigger("stops") is False
+        await scheduler.stop()
+        assert task.cancelled()
+        assert not scheduler._triggered and not scheduler._running
+
+    asyncio.run(run())
+    status = asyncio.run(scheduler.status())["jobs"]["stops"]
+    assert status["status"] == "interrupted"
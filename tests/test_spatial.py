@@ -0,0 +1,64 @@
+"""Tests for the in-memory stop spatial index."""
+
+import random
+
+from app.services.spatial import StopIndex
+from app.services.tiling import haversine_m
+
+
+def random_stops(count, seed=7):
+    rng = random.Random(seed)
+    return [
+        {"stop_id": str(i), "latitude": 37.35 + rng.random() * 0.1,
+         "longitude": 127.05 + rng.random() * 0.12}
+        for i in range(count)
+    ]
+
+
+def brute_force(stops, lat, lon):
+    return sorted(
+        stops, key=lambda s: (haversine_m(lat, lon, s["latitude"], s["longitude"]), s["stop_id"])
+    )
+
+
+def test_nearest_matches_brute_force():
+    """Test nearest-N agrees with a full scan, including far-away queries."""
+    stops = random_stops(2000)
+    index = StopIndex(cell_m=200)
+    assert index.load(stops) == 2000
+    rng = random.Random(1)
+    for lat, lon in [(37.4, 127.1), (37.0, 126.5)] + [
+        (37.3 + rng.random() * 0.2, 127.0 + rng.random() * 0.2) for _ in range(30)
+    ]:
+        expected = [s["stop_id"] for s in brute_force(stops, lat, lon)[:7]]
+        result = index.nearest(lat, lon, 7)
+        assert [s["stop_id"] for s in result] == expected
+        assert result[0]["distance_m"] <= result[-1]["distance_m"]
+
+
+def test_within_radius_and_bbox():
+    """Test radius and bounding-box queries return exactly the matching stops."""
+    stops = random_stops(2000)
+    index = StopIndex(cell_m=150)
+    index.load(stops)
+    lat, lon = 37.4, 127.11
+    expected = {s["stop_id"] for s in stops
+                if haversine_m(lat, lon, s["latitude"], s["longitude"]) <= 300}
+    result = index.within(lat, lon, 300)
+    assert {s["stop_id"] for s in result} == expected
+    assert all(s["distance_m"] <= 300 for s in result)
+    assert len(index.within(lat, lon, 300, limit=2)) == min(2, len(expected))
+
+    box = (37.38, 37.39, 127.06, 127.08)
+    expected = {s["stop_id"] for s in stops
+                if box[0] <= s["latitude"] <= box[1] and box[2] <= s["longitude"] <= box[3]}
+    assert {s["stop_id"] for s in index.bbox(*box)} == expected
+
+
+def test_max_distance_and_empty_index():
+    """Test max_distance_m caps nearest results and an empty index is safe."""
+    index = StopIndex()
+    assert index.nearest(37.4, 127.1) == []
+    index.load([{"stop_id": "a", "latitude": 37.4, "longitude": 127.1},
+                {"stop_id": "b", "latitude": 37.41, "longitude": 127.1}])
+    assert [s["stop_id"] for s in index.nearest(37.4, 127.1, 5, max_distance_m=500)] == ["a"]
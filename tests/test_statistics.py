@@ -0,0 +1,62 @@
+"""Tests for the mock-data statistics router."""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.api import statistics
+from app.main import app
+from app.services.api_client import BusAPIClient
+
+client = TestClient(app)
+
+COUNTS = {"22000001": 100, "22000002": 400, "22000003": 300, "22000004": 200}
+
+
+async def fake_ridership(stop_id):
+    """Deterministic ridership keyed by stop."""
+    await asyncio.sleep(0.01)
+    return {
+        "stop_id": stop_id,
+        "week_data": [
+            {"date": "2024-01-15", "stop_id": stop_id,
+             "passenger_count": COUNTS[stop_id], "peak_hour": 8},
+        ],
+        "total_count": COUNTS[stop_id],
+        "average_daily": COUNTS[stop_id] // 7,
+    }
+
+
+def test_batched_ridership_respects_concurrency_cap(monkeypatch):
+    """Test the batch API fetches stops concurrently under the cap."""
+    api = BusAPIClient()
+    in_flight = peak = 0
+
+    async def tracked(stop_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        result = await fake_ridership(stop_id)
+        in_flight -= 1
+        return result
+
+    monkeypatch.setattr(api, "get_stop_ridership", tracked)
+    result = asyncio.run(api.get_stops_ridership(list(COUNTS) * 2, max_concurrency=2))
+    assert set(result) == set(COUNTS)
+    assert peak == 2
+
+
+def test_top_stops_ranks_all_stops(monkeypatch):
+    """Test the ranking considers every stop, not just the first `limit`."""
+    monkeypatch.setattr(statistics.api_client, "get_stop_ridership", fake_ridership)
+    response = client.get("/api/statistics/top-stops?limit=2")
+    assert response.status_code == 200
+    assert [s["stop_id"] for s in response.json()] == ["22000002", "22000003"]
+
+
+def test_summary_uses_all_stops(monkeypatch):
+    """Test the summary totals and top stop."""
+    monkeypatch.setattr(statistics.api_client, "get_stop_ridership", fake_ridership)
+    data = client.get("/api/statistics/summary").json()
+    assert data["total_weekly_ridership"] == 1000
+    assert data["top_stop"] == {"name": "판교역 2번출구", "weekly_count": 400}
@@ -0,0 +1,46 @@
+"""Tests for the name search index."""
+
+from app.services.text_search import TextIndex, to_choseong
+
+STOPS = ["판교역 1번출구", "판교역 2번출구", "삼성전자 남문", "판교 테크원", "Main Street"]
+
+
+def make_index():
+    return TextIndex.build((i, [(name, 1.0)]) for i, name in enumerate(STOPS))
+
+
+def names(matches):
+    return [STOPS[doc_id] for doc_id, _ in matches]
+
+
+def test_choseong_conversion():
+    """Test Hangul syllables map to their initial consonants."""
+    assert to_choseong("판교역") == "ㅍㄱㅇ"
+    assert to_choseong("1번출구") == "1ㅂㅊㄱ"
+
+
+def test_substring_and_ranking():
+    """Test exact tokens outrank prefixes, which outrank infix matches."""
+    index = make_index()
+    assert names(index.search("판교")) == ["판교 테크원", "판교역 1번출구", "판교역 2번출구"]
+    assert names(index.search("교역")) == ["판교역 1번출구", "판교역 2번출구"]
+    assert names(index.search("STREET")) == ["Main Street"]
+    assert names(index.search("판교역 2번")) == ["판교역 2번출구"]
+    assert names(index.search("판교역2번")) == ["판교역 2번출구"]
+    assert index.search("서울역") == []
+
+
+def test_choseong_query():
+    """Test initial-consonant queries find Korean names."""
+    index = make_index()
+    assert names(index.search("ㅍㄱ")) == ["판교 테크원", "판교역 1번출구", "판교역 2번출구"]
+    assert names(index.search("ㅅㅅㅈㅈ")) == ["삼성전자 남문"]
+
+
+def test_suggest_uses_precomputed_top():
+    """Test autocomplete returns the best matches and honours the limit."""
+    index = make_index()
+    assert names(index.suggest("판", limit=2)) == ["판교역 1번출구", "판교역 2번출구"]
+    assert names(index.suggest("판교", limit=1)) == ["판교 테크원"]
+    assert names(index.suggest("ㅅㅅ")) == ["삼성전자 남문"]
+    assert index.suggest("zz") == []
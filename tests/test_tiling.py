@@ -0,0 +1,33 @@
+"""Tests for adaptive area tiling."""
+
+from app.services.tiling import Tile, haversine_m, initial_tiles
+
+
+def test_haversine_known_distance():
+    """Test one degree of latitude is about 111 km."""
+    assert abs(haversine_m(37.0, 127.0, 38.0, 127.0) - 111195) < 100
+
+
+def test_initial_tiles_cover_area_within_radius():
+    """Test the minimal grid keeps every tile inside the max radius."""
+    tiles = initial_tiles(37.30, 37.50, 127.00, 127.20, max_radius_m=1000)
+    assert all(tile.radius_m <= 1000 for tile in tiles)
+    # 한 변이 약 1414m 이므로 22km x 17.7km 영역은 16 x 13 그리드
+    assert len(tiles) == 16 * 13
+
+
+def test_small_area_uses_single_tile():
+    """Test Pangyo-sized areas fit in one query circle."""
+    tiles = initial_tiles(37.3940, 37.4050, 127.1050, 127.1200, max_radius_m=1000)
+    assert len(tiles) == 1
+    assert tiles[0].radius_m < 1000
+
+
+def test_split_produces_quadrants():
+    """Test splitting halves the tile on both axes."""
+    children = Tile(0.0, 2.0, 0.0, 2.0).split()
+    assert len(children) == 4
+    assert all(child.depth == 1 for child in children)
+    assert {child.center for child in children} == {
+        (0.5, 0.5), (0.5, 1.5), (1.5, 0.5), (1.5, 1.5)
+    }
@@ -0,0 +1,95 @@
+"""Tests for bulk stop upserts."""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import Base, BusStop
+from app.database.upsert import bulk_upsert_stops
+
+
+def make_stop(station_id, name="판교역", lat=37.3947, routes=3):
+    """Build a stop dict in the GBIS client output shape."""
+    return {
+        "stationId": station_id,
+        "stationName": name,
+        "latitude": lat,
+        "longitude": 127.1112,
+        "busRouteCount": routes,
+    }
+
+
+@pytest.fixture
+def db():
+    """In-memory SQLite session."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def test_insert_update_unchanged_counts(db):
+    """Test rows are classified and only changed rows are rewritten."""
+    assert bulk_upsert_stops(db, [make_stop("1"), make_stop("2")]) == {
+        "inserted": 2, "updated": 0, "unchanged": 0
+    }
+    db.commit()
+    before = {s.station_id: s.updated_at for s in db.query(BusStop)}
+
+    counts = bulk_upsert_stops(
+        db, [make_stop("1"), make_stop("2", name="판교역 2번"), make_stop("3")]
+    )
+    db.commit()
+    db.expire_all()
+    assert counts == {"inserted": 1, "updated": 1, "unchanged": 1}
+    stops = {s.station_id: s for s in db.query(BusStop)}
+    assert stops["2"].station_name == "판교역 2번"
+    assert stops["1"].updated_at == before["1"]
+    assert stops["2"].updated_at > before["2"]
+    assert stops["3"].created_at is not None
+
+
+def test_batches_and_duplicates(db):
+    """Test inputs larger than a batch and duplicate ids are handled."""
+    stops = [make_stop(str(i)) for i in range(25)] + [make_stop("0", name="중복")]
+    counts = bulk_upsert_stops(db, stops, batch_size=10)
+    db.commit()
+    assert counts["inserted"] == 25
+    assert db.query(BusStop).count() == 25
+    assert db.query(BusStop).filter_by(station_id="0").one().station_name == "중복"
+
+
+def test_upsert_route_replaces_changed_stations(db):
+    """Test route station sequences are persisted and only rewritten on change."""
+    from app.database.models import BusRoute, RouteStation
+    from app.database.upsert import upsert_route
+
+    route = {
+        "routeId": "234000001", "routeName": "9007", "routeTypeCd": "11",
+        "startStationName": "판교역", "endStationName": "서울역",
+        "stations": [
+            {"stationId": "2", "stationName": "B", "sequence": 2},
+            {"stationId": "1", "stationName": "A", "sequence": 1},
+        ],
+    }
+    assert upsert_route(db, route) is True
+    assert upsert_route(db, route) is False
+    route["stations"].append({"stationId": "3", "stationName": "C", "sequence": 3})
+    assert upsert_route(db, route) is True
+    db.commit()
+
+    assert db.query(BusRoute).one().route_name == "9007"
+    assert [s.station_id for s in db.query(RouteStation).order_by(RouteStation.sequence)] == [
+        "1", "2", "3"
+    ]
+
+
+def test_upsert_route_rejects_blank_route_id(db):
+    """Test a route without an id is rejected instead of stored under ''."""
+    from app.database.models import BusRoute
+    from app.database.upsert import upsert_route
+
+    with pytest.raises(ValueError):
+        upsert_route(db, {"routeId": "", "stations": []})
+    assert db.query(BusRoute).count() == 0
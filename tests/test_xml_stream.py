@@ -0,0 +1,50 @@
+"""Tests for the streaming GBIS XML parser."""
+
+import pytest
+
+from app.services import xml_stream
+from app.services.real_api_client import RealBusAPIClient
+from tests.test_real_api_client import ROUTE_XML, STATION_INFO_XML, STATION_LIST_XML
+
+
+@pytest.fixture
+def clients():
+    """Tree and stream parsing clients."""
+    tree = RealBusAPIClient()
+    stream = RealBusAPIClient()
+    stream.parse_mode = "stream"
+    return tree, stream
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64, 1 << 16])
+def test_stream_matches_tree_output(clients, chunk_size):
+    """Test both parse modes produce identical dicts for any chunking."""
+    tree, _ = clients
+    assert list(xml_stream.parse_stop_list(
+        xml_stream.iter_chunks(STATION_LIST_XML, chunk_size)
+    )) == tree._parse_stop_response(STATION_LIST_XML)
+    assert xml_stream.parse_stop_info(
+        xml_stream.iter_chunks(STATION_INFO_XML, chunk_size)
+    ) == tree._parse_stop_info_response(STATION_INFO_XML)
+    assert xml_stream.parse_route(
+        xml_stream.iter_chunks(ROUTE_XML, chunk_size)
+    ) == tree._parse_route_response(ROUTE_XML)
+
+
+def test_client_stream_mode(clients):
+    """Test the client dispatches to the streaming parser."""
+    tree, stream = clients
+    assert stream._parse_route_response(ROUTE_XML) == tree._parse_route_response(ROUTE_XML)
+
+
+def test_stream_accepts_bytes():
+    """Test raw byte chunks from the network are accepted."""
+    body = STATION_LIST_XML.encode("utf-8")
+    stops = list(xml_stream.parse_stop_list(xml_stream.iter_chunks(body, 16)))
+    assert [stop["stationName"] for stop in stops] == ["판교역", "판교테크노밸리"]
+
+
+def test_stream_mode_malformed_returns_empty(clients):
+    """Test malformed payloads keep the tree-mode error contract."""
+    _, stream = clients
+    assert stream._parse_route_response("<response><broken>") == {}